@@ -19,7 +19,7 @@ Notes:
 
 
 # The name of this arciive was 'A*.py' but the '*' character is not allowed in file names on some systems.
-# So I renamed it to 'A-Star.py'.
+# So I renamed it to 'AStar.py' ('-' is not allowed in Python module names, so 'A-Star.py' could not be imported).
 import heapq
 
 # -------------------------------
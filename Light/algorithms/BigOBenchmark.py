@@ -0,0 +1,325 @@
+"""
+Empirical Big-O Benchmark Harness
+---------------------------------
+
+Problem:
+- BIG_O.py explains complexity in comments. Nothing checks that the
+  code actually scales the way its docstring says, or notices when a
+  change makes it slower.
+
+🔎 Idea:
+- Run every algorithm on generated inputs of growing size n and measure:
+  - wall time (best of several repeats, auto-looped for fast calls),
+  - peak memory and net allocated blocks during one call (tracemalloc).
+- Fit the growth exponent k in  time ≈ c * n^k  by least squares on
+  log(time) vs log(n). Sorting lands near 1.1 (n log n), binary search
+  near 0. A quadratic hot spot shows up as ~2 (see HashMap: a fixed
+  table of 10 buckets makes every put O(n)). The textbook column counts
+  arithmetic as O(1), except for the Fibonacci cases: F(n) has O(n)
+  digits, so n additions cost n^2 and fast doubling costs one Karatsuba
+  multiplication, n^log2(3) ~ n^1.58. At small n the interpreter
+  overhead still dominates, so the linear ones fit lower.
+- Exponential algorithms (N-Queens) fit  time ≈ c * b^n  instead and
+  report the base b.
+- Results are saved as JSON. When a baseline file from an earlier
+  version is given, cases whose time at the largest shared size grew by
+  more than `time_ratio`, or whose exponent grew by more than
+  `exponent_delta`, are flagged and the run exits with status 1.
+
+📊 Output columns:
+- fit: fitted exponent (or base), textbook: expected exponent,
+  seconds / peak KiB at the largest size.
+
+🎯 Usage:
+    python BigOBenchmark.py                         # print the table
+    python BigOBenchmark.py --quick --only sort     # small sizes, some cases
+    python BigOBenchmark.py --save new.json --baseline old.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+MIN_TIME = 0.02  # seconds a timing loop runs for at least
+
+
+# -------------------------------
+# Loading the algorithm modules
+# -------------------------------
+def _load(name):
+    """Import a sibling module, inside the package or when run as a script."""
+    return importlib.import_module(f"{__package__}.{name}" if __package__ else name)
+
+
+# -------------------------------
+# Input generators
+# -------------------------------
+def tree_graph(n):
+    """Binary tree as an undirected adjacency dict (shallow, safe for recursive DFS)."""
+    graph = {i: [] for i in range(n)}
+    for child in range(1, n):
+        parent = (child - 1) // 2
+        graph[parent].append(child)
+        graph[child].append(parent)
+    return graph
+
+
+def weighted_graph(n, rng, degree=4):
+    """Random connected weighted graph in dijkstra() format."""
+    graph = {i: [] for i in range(n)}
+    for v in range(1, n):
+        u = rng.randrange(v)  # random spanning tree keeps it connected
+        w = rng.randint(1, 100)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    for _ in range(n * (degree - 2) // 2):
+        u, v, w = rng.randrange(n), rng.randrange(n), rng.randint(1, 100)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    return graph
+
+
+def open_maze(n):
+    """Square grid with about n free cells, start and goal in opposite corners."""
+    side = max(2, math.isqrt(n))
+    return [[0] * side for _ in range(side)], (0, 0), (side - 1, side - 1)
+
+
+def hashmap_workload(module, keys):
+    table = module.HashMap()
+    for key in keys:
+        table.put(key, key)
+    for key in keys:
+        table.get(key)
+
+
+# -------------------------------
+# Cases
+# -------------------------------
+class Case:
+    """
+    :param name: case label
+    :param setup: (n, rng) -> input, built outside the timed region
+    :param run: input -> anything; the timed call
+    :param sizes: input sizes n
+    :param textbook: expected exponent (None for exponential cases)
+    :param growth: "power" (c * n^k) or "exponential" (c * b^n)
+    """
+
+    def __init__(self, name, setup, run, sizes, textbook=None, growth="power"):
+        self.name, self.setup, self.run = name, setup, run
+        self.sizes, self.textbook, self.growth = sizes, textbook, growth
+
+
+def make_cases():
+    big_o = _load("BIG_O")
+    sorting = _load("Sorting")
+    bfs, dfs = _load("BFS"), _load("DFS")
+    dijkstra, astar = _load("Djstrika"), _load("AStar")
+    backtracking = _load("BackTracking")
+    dp = _load("DynamicProgramming")
+    window = _load("SlidingWindow")
+    hashmap = _load("HashMap")
+
+    def fib_memo(n):
+        dp.fib_memo.cache_clear()
+        return dp.fib_memo(n)
+
+    sorted_list = lambda n, rng: list(range(n))
+    random_list = lambda n, rng: [rng.random() for _ in range(n)]
+    requests = lambda n, rng: [rng.randint(0, 10) for _ in range(n)]
+    text = lambda n, rng: "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(n))
+    graph_sizes = [1_000, 3_000, 10_000, 30_000, 100_000]
+
+    return [
+        Case("linear_search", sorted_list, lambda a: big_o.linear_search(a, -1),
+             [1_000, 10_000, 100_000, 1_000_000], textbook=1),
+        Case("binary_search", sorted_list, lambda a: big_o.binary_search(a, len(a) // 3),
+             [1_000, 10_000, 100_000, 1_000_000], textbook=0),
+        Case("quicksort", random_list, sorting.quicksort, [1_000, 3_000, 10_000, 30_000, 100_000], textbook=1),
+        Case("mergesort", random_list, sorting.mergesort, [1_000, 3_000, 10_000, 30_000, 100_000], textbook=1),
+        Case("bfs", lambda n, rng: tree_graph(n), lambda g: bfs.bfs(g, 0), graph_sizes, textbook=1),
+        Case("dfs", lambda n, rng: tree_graph(n), lambda g: dfs.dfs(g, 0), graph_sizes, textbook=1),
+        Case("dijkstra", weighted_graph, lambda g: dijkstra.dijkstra(g, 0), graph_sizes, textbook=1),
+        Case("astar", lambda n, rng: open_maze(n), lambda m: astar.astar(*m),
+             [64, 144, 256, 576, 1024], textbook=1),
+        Case("nqueens", lambda n, rng: n, backtracking.nqueens, [4, 5, 6, 7, 8], growth="exponential"),
+        Case("fib_memo", lambda n, rng: n, fib_memo, [100, 300, 1_000, 3_000, 10_000], textbook=2),
+        Case("fib_tab", lambda n, rng: n, dp.fib_tab, [1_000, 3_000, 10_000, 30_000], textbook=2),
+        Case("fib_optimized", lambda n, rng: n, dp.fib_optimized, [1_000, 3_000, 10_000, 30_000, 100_000], textbook=2),
+        Case("fib_fast", lambda n, rng: n, dp.fib_fast, [10_000, 100_000, 300_000, 1_000_000],
+             textbook=round(math.log2(3), 2)),
+        Case("max_sum_subarray", random_list, lambda a: window.max_sum_subarray(a, 100),
+             [1_000, 10_000, 100_000, 1_000_000], textbook=1),
+        Case("longest_unique_substring", text, window.longest_unique_substring,
+             [1_000, 10_000, 100_000, 1_000_000], textbook=1),
+        Case("max_requests_in_window", requests, lambda a: window.max_requests_in_window(a, 60),
+             [1_000, 10_000, 100_000, 1_000_000], textbook=1),
+        Case("HashMap put+get", lambda n, rng: [f"key-{i}" for i in range(n)],
+             lambda keys: hashmap_workload(hashmap, keys), [500, 1_000, 2_000, 4_000, 8_000], textbook=1),
+    ]
+
+
+# -------------------------------
+# Measuring
+# -------------------------------
+def time_call(fn, arg, repeat=3):
+    """Best time per call; fast calls are looped until MIN_TIME has passed."""
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn(arg)
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_TIME:
+                break
+            loops *= 2
+            sink.seek(0)
+            sink.truncate()
+        best = elapsed / loops
+        for _ in range(repeat - 1):
+            if best > 1.0:
+                break  # slow cases: one extra run is not worth it
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn(arg)
+            best = min(best, (time.perf_counter() - start) / loops)
+            sink.seek(0)
+            sink.truncate()
+    return best
+
+
+def memory_call(fn, arg):
+    """(peak bytes, net allocated blocks) of one call."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            base, _ = tracemalloc.get_traced_memory()
+            blocks = sys.getallocatedblocks()
+            fn(arg)
+            net_blocks = sys.getallocatedblocks() - blocks
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return peak - base, net_blocks
+
+
+def fit(sizes, seconds, growth="power"):
+    """Least-squares slope: exponent k (power) or base b (exponential)."""
+    xs = [math.log(n) if growth == "power" else n for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    if len(xs) < 2:
+        return None
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+             / sum((x - mx) ** 2 for x in xs))
+    return slope if growth == "power" else math.exp(slope)
+
+
+def run_case(case, sizes, repeat=3):
+    result = {"sizes": [], "seconds": [], "peak_bytes": [], "net_blocks": [],
+              "growth": case.growth, "textbook": case.textbook}
+    for n in sizes:
+        arg = case.setup(n, random.Random(n))
+        result["sizes"].append(n)
+        result["seconds"].append(time_call(case.run, arg, repeat))
+        peak, blocks = memory_call(case.run, arg)
+        result["peak_bytes"].append(peak)
+        result["net_blocks"].append(blocks)
+    result["fit"] = fit(result["sizes"], result["seconds"], case.growth)
+    return result
+
+
+def run_suite(only=None, quick=False, repeat=3, out=sys.stdout):
+    results = {}
+    print(f"{'case':<26}{'fit':>8}{'textbook':>10}{'largest n':>11}{'seconds':>11}{'peak KiB':>11}", file=out)
+    for case in make_cases():
+        if only and only not in case.name:
+            continue
+        sizes = case.sizes[:3] if quick else case.sizes
+        r = results[case.name] = run_case(case, sizes, repeat)
+        label = f"{r['fit']:.2f}" + ("^n" if case.growth == "exponential" else "")
+        textbook = "-" if case.textbook is None else case.textbook
+        print(f"{case.name:<26}{label:>8}{textbook:>10}{sizes[-1]:>11}"
+              f"{r['seconds'][-1]:>11.5f}{r['peak_bytes'][-1] / 1024:>11.1f}", file=out)
+    return results
+
+
+# -------------------------------
+# Saving and comparing
+# -------------------------------
+def save(results, path):
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def compare(results, baseline, time_ratio=1.5, exponent_delta=0.25):
+    """
+    Regressions of `results` against an earlier run.
+
+    :param baseline: results dict (the "results" entry of a saved file)
+    :return: list of human-readable regression messages (empty = all good)
+    """
+    regressions = []
+    for name, new in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        shared = sorted(set(new["sizes"]) & set(old["sizes"]))
+        if shared:
+            n = shared[-1]
+            t_new = new["seconds"][new["sizes"].index(n)]
+            t_old = old["seconds"][old["sizes"].index(n)]
+            if t_new > time_ratio * t_old:
+                regressions.append(f"{name}: {t_new / t_old:.1f}x slower at n={n}")
+        if new["fit"] is not None and old.get("fit") is not None:
+            if new["growth"] == "power" and new["fit"] - old["fit"] > exponent_delta:
+                regressions.append(f"{name}: exponent {old['fit']:.2f} -> {new['fit']:.2f}")
+            if new["growth"] == "exponential" and new["fit"] > old["fit"] * (1 + exponent_delta):
+                regressions.append(f"{name}: base {old['fit']:.2f} -> {new['fit']:.2f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit empirical Big-O curves for the algorithm modules.")
+    parser.add_argument("--only", help="run only cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="only the three smallest sizes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--time-ratio", type=float, default=1.5)
+    parser.add_argument("--exponent-delta", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.only, args.quick, args.repeat)
+    if args.save:
+        save(results, args.save)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.time_ratio, args.exponent_delta)
+        for message in regressions:
+            print("REGRESSION", message)
+        if regressions:
+            return 1
+        print("No regressions against", args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
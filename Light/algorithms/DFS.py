@@ -57,15 +57,16 @@ def dfs(graph, start, visited=None):
 
 # ================== EXAMPLE ==================
 
-graph = {
-    'A': ['B', 'C'],
-    'B': ['A', 'D', 'E'],
-    'C': ['A', 'F'],
-    'D': ['B'],
-    'E': ['B', 'F'],
-    'F': ['C', 'E']
-}
+if __name__ == "__main__":
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
 
-start_node = 'A'
-result = dfs(graph, start_node)
-print("DFS traversal starting from", start_node, ":", result)
+    start_node = 'A'
+    result = dfs(graph, start_node)
+    print("DFS traversal starting from", start_node, ":", result)
@@ -63,18 +63,19 @@ def dijkstra(graph, start):
 
 # ================== EXAMPLE USAGE ==================
 
-# Graph represented as adjacency list
-# Each key is a node, and the value is a list of (neighbor, weight)
-graph = {
-    'A': [('B', 1), ('C', 4)],
-    'B': [('A', 1), ('C', 2), ('D', 5)],
-    'C': [('A', 4), ('B', 2), ('D', 1)],
-    'D': [('B', 5), ('C', 1)]
-}
-
-start = 'A'
-result = dijkstra(graph, start)
-
-print("Shortest distances from node", start)
-for node, distance in result.items():
-    print(f"{start} -> {node} = {distance}")
+if __name__ == "__main__":
+    # Graph represented as adjacency list
+    # Each key is a node, and the value is a list of (neighbor, weight)
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+
+    start = 'A'
+    result = dijkstra(graph, start)
+
+    print("Shortest distances from node", start)
+    for node, distance in result.items():
+        print(f"{start} -> {node} = {distance}")
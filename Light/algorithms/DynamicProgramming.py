@@ -13,8 +13,13 @@ Problem: Fibonacci Sequence
 1. Memoization (Top-Down) -> recursion with cache.
 2. Tabulation (Bottom-Up) -> iterative table filling.
 
+Beyond DP, Fibonacci has an O(log n) closed recurrence (fast doubling):
+    F(2k)   = F(k) * (2*F(k+1) - F(k))
+    F(2k+1) = F(k)^2 + F(k+1)^2
+It is the matrix power [[1,1],[1,0]]^n with the redundant entries dropped.
+
 📊 Complexity:
-- Time: O(n)
+- Time: O(n) (fast doubling: O(log n) multiplications)
 - Space: O(n) for table or recursion stack (can be optimized to O(1)).
 
 🎯 Use Cases of DP:
@@ -25,16 +30,26 @@ Problem: Fibonacci Sequence
 - Shortest paths (e.g., Floyd-Warshall)
 """
 
+import time
+
+try:
+    from .Memoize import memoize
+except ImportError:  # run as a script
+    from Memoize import memoize
+
 # ------------------------
 # 1. Top-Down (Memoization)
 # ------------------------
-def fib_memo(n, memo={}):
-    if n in memo:
-        return memo[n]
+# The cache is bounded and owned by the decorator (no shared mutable
+# default argument), and the generator form runs without recursion:
+# each `yield` asks for a subproblem, see Memoize.py.
+@memoize(maxsize=1024)
+def fib_memo(n):
     if n <= 1:
         return n
-    memo[n] = fib_memo(n - 1, memo) + fib_memo(n - 2, memo)
-    return memo[n]
+    a = yield n - 1
+    b = yield n - 2
+    return a + b
 
 # ------------------------
 # 2. Bottom-Up (Tabulation)
@@ -62,12 +77,125 @@ def fib_optimized(n):
     return curr
 
 
+# ------------------------
+# 4. Fast Doubling (O(log n))
+# ------------------------
+def fib_pair(n, mod=None):
+    """
+    Return (F(n), F(n+1)) walking the bits of n from the top.
+
+    :param n: index (n >= 0)
+    :param mod: optional modulus, keeps numbers small for huge n
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d  # F(2k+1), F(2k+2)
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast(n):
+    """Exact F(n) in O(log n) big-int multiplications."""
+    return fib_pair(n)[0]
+
+
+def fib_mod(n, mod):
+    """F(n) mod m, fine for n up to 10^18 and beyond."""
+    return fib_pair(n, mod)[0]
+
+
+def fib_many(ns, mod=None):
+    """
+    Answer many Fibonacci queries at once.
+
+    Queries are visited in sorted order and each one jumps from the
+    previous answer with the addition formulas
+        F(p+d)   = F(p+1)*F(d) + F(p)*F(d-1)
+        F(p+d+1) = F(p+1)*F(d+1) + F(p)*F(d)
+    so the doubling work only depends on the gap d, not on n.
+
+    :param ns: iterable of indices (n >= 0), any order, duplicates allowed
+    :param mod: optional modulus
+    :return: list of answers in the same order as ns
+    """
+    ns = list(ns)
+    answers = {}
+    p, fp, fp1 = 0, 0, 1  # current position and (F(p), F(p+1))
+    for n in sorted(set(ns)):
+        fd, fd1 = fib_pair(n - p, mod)
+        fd_1 = fd1 - fd  # F(d-1)
+        fp, fp1 = fp1 * fd + fp * fd_1, fp1 * fd1 + fp * fd
+        if mod is not None:
+            fp %= mod
+            fp1 %= mod
+        p = n
+        answers[n] = fp
+    return [answers[n] for n in ns]
+
+
+# ================== BENCHMARK ==================
+
+def bench(fn, *args):
+    start = time.perf_counter()
+    try:
+        fn(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def run_benchmark():
+    print("\nExact F(n), milliseconds")
+    fns = {
+        "fib_memo": fib_memo,
+        "fib_tab": fib_tab,
+        "fib_optimized": fib_optimized,
+        "fib_fast": fib_fast,
+    }
+    print(f"{'n':>8}" + "".join(f"{name:>15}" for name in fns))
+    for n in (500, 5_000, 50_000):
+        row = f"{n:>8}"
+        fib_memo.cache_clear()  # fair comparison: start from an empty cache
+        for fn in fns.values():
+            t = bench(fn, n)
+            row += f"{'recursion':>15}" if t is None else f"{t * 1000:>15.2f}"
+        print(row)
+
+    n = 1_000_000
+    t = bench(fib_fast, n)
+    print(f"fib_fast({n}) has {fib_fast(n).bit_length()} bits: {t * 1000:.1f} ms")
+
+    mod = 1_000_000_007
+    queries = [10 ** 18 - i * 1000 for i in range(2000)]
+    t_single = bench(lambda: [fib_mod(q, mod) for q in queries])
+    t_batch = bench(fib_many, queries, mod)
+    print(f"{len(queries)} queries near 10^18 mod {mod}: "
+          f"fib_mod {t_single * 1000:.1f} ms, fib_many {t_batch * 1000:.1f} ms")
+
+
 # ================== EXAMPLE ==================
 
-n = 10
-print(f"Fibonacci({n}) with Memoization: {fib_memo(n)}")
-print(f"Fibonacci({n}) with Tabulation: {fib_tab(n)}")
-print(f"Fibonacci({n}) with Space Optimization: {fib_optimized(n)}")
+if __name__ == "__main__":
+    n = 10
+    print(f"Fibonacci({n}) with Memoization: {fib_memo(n)}")
+    print(f"Fibonacci({n}) with Tabulation: {fib_tab(n)}")
+    print(f"Fibonacci({n}) with Space Optimization: {fib_optimized(n)}")
+    print(f"Fibonacci({n}) with Fast Doubling: {fib_fast(n)}")
+    print(f"Fibonacci(10^18) mod 1_000_000_007: {fib_mod(10 ** 18, 1_000_000_007)}")
+    print(f"Fibonacci of [10, 3, 20, 10]: {fib_many([10, 3, 20, 10])}")
+
+    run_benchmark()
 
 """
 another example: Hash Map Implementation in Python
@@ -90,7 +218,7 @@ Recurrence:
 
 Complexity:
 - Time: O(n * W), where n = number of items, W = capacity
-- Space: O(n * W) (can be optimized to O(W))
+- Space: O(n * W) (can be optimized to O(W), see Knapsack.py)
 
 Use Cases:
 - Resource allocation
@@ -0,0 +1,252 @@
+"""
+External Merge Sort
+-------------------
+
+Problem: sort a file that is bigger than the available memory.
+
+🔎 Idea:
+- quicksort() and mergesort() need the whole list in memory.
+- External sort only keeps one chunk in memory at a time:
+  1. Read the input in chunks that fit a memory budget.
+  2. Sort each chunk in memory and spill it to a temporary file (a "run").
+  3. Merge all runs with a min-heap (k-way merge), streaming the output.
+
+⚡ K-way merge:
+- merge(left, right) in the sorting module compares the heads of 2 lists.
+- With k runs, a heap holds the head of every run, so picking the
+  smallest head costs O(log k) instead of O(k).
+- If there are more runs than open files we want (fan_in), runs are merged
+  in groups of fan_in into bigger runs first (multi-pass merge).
+
+📊 Complexity:
+- Time: O(n log n) comparisons, O(n * passes) disk I/O,
+  passes = ceil(log_fan_in(number of runs)).
+- Memory: O(chunk_bytes + fan_in * buffer size).
+
+🎯 Use Cases:
+- Sorting multi-gigabyte logs, database index builds, MapReduce shuffles.
+"""
+
+import heapq
+import os
+import random
+import tempfile
+import time
+
+try:
+    import resource  # Unix only, used for peak RSS in the benchmark
+except ImportError:
+    resource = None
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024  # memory budget for one in-memory run
+DEFAULT_FAN_IN = 64                     # max runs merged (files open) at once
+IO_BUFFER = 1024 * 1024
+
+
+# -------------------------
+# K-way merge (generalizes merge(left, right))
+# -------------------------
+def kway_merge(runs, key=None):
+    """
+    Lazily merge already sorted iterables into one sorted stream.
+
+    Stable: for equal keys, items from earlier runs come first.
+
+    :param runs: list of sorted iterables
+    :param key: optional key function (same as sorted(key=))
+    :return: generator of items in sorted order
+    """
+    heap = []
+    for index, run in enumerate(runs):
+        it = iter(run)
+        for item in it:
+            k = item if key is None else key(item)
+            # run index breaks ties, so items are never compared directly
+            heap.append((k, index, item, it))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        k, index, item, it = heap[0]
+        yield item
+        for item in it:
+            k = item if key is None else key(item)
+            heapq.heapreplace(heap, (k, index, item, it))
+            break
+        else:
+            heapq.heappop(heap)  # this run is exhausted
+
+
+# -------------------------
+# External sort
+# -------------------------
+def external_sort(lines, key=None, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                  fan_in=DEFAULT_FAN_IN, tmp_dir=None):
+    """
+    Sort a stream of byte lines using bounded memory.
+
+    Every yielded line ends with b"\\n" (one is added to a last line
+    that has none).
+
+    :param lines: iterable of bytes lines (e.g. a file opened in 'rb')
+    :param key: optional key function applied to each line
+    :param chunk_bytes: approximate bytes of input held in memory per run
+    :param fan_in: maximum number of runs merged at once (>= 2)
+    :param tmp_dir: directory for run files (default: system temp dir)
+    :return: generator of sorted lines
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    run_paths = []
+    merged = []  # runs written by the current merge pass
+    try:
+        chunk = []
+        size = 0
+        for line in lines:
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            chunk.append(line)
+            size += len(line)
+            if size >= chunk_bytes:
+                run_paths.append(_spill(chunk, key, tmp_dir))
+                chunk = []
+                size = 0
+
+        if not run_paths:
+            # Everything fitted in memory: no temporary files needed
+            chunk.sort(key=key)
+            yield from chunk
+            return
+
+        if chunk:
+            run_paths.append(_spill(chunk, key, tmp_dir))
+        del chunk
+
+        # Multi-pass merge until at most fan_in runs are left
+        while len(run_paths) > fan_in:
+            merged = []
+            for i in range(0, len(run_paths), fan_in):
+                group = run_paths[i:i + fan_in]
+                merged.append(_merge_to_file(group, key, tmp_dir))
+                for path in group:
+                    os.remove(path)
+                # forget removed paths right away, so cleanup stays correct
+                run_paths[i:i + len(group)] = [None] * len(group)
+            run_paths, merged = merged, []
+
+        files = [open(path, "rb", buffering=IO_BUFFER) for path in run_paths]
+        try:
+            yield from kway_merge(files, key)
+        finally:
+            for f in files:
+                f.close()
+    finally:
+        for path in run_paths + merged:
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+
+def _spill(chunk, key, tmp_dir):
+    """Sort one chunk in memory and write it to a temporary run file."""
+    chunk.sort(key=key)
+    fd, path = tempfile.mkstemp(prefix="run-", suffix=".txt", dir=tmp_dir)
+    with os.fdopen(fd, "wb", buffering=IO_BUFFER) as f:
+        f.writelines(chunk)
+    return path
+
+
+def _merge_to_file(paths, key, tmp_dir):
+    fd, out_path = tempfile.mkstemp(prefix="run-", suffix=".txt", dir=tmp_dir)
+    files = []
+    try:
+        with os.fdopen(fd, "wb", buffering=IO_BUFFER) as out:
+            for path in paths:
+                files.append(open(path, "rb", buffering=IO_BUFFER))
+            out.writelines(kway_merge(files, key))
+    except BaseException:
+        os.remove(out_path)  # a half-written run is of no use
+        raise
+    finally:
+        for f in files:
+            f.close()
+    return out_path
+
+
+def sort_file(in_path, out_path, key=None, chunk_bytes=DEFAULT_CHUNK_BYTES,
+              fan_in=DEFAULT_FAN_IN, tmp_dir=None):
+    """
+    Sort the lines of in_path into out_path.
+
+    :return: number of lines written
+    """
+    count = 0
+    with open(in_path, "rb", buffering=IO_BUFFER) as src, \
+            open(out_path, "wb", buffering=IO_BUFFER) as dst:
+        for line in external_sort(src, key, chunk_bytes, fan_in, tmp_dir):
+            dst.write(line)
+            count += 1
+    return count
+
+
+# ================== EXAMPLE ==================
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / 1024 if os.uname().sysname != "Darwin" else peak / 2 ** 20
+
+
+def make_log_file(path, size_mb, seed=42):
+    """Write fake log lines: '<timestamp> <client> <status>'."""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, "wb", buffering=IO_BUFFER) as f:
+        while written < target:
+            line = b"%010d client-%05d %d\n" % (
+                rng.randrange(10 ** 10), rng.randrange(100000),
+                rng.choice((200, 200, 200, 404, 500)))
+            f.write(line)
+            written += len(line)
+    return written
+
+
+def run_benchmark(size_mb=32, chunk_mb=4, fan_in=4):
+    with tempfile.TemporaryDirectory() as tmp:
+        in_path = os.path.join(tmp, "input.log")
+        out_path = os.path.join(tmp, "sorted.log")
+        size = make_log_file(in_path, size_mb)
+
+        start = time.perf_counter()
+        count = sort_file(in_path, out_path, chunk_bytes=chunk_mb * 2 ** 20,
+                          fan_in=fan_in, tmp_dir=tmp)
+        elapsed = time.perf_counter() - start
+
+        with open(out_path, "rb") as f:
+            previous = b""
+            for line in f:
+                assert previous <= line, "output is not sorted"
+                previous = line
+
+    print(f"Sorted {count} lines ({size / 2 ** 20:.1f} MB) "
+          f"with {chunk_mb} MB chunks and fan-in {fan_in}")
+    print(f"Throughput: {size / 2 ** 20 / elapsed:.1f} MB/s ({elapsed:.2f} s)")
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"Peak RSS: {rss:.1f} MB")
+
+
+if __name__ == "__main__":
+    runs = [[1, 4, 9], [2, 3, 10], [0, 5]]
+    print("K-way merge of", runs, "->", list(kway_merge(runs)))
+
+    lines = [b"pear\n", b"apple\n", b"fig\n", b"banana\n", b"cherry"]
+    # a tiny chunk size forces spilling and a multi-pass merge
+    result = list(external_sort(lines, chunk_bytes=8, fan_in=2))
+    print("External sort:", result)
+
+    run_benchmark()
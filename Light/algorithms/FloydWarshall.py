@@ -0,0 +1,248 @@
+"""
+Floyd-Warshall: All-Pairs Shortest Paths
+----------------------------------------
+
+Problem:
+- Shortest distance between *every* pair of nodes of a weighted graph.
+
+🔎 Idea (Dynamic Programming):
+- dist[i][j] = best known distance from i to j.
+- Step k allows node k as an intermediate stop:
+      dist[i][j] = min(dist[i][j], dist[i][k] + dist[k][j])
+- After steps 0..n-1 every shortest path has been considered.
+
+⚡ Making it fast:
+1. Vectorized: with NumPy, a whole step k is a single operation, the
+   outer sum of column k and row k compared against the full matrix:
+       dist = minimum(dist, dist[:, k, None] + dist[None, k, :])
+2. Blocked: for big n a full n x n matrix does not fit in cache.
+   The k steps are grouped in blocks of `block` pivots; the pivot rows
+   are finished first, then every other band of `block` rows runs all
+   pivots of the block while the band is still in cache.
+3. Paths: next_hop[i][j] = first node after i on the best i -> j path,
+   updated together with dist, so any path is rebuilt in O(path length).
+
+📊 Complexity:
+- Time: O(V^3) (vs. V runs of Dijkstra: O(V * E log V))
+- Space: O(V^2)
+
+🎯 Use Cases:
+- Dense distance matrices, routing tables, transitive closure,
+  graph diameter / centrality.
+
+Graph format: the same adjacency dict dijkstra() takes,
+    {node: [(neighbor, weight), ...], ...}
+"""
+
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pure Python rows as a fallback
+    np = None
+
+try:
+    from .Djstrika import dijkstra
+except ImportError:  # run as a script
+    from Djstrika import dijkstra
+
+INF = float("inf")
+DEFAULT_BLOCK = 256  # pivots per block; graphs up to this size run unblocked
+
+
+# -------------------------------
+# Graph -> matrix
+# -------------------------------
+def to_matrix(graph, with_next=False):
+    """
+    Dense distance matrix of an adjacency-list graph.
+
+    :return: (nodes, dist, next_hop); node i of the matrix is nodes[i],
+             next_hop is None unless with_next is True
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for edges in graph.values():
+        for neighbor, _ in edges:
+            if neighbor not in index:
+                index[neighbor] = len(nodes)
+                nodes.append(neighbor)
+
+    n = len(nodes)
+    if np is not None:
+        dist = np.full((n, n), np.inf)
+        np.fill_diagonal(dist, 0.0)
+        next_hop = np.full((n, n), -1, dtype=np.int64) if with_next else None
+    else:
+        dist = [[INF] * n for _ in range(n)]
+        for i in range(n):
+            dist[i][i] = 0
+        next_hop = [[-1] * n for _ in range(n)] if with_next else None
+
+    if next_hop is not None:
+        for i in range(n):
+            next_hop[i][i] = i
+
+    for node, edges in graph.items():
+        i = index[node]
+        for neighbor, weight in edges:
+            j = index[neighbor]
+            if weight < dist[i][j]:  # keep the cheapest parallel edge
+                dist[i][j] = weight
+                if next_hop is not None:
+                    next_hop[i][j] = j
+    return nodes, dist, next_hop
+
+
+# -------------------------------
+# Floyd-Warshall
+# -------------------------------
+def floyd_warshall(graph, paths=False, block=DEFAULT_BLOCK):
+    """
+    All-pairs shortest distances.
+
+    :param graph: dict node -> list of (neighbor, weight)
+    :param paths: also compute the next-hop matrix (see path())
+    :param block: pivots per cache block (NumPy only)
+    :return: (nodes, dist, next_hop); dist[i][j] is the distance from
+             nodes[i] to nodes[j], next_hop is None unless paths=True
+    :raises ValueError: if the graph has a negative cycle
+    """
+    nodes, dist, next_hop = to_matrix(graph, with_next=paths)
+    n = len(nodes)
+    if np is not None:
+        if n <= block:
+            _relax_rows(dist, next_hop, 0, n, range(n))
+        else:
+            _blocked(dist, next_hop, n, block)
+        negative = bool((np.diag(dist) < 0).any())
+    else:
+        _python_fw(dist, next_hop, n)
+        negative = any(dist[i][i] < 0 for i in range(n))
+
+    if negative:
+        raise ValueError("graph contains a negative cycle")
+    return nodes, dist, next_hop
+
+
+def _relax_rows(dist, next_hop, lo, hi, pivots):
+    """Run the given pivots over rows lo:hi (views, updated in place)."""
+    rows = dist[lo:hi]
+    hops = next_hop[lo:hi] if next_hop is not None else None
+    for k in pivots:
+        candidate = rows[:, k, None] + dist[None, k, :]
+        if hops is not None:
+            better = candidate < rows
+            hops[better] = np.broadcast_to(hops[:, k, None], candidate.shape)[better]
+        np.minimum(rows, candidate, out=rows)
+
+
+def _blocked(dist, next_hop, n, block):
+    for k0 in range(0, n, block):
+        k1 = min(n, k0 + block)
+        pivots = range(k0, k1)
+        # Pivot rows first: the other bands read their final values
+        _relax_rows(dist, next_hop, k0, k1, pivots)
+        for i0 in range(0, n, block):
+            if i0 != k0:
+                _relax_rows(dist, next_hop, i0, min(n, i0 + block), pivots)
+
+
+def _python_fw(dist, next_hop, n):
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            d_ik = dist[i][k]
+            if d_ik == INF or i == k:
+                continue
+            row_i = dist[i]
+            if next_hop is None:
+                # whole row at once: min(dist[i][j], dist[i][k] + dist[k][j])
+                dist[i] = [s if (s := d_ik + b) < a else a for a, b in zip(row_i, row_k)]
+            else:
+                hop = next_hop[i][k]
+                hops = next_hop[i]
+                for j in range(n):
+                    s = d_ik + row_k[j]
+                    if s < row_i[j]:
+                        row_i[j] = s
+                        hops[j] = hop
+
+
+def path(nodes, next_hop, source, target):
+    """
+    Rebuild the shortest path from source to target.
+
+    :return: list of nodes, or None if target is unreachable
+    :raises ValueError: if next_hop loops (e.g. a negative cycle on the way)
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    i, j = index[source], index[target]
+    if next_hop[i][j] == -1:
+        return None
+    result = [source]
+    for _ in range(len(nodes)):
+        if i == j:
+            return result
+        i = int(next_hop[i][j])
+        result.append(nodes[i])
+    # A simple path has fewer than len(nodes) hops
+    raise ValueError(f"next_hop loops between {source!r} and {target!r} (negative cycle?)")
+
+
+def distances_dict(nodes, dist):
+    """Matrix -> {source: {target: distance}} like dijkstra() returns."""
+    return {u: {v: float(dist[i][j]) for j, v in enumerate(nodes)}
+            for i, u in enumerate(nodes)}
+
+
+# ================== EXAMPLE ==================
+
+def random_graph(n, degree, seed=42):
+    rng = random.Random(seed)
+    return {u: [(rng.randrange(n), rng.randint(1, 100)) for _ in range(degree)]
+            for u in range(n)}
+
+
+def run_benchmark(sizes=(100, 200, 400)):
+    print("\nAll pairs, seconds")
+    print(f"{'nodes':>7}{'floyd':>10}{'+paths':>10}{'dijkstra x V':>14}")
+    for n in sizes:
+        graph = random_graph(n, degree=8)
+
+        start = time.perf_counter()
+        nodes, dist, _ = floyd_warshall(graph)
+        t_fw = time.perf_counter() - start
+
+        start = time.perf_counter()
+        floyd_warshall(graph, paths=True)
+        t_paths = time.perf_counter() - start
+
+        start = time.perf_counter()
+        by_dijkstra = {u: dijkstra(graph, u) for u in graph}
+        t_dij = time.perf_counter() - start
+
+        position = {node: i for i, node in enumerate(nodes)}
+        for u in range(0, n, max(1, n // 10)):
+            for v, d in by_dijkstra[u].items():
+                assert dist[position[u]][position[v]] == d
+        print(f"{n:>7}{t_fw:>10.3f}{t_paths:>10.3f}{t_dij:>14.3f}")
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+
+    nodes, dist, next_hop = floyd_warshall(graph, paths=True)
+    print("Distance matrix:")
+    print("     " + "".join(f"{v:>5}" for v in nodes))
+    for i, u in enumerate(nodes):
+        print(f"{u:>5}" + "".join(f"{dist[i][j]:>5g}" for j in range(len(nodes))))
+    print("Path A -> D:", path(nodes, next_hop, 'A', 'D'))
+
+    run_benchmark()
@@ -37,16 +37,17 @@ def hot(temp):
     else:
         return 1
 
-# Crisp input
-temperature = 25
-
-# Fuzzification
-fuzzy_cold = cold(temperature)
-fuzzy_warm = warm(temperature)
-fuzzy_hot = hot(temperature)
-
-print(f"Crisp Input: {temperature}°C")
-print(f"Fuzzy Memberships:")
-print(f"  Cold: {fuzzy_cold:.2f}")
-print(f"  Warm: {fuzzy_warm:.2f}")
-print(f"  Hot: {fuzzy_hot:.2f}")
+if __name__ == "__main__":
+    # Crisp input
+    temperature = 25
+
+    # Fuzzification
+    fuzzy_cold = cold(temperature)
+    fuzzy_warm = warm(temperature)
+    fuzzy_hot = hot(temperature)
+
+    print(f"Crisp Input: {temperature}°C")
+    print(f"Fuzzy Memberships:")
+    print(f"  Cold: {fuzzy_cold:.2f}")
+    print(f"  Warm: {fuzzy_warm:.2f}")
+    print(f"  Hot: {fuzzy_hot:.2f}")
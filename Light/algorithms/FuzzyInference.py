@@ -0,0 +1,367 @@
+"""
+Vectorized Fuzzy Inference (NumPy)
+----------------------------------
+
+Problem:
+- Fuzzy.py fuzzifies one temperature with hand-written if/elif functions.
+  A sensor pipeline has millions of readings per batch and needs the whole
+  chain: fuzzify -> apply rules -> defuzzify to one crisp output.
+
+🔎 Building blocks:
+1. Declarative membership sets, evaluated on whole arrays:
+   - Triangle(a, b, c):      0 at a, 1 at b, 0 at c
+   - Trapezoid(a, b, c, d):  0 at a, 1 from b to c, 0 at d
+     (a = b = -inf or c = d = inf give open "shoulders", like Fuzzy.py's
+      cold and hot)
+   - Gaussian(mean, sigma)
+2. Rules: ({"temperature": "cold", "humidity": "high"}, "high")
+   The firing strength of a rule is the minimum (AND) of its input
+   memberships, optionally times a weight.
+3. Two engines:
+   - Mamdani: every rule clips its output set at its firing strength, the
+     clipped sets are merged with max, and the merged shape (sampled on
+     `resolution` points of the output universe) is defuzzified by
+     centroid (center of gravity) or bisector (splits the area in half).
+   - Sugeno: every rule outputs a number (or a function of the inputs);
+     the result is the average weighted by firing strength. No output
+     sets, no sampling, much cheaper.
+4. Lookup table: for inputs with fixed ranges, evaluate the system once
+   on a grid and answer every later reading by interpolating between the
+   neighbouring grid points: O(1) per reading, whatever the rule count.
+
+📊 Complexity (N readings, R rules, Y output samples, T output terms):
+- Mamdani: O(N * (R + T * Y)), Sugeno: O(N * R)
+- Lookup table: O(N * 2^d) for d inputs after an O(grid size) build
+
+🎯 Use Cases:
+- HVAC and appliance control, sensor fusion, risk scoring.
+"""
+
+import time
+
+import numpy as np
+
+INF = float("inf")
+
+
+# -------------------------------
+# Membership sets
+# -------------------------------
+def _rise(x, a, b):
+    if a == -INF:
+        return np.ones_like(x)
+    if a == b:
+        return (x >= a).astype(float)
+    return np.clip((x - a) / (b - a), 0.0, 1.0)
+
+
+def _fall(x, c, d):
+    if d == INF:
+        return np.ones_like(x)
+    if c == d:
+        return (x <= d).astype(float)
+    return np.clip((d - x) / (d - c), 0.0, 1.0)
+
+
+class Trapezoid:
+    """0 at a, rising to 1 at b, 1 until c, falling to 0 at d."""
+
+    def __init__(self, a, b, c, d):
+        if not a <= b <= c <= d:
+            raise ValueError("trapezoid needs a <= b <= c <= d")
+        self.a, self.b, self.c, self.d = a, b, c, d
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        return np.minimum(_rise(x, self.a, self.b), _fall(x, self.c, self.d))
+
+    def breakpoints(self):
+        """x values where the membership changes slope."""
+        return [p for p in (self.a, self.b, self.c, self.d) if abs(p) != INF]
+
+
+class Triangle(Trapezoid):
+    """0 at a, 1 at b, 0 at c."""
+
+    def __init__(self, a, b, c):
+        super().__init__(a, b, b, c)
+
+
+class Gaussian:
+    """exp(-(x - mean)^2 / (2 sigma^2))"""
+
+    def __init__(self, mean, sigma):
+        if sigma <= 0:
+            raise ValueError("sigma must be positive")
+        self.mean, self.sigma = mean, sigma
+
+    def __call__(self, x):
+        z = (np.asarray(x, dtype=float) - self.mean) / self.sigma
+        return np.exp(-0.5 * z * z)
+
+    def breakpoints(self):
+        return [self.mean - 3 * self.sigma, self.mean, self.mean + 3 * self.sigma]
+
+
+class FuzzyVariable:
+    """
+    Named fuzzy sets over one quantity.
+
+    :param sets: dict term -> membership set, e.g. {"cold": Trapezoid(...)}
+    :param universe: (low, high) range of the variable; required for outputs
+                     of a Mamdani system and for lookup tables
+    """
+
+    def __init__(self, sets, universe=None):
+        self.sets = dict(sets)
+        self.universe = universe
+
+    def fuzzify(self, x):
+        """dict term -> membership array, like Fuzzy.py for a whole array."""
+        return {term: fn(x) for term, fn in self.sets.items()}
+
+
+# -------------------------------
+# Rule engines
+# -------------------------------
+class _RuleBase:
+    def __init__(self, inputs, rules):
+        """
+        :param inputs: dict name -> FuzzyVariable
+        :param rules: list of (antecedent, consequent) or
+                      (antecedent, consequent, weight); antecedent is a dict
+                      input name -> term, combined with AND (minimum)
+        """
+        self.inputs = inputs
+        self.rules = [rule if len(rule) == 3 else (rule[0], rule[1], 1.0) for rule in rules]
+        for antecedent, _, _ in self.rules:
+            for name, term in antecedent.items():
+                if term not in inputs[name].sets:
+                    raise ValueError(f"unknown term {term!r} for input {name!r}")
+
+    def _prepare(self, values):
+        arrays = {name: np.asarray(values[name], dtype=float) for name in self.inputs}
+        shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+        return {name: np.broadcast_to(a, shape).ravel() for name, a in arrays.items()}, shape
+
+    def firing(self, values):
+        """Firing strength of every rule: array of shape (readings, rules)."""
+        memo = {}
+        strengths = []
+        for antecedent, _, weight in self.rules:
+            w = None
+            for name, term in antecedent.items():
+                if (name, term) not in memo:
+                    memo[name, term] = self.inputs[name].sets[term](values[name])
+                mu = memo[name, term]
+                w = mu if w is None else np.minimum(w, mu)
+            strengths.append(w * weight if weight != 1.0 else w)
+        return np.stack(strengths, axis=1)
+
+    def __call__(self, **values):
+        return self.evaluate(values)
+
+
+class Mamdani(_RuleBase):
+    def __init__(self, inputs, output, rules, method="centroid", resolution=201, block=65536):
+        """
+        :param output: FuzzyVariable with a universe
+        :param method: "centroid" or "bisector"
+        :param resolution: samples of the output universe
+        :param block: readings per vectorized step (memory: block * resolution)
+        """
+        super().__init__(inputs, rules)
+        if method not in ("centroid", "bisector"):
+            raise ValueError("method must be 'centroid' or 'bisector'")
+        self.method = method
+        self.block = block
+        self.y = np.linspace(*output.universe, resolution)
+        self.terms = list(output.sets)
+        self.output_mu = np.stack([output.sets[t](self.y) for t in self.terms])
+        # Rules grouped by output term: one max per term, then one clip per term
+        self.rule_term = np.array([self.terms.index(c) for _, c, _ in self.rules])
+
+    def evaluate(self, values):
+        """
+        :param values: dict input name -> array (broadcastable shapes)
+        :return: crisp outputs with the broadcast shape; NaN where no rule fires
+        """
+        values, shape = self._prepare(values)
+        n = int(np.prod(shape))
+        out = np.empty(n)
+        for lo in range(0, n, self.block):
+            chunk = {name: v[lo:lo + self.block] for name, v in values.items()}
+            out[lo:lo + self.block] = self._defuzzify(self.firing(chunk))
+        return out.reshape(shape)
+
+    def _defuzzify(self, strengths):
+        aggregated = np.zeros((strengths.shape[0], len(self.y)))
+        for t in range(len(self.terms)):
+            rules = self.rule_term == t
+            if rules.any():
+                level = strengths[:, rules].max(axis=1)
+                np.maximum(aggregated, np.minimum(level[:, None], self.output_mu[t][None, :]), out=aggregated)
+
+        area = aggregated.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.method == "centroid":
+                result = aggregated @ self.y / area
+            else:
+                cumulative = np.cumsum(aggregated, axis=1)
+                index = np.argmax(cumulative >= area[:, None] / 2, axis=1)
+                result = self.y[index]
+        return np.where(area > 0, result, np.nan)
+
+
+class Sugeno(_RuleBase):
+    def __init__(self, inputs, rules):
+        """
+        Rule consequents are numbers, or functions of the input arrays
+        (dict name -> array) returning an array (first-order Sugeno).
+        """
+        super().__init__(inputs, rules)
+
+    def evaluate(self, values):
+        values, shape = self._prepare(values)
+        strengths = self.firing(values)
+        outputs = np.stack([np.broadcast_to(c(values) if callable(c) else float(c), strengths.shape[:1])
+                            for _, c, _ in self.rules], axis=1)
+        total = strengths.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = (strengths * outputs).sum(axis=1) / total
+        return np.where(total > 0, result, np.nan).reshape(shape)
+
+
+# -------------------------------
+# Precomputed lookup table
+# -------------------------------
+class LookupTable:
+    """
+    A fuzzy system sampled on a regular grid, evaluated by (multi)linear
+    interpolation. Readings outside the ranges are clamped to the edges.
+    """
+
+    def __init__(self, system, ranges=None, points=256):
+        """
+        :param system: Mamdani or Sugeno system
+        :param ranges: dict input name -> (low, high); defaults to the
+                       universes of the input variables
+        :param points: grid points per input (int, or dict name -> int)
+        """
+        self.names = list(system.inputs)
+        ranges = ranges or {name: system.inputs[name].universe for name in self.names}
+        self.low = np.array([ranges[name][0] for name in self.names], dtype=float)
+        high = np.array([ranges[name][1] for name in self.names], dtype=float)
+        self.points = np.array([points[name] if isinstance(points, dict) else points
+                                for name in self.names])
+        self.step = (high - self.low) / (self.points - 1)
+
+        axes = [np.linspace(lo, hi, p) for lo, hi, p in zip(self.low, high, self.points)]
+        grid = np.meshgrid(*axes, indexing="ij")
+        self.table = system.evaluate(dict(zip(self.names, grid)))
+
+    def __call__(self, **values):
+        return self.evaluate(values)
+
+    def evaluate(self, values):
+        arrays = np.broadcast_arrays(*(np.asarray(values[name], dtype=float) for name in self.names))
+        shape = arrays[0].shape
+        # Position on the grid, split into cell index and fraction inside the cell
+        cells, fractions = [], []
+        for d, x in enumerate(arrays):
+            t = np.clip((x.ravel() - self.low[d]) / self.step[d], 0, self.points[d] - 1)
+            i = np.minimum(t.astype(np.int64), self.points[d] - 2)
+            cells.append(i)
+            fractions.append(t - i)
+        # Sum over the 2^d corners of the cell
+        result = 0.0
+        for corner in range(1 << len(self.names)):
+            weight = 1.0
+            index = []
+            for d in range(len(self.names)):
+                if corner >> d & 1:
+                    weight = weight * fractions[d]
+                    index.append(cells[d] + 1)
+                else:
+                    weight = weight * (1 - fractions[d])
+                    index.append(cells[d])
+            result = result + weight * self.table[tuple(index)]
+        return np.asarray(result).reshape(shape)
+
+
+# ================== EXAMPLE ==================
+
+# Fuzzy.py's cold / warm / hot, as declarative sets
+TEMPERATURE = FuzzyVariable({
+    "cold": Trapezoid(-INF, -INF, 0, 20),
+    "warm": Triangle(10, 30, 40),
+    "hot": Trapezoid(30, 40, INF, INF),
+}, universe=(-10, 50))
+
+HUMIDITY = FuzzyVariable({
+    "dry": Trapezoid(-INF, -INF, 20, 50),
+    "humid": Trapezoid(40, 70, INF, INF),
+}, universe=(0, 100))
+
+FAN = FuzzyVariable({
+    "off": Triangle(-25, 0, 25),
+    "low": Triangle(10, 35, 60),
+    "high": Trapezoid(50, 80, 100, 100),
+}, universe=(0, 100))
+
+FAN_RULES = [
+    ({"temperature": "cold"}, "off"),
+    ({"temperature": "warm", "humidity": "dry"}, "low"),
+    ({"temperature": "warm", "humidity": "humid"}, "high", 0.8),
+    ({"temperature": "hot"}, "high"),
+]
+
+
+def run_benchmark(n=1_000_000):
+    rng = np.random.default_rng(42)
+    readings = {"temperature": rng.uniform(-10, 50, n), "humidity": rng.uniform(0, 100, n)}
+    inputs = {"temperature": TEMPERATURE, "humidity": HUMIDITY}
+    mamdani = Mamdani(inputs, FAN, FAN_RULES)
+    sugeno = Sugeno(inputs, [(a, {"off": 0, "low": 35, "high": 85}[c], *w) for a, c, *w in FAN_RULES])
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<34}{n / elapsed:>14,.0f} readings/s")
+        return result
+
+    print(f"\n{n} readings")
+    exact = timed("Mamdani centroid", lambda: mamdani.evaluate(readings))
+    timed("Mamdani bisector", lambda: Mamdani(inputs, FAN, FAN_RULES, method="bisector").evaluate(readings))
+    timed("Sugeno", lambda: sugeno.evaluate(readings))
+    start = time.perf_counter()
+    table = LookupTable(mamdani, points=128)
+    print(f"{'lookup table build (128 x 128)':<34}{time.perf_counter() - start:>13.3f} s")
+    approx = timed("Mamdani via lookup table", lambda: table.evaluate(readings))
+    print(f"max |table - exact| = {np.nanmax(np.abs(approx - exact)):.3f}")
+
+
+def check_against_fuzzy(step=0.25):
+    """TEMPERATURE must give the same memberships as cold/warm/hot in Fuzzy.py."""
+    try:
+        from . import Fuzzy
+    except ImportError:  # run as a script
+        import Fuzzy
+    grid = np.arange(-20, 60 + step, step)
+    for term, mu in TEMPERATURE.fuzzify(grid).items():
+        expected = np.array([getattr(Fuzzy, term)(t) for t in grid], dtype=float)
+        assert np.allclose(mu, expected), f"{term} differs from Fuzzy.{term}"
+
+
+if __name__ == "__main__":
+    temperatures = np.array([-5, 10, 25, 35, 45])
+    for term, mu in TEMPERATURE.fuzzify(temperatures).items():
+        print(f"{term:>5}: {np.round(mu, 2)}")
+    check_against_fuzzy()
+    print("Same memberships as cold/warm/hot in Fuzzy.py")
+
+    system = Mamdani({"temperature": TEMPERATURE, "humidity": HUMIDITY}, FAN, FAN_RULES)
+    print("Fan speed at 25°C, 30% / 80% humidity:", system(temperature=25, humidity=[30, 80]))
+
+    run_benchmark()
@@ -74,21 +74,22 @@ class HashMap:
 
 # ================== EXAMPLE ==================
 
-hm = HashMap()
+if __name__ == "__main__":
+    hm = HashMap()
 
-hm.put("apple", 10)
-hm.put("banana", 20)
-hm.put("orange", 30)
+    hm.put("apple", 10)
+    hm.put("banana", 20)
+    hm.put("orange", 30)
 
-print("HashMap:", hm)
-print("Get apple:", hm.get("apple"))
-print("Get banana:", hm.get("banana"))
+    print("HashMap:", hm)
+    print("Get apple:", hm.get("apple"))
+    print("Get banana:", hm.get("banana"))
 
-hm.put("apple", 99)  # Update value
-print("Updated apple:", hm.get("apple"))
+    hm.put("apple", 99)  # Update value
+    print("Updated apple:", hm.get("apple"))
 
-hm.remove("banana")
-print("After removing banana:", hm)
+    hm.remove("banana")
+    print("After removing banana:", hm)
 
-print("Does 'orange' exist?", "orange" in hm)
-print("Does 'banana' exist?", "banana" in hm)
+    print("Does 'orange' exist?", "orange" in hm)
+    print("Does 'banana' exist?", "banana" in hm)
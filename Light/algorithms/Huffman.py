@@ -0,0 +1,261 @@
+"""
+Huffman Coding (Greedy)
+-----------------------
+
+Problem:
+- Give every byte value a bit string (prefix-free: no code is the start
+  of another) so that the encoded data is as short as possible.
+
+🔎 Greedy idea:
+- Put every symbol in a min-heap by frequency. Repeatedly pop the two
+  rarest, merge them into one node whose weight is their sum and push
+  it back. The depth of a symbol in the final tree is its code length.
+
+⚡ At scale:
+1. Canonical codes: only the code *lengths* are stored (256 bytes of
+   header); codes are then assigned in (length, symbol) order, so the
+   encoder and decoder rebuild the same table.
+2. Encoder: every byte maps to its code as a '0'/'1' string; a chunk is
+   one join plus one int(bits, 2), no per-bit Python work.
+3. Table-driven decoder: the decoder state is the tree node reached so
+   far. For every (state, input byte) pair a table holds the symbols
+   emitted while walking those 8 bits and the state afterwards, so
+   decoding costs one lookup per *input byte*, for any code lengths.
+   The decoder takes the data in chunks, so files are streamed.
+
+📊 Complexity:
+- Build: O(k log k) for k distinct symbols, decoder table: O(k * 256)
+- Encode / decode: O(n)
+
+🎯 Use Cases:
+- DEFLATE (zip, gzip, PNG), JPEG, MP3 entropy coding.
+"""
+
+import heapq
+import random
+import time
+from collections import Counter
+
+HEADER_SIZE = 256 + 8  # one code length per byte value + symbol count
+
+
+# -------------------------------
+# Building the code
+# -------------------------------
+def code_lengths(freqs):
+    """
+    Huffman code length of every symbol.
+
+    :param freqs: dict symbol -> count (counts > 0)
+    :return: dict symbol -> code length in bits
+    """
+    if len(freqs) == 1:
+        return {symbol: 1 for symbol in freqs}  # one symbol still needs one bit
+    # (weight, tie breaker, symbols in this subtree)
+    heap = [(count, symbol, [symbol]) for symbol, count in freqs.items()]
+    heapq.heapify(heap)
+    lengths = dict.fromkeys(freqs, 0)
+    while len(heap) > 1:
+        w1, t1, s1 = heapq.heappop(heap)
+        w2, t2, s2 = heapq.heappop(heap)
+        for symbol in s1 + s2:
+            lengths[symbol] += 1  # everything below the new node gets one bit deeper
+        heapq.heappush(heap, (w1 + w2, min(t1, t2), s1 + s2))
+    return lengths
+
+
+def canonical_codes(lengths):
+    """
+    Canonical Huffman codes from code lengths.
+
+    :return: dict symbol -> (code as int, length)
+    """
+    codes = {}
+    code = 0
+    prev_length = 0
+    for symbol, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - prev_length
+        codes[symbol] = (code, length)
+        code += 1
+        prev_length = length
+    return codes
+
+
+# -------------------------------
+# Encoder
+# -------------------------------
+class HuffmanEncoder:
+    def __init__(self, lengths):
+        self.bits = [""] * 256
+        for symbol, (code, length) in canonical_codes(lengths).items():
+            self.bits[symbol] = format(code, f"0{length}b")
+        self.pending = ""  # bits that did not fill a whole byte yet
+
+    def feed(self, chunk):
+        """Encode a chunk of bytes; return the complete output bytes."""
+        bits = self.pending + "".join(map(self.bits.__getitem__, chunk))
+        whole = len(bits) - len(bits) % 8
+        self.pending = bits[whole:]
+        if not whole:
+            return b""
+        return int(bits[:whole], 2).to_bytes(whole // 8, "big")
+
+    def finish(self):
+        """Flush the last bits, padded with zeros to a whole byte."""
+        if not self.pending:
+            return b""
+        last = self.pending.ljust(8, "0")
+        self.pending = ""
+        return int(last, 2).to_bytes(1, "big")
+
+
+# -------------------------------
+# Table-driven decoder
+# -------------------------------
+def _build_tree(lengths):
+    """Decoding tree as child lists; children >= 0 are nodes, < 0 are ~symbol."""
+    children = [[None, None]]
+    for symbol, (code, length) in canonical_codes(lengths).items():
+        node = 0
+        for shift in range(length - 1, 0, -1):
+            bit = (code >> shift) & 1
+            if children[node][bit] is None:
+                children[node][bit] = len(children)
+                children.append([None, None])
+            node = children[node][bit]
+        children[node][code & 1] = ~symbol
+    return children
+
+
+class HuffmanDecoder:
+    def __init__(self, lengths, count=None):
+        """
+        :param lengths: dict symbol -> code length (as from code_lengths)
+        :param count: number of symbols to produce; trailing padding is dropped
+        """
+        children = _build_tree(lengths)
+        self.emit = []
+        self.next_state = []
+        for state in range(len(children)):
+            for byte in range(256):
+                node, out = state, bytearray()
+                for shift in range(7, -1, -1):
+                    child = children[node][(byte >> shift) & 1]
+                    if child is None:  # only reachable through padding
+                        node = 0
+                    elif child < 0:
+                        out.append(~child)
+                        node = 0
+                    else:
+                        node = child
+                self.emit.append(bytes(out))
+                self.next_state.append(node)
+        self.state = 0
+        self.remaining = count
+
+    def feed(self, chunk):
+        """Decode a chunk of encoded bytes; return the decoded bytes."""
+        emit, next_state = self.emit, self.next_state
+        state = self.state
+        out = []
+        append = out.append
+        for byte in chunk:
+            index = (state << 8) | byte
+            append(emit[index])
+            state = next_state[index]
+        self.state = state
+        data = b"".join(out)
+        if self.remaining is not None:
+            data = data[:self.remaining]
+            self.remaining -= len(data)
+        return data
+
+
+# -------------------------------
+# Whole-buffer and streaming helpers
+# -------------------------------
+def compress(data):
+    """
+    :return: header (code lengths + symbol count) followed by the encoded bits
+    """
+    lengths = code_lengths(Counter(data)) if data else {}
+    header = bytes(lengths.get(symbol, 0) for symbol in range(256)) + len(data).to_bytes(8, "big")
+    encoder = HuffmanEncoder(lengths)
+    return header + encoder.feed(data) + encoder.finish()
+
+
+def _read_header(header):
+    lengths = {symbol: length for symbol, length in enumerate(header[:256]) if length}
+    return lengths, int.from_bytes(header[256:HEADER_SIZE], "big")
+
+
+def decompress(blob):
+    lengths, count = _read_header(blob[:HEADER_SIZE])
+    if not count:
+        return b""
+    return HuffmanDecoder(lengths, count).feed(blob[HEADER_SIZE:])
+
+
+def decompress_stream(chunks):
+    """
+    Decode compress() output arriving in chunks (e.g. reads of a file).
+
+    :return: generator of decoded byte chunks
+    """
+    buffer = b""
+    decoder = None
+    for chunk in chunks:
+        if decoder is None:
+            buffer += chunk
+            if len(buffer) < HEADER_SIZE:
+                continue
+            lengths, count = _read_header(buffer)
+            if not count:
+                return
+            decoder = HuffmanDecoder(lengths, count)
+            chunk = buffer[HEADER_SIZE:]
+        yield decoder.feed(chunk)
+
+
+# ================== EXAMPLE ==================
+
+def sample_text(size, seed=42):
+    rng = random.Random(seed)
+    words = "the quick brown fox jumps over a lazy dog while greedy coders compress logs".split()
+    out = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out).encode()[:size]
+
+
+def run_benchmark(size=5_000_000, chunk_size=1 << 16):
+    data = sample_text(size)
+
+    start = time.perf_counter()
+    blob = compress(data)
+    t_enc = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = (blob[i:i + chunk_size] for i in range(0, len(blob), chunk_size))
+    restored = b"".join(decompress_stream(chunks))
+    t_dec = time.perf_counter() - start
+    assert restored == data
+
+    mb = size / 2 ** 20
+    print(f"\n{mb:.1f} MB of text -> {len(blob) / 2 ** 20:.1f} MB ({len(blob) / size:.0%})")
+    print(f"encode: {mb / t_enc:.1f} MB/s, streaming decode: {mb / t_dec:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    text = b"abracadabra"
+    lengths = code_lengths(Counter(text))
+    for symbol, (code, length) in sorted(canonical_codes(lengths).items()):
+        print(f"{chr(symbol)!r}: {format(code, f'0{length}b')}")
+    blob = compress(text)
+    print(f"{len(text)} bytes -> {len(blob) - HEADER_SIZE} bytes + header; round trip ok:",
+          decompress(blob) == text)
+
+    run_benchmark()
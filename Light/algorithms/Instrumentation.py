@@ -0,0 +1,379 @@
+"""
+Search Instrumentation (opt-in profiling hooks)
+-----------------------------------------------
+
+Problem:
+- A slow astar() or dijkstra() call does not say *why* it was slow:
+  too many expansions, heap churn, stale queue entries, or just a big graph.
+
+🔎 Idea: count from the outside, only when asked.
+- The search functions stay exactly as they are; with instrumentation
+  off they run the original code, so the cost when disabled is zero.
+- An instrumented call temporarily swaps the module globals the function
+  already uses for counting twins:
+  - heapq  -> counts heappush / heappop, tracks the peak heap size,
+  - deque  -> counts append / popleft, tracks the peak queue size,
+  - the function's own name -> the wrapper, so recursive calls (dfs) are
+    seen and the recursion depth is the DFS frontier.
+  Anything popped for the second time is a *revisit* (a stale heap entry
+  in dijkstra / astar, an already visited node in bfs); everything else
+  popped is an expansion.
+- Every call also lands in a per-function timing histogram (power of two
+  microsecond buckets), and optionally in a cProfile profile.
+
+⚡ Exporters:
+- as_dicts():   one plain dict per call
+- to_jsonl():   the same as JSON lines (diffable, greppable)
+- dump_pstats(): cProfile data readable by pstats / snakeviz
+
+⚠️ The swap patches module globals for the duration of a call: use
+  instrumented calls from one thread at a time.
+
+🎯 Use Cases:
+- Explaining slow queries, comparing heuristics, regression profiling.
+"""
+
+import cProfile
+import collections
+import contextlib
+import functools
+import heapq
+import inspect
+import json
+import math
+import pstats
+import random
+import sys
+import time
+
+try:
+    from . import AStar, BFS, DFS, Djstrika
+except ImportError:  # run as a script
+    import AStar
+    import BFS
+    import DFS
+    import Djstrika
+
+
+# -------------------------------
+# Per-call counters
+# -------------------------------
+class SearchStats:
+    """Counters of one search call."""
+
+    FIELDS = ("expansions", "pushes", "pops", "peak_frontier", "revisits")
+
+    def __init__(self, function):
+        self.function = function
+        self.expansions = self.pushes = self.pops = self.peak_frontier = self.revisits = 0
+        self.seconds = 0.0
+        self.label = None
+        self._popped = set()
+
+    def popped(self, key):
+        self.pops += 1
+        if key in self._popped:
+            self.revisits += 1
+        else:
+            self._popped.add(key)
+            self.expansions += 1
+
+    def as_dict(self):
+        d = {"function": self.function, "label": self.label, "seconds": self.seconds}
+        d.update((name, getattr(self, name)) for name in self.FIELDS)
+        return d
+
+
+def _key(item):
+    """What a queue entry refers to: a Node's position, a (priority, node) pair's node, or the item."""
+    position = getattr(item, "position", None)
+    if position is not None:
+        return position
+    if isinstance(item, tuple) and len(item) == 2:
+        return item[1]
+    return item
+
+
+class _CountingHeapq:
+    """Stand-in for the heapq module that reports to a SearchStats."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def heappush(self, heap, item):
+        heapq.heappush(heap, item)
+        stats = self.stats
+        stats.pushes += 1
+        if len(heap) > stats.peak_frontier:
+            stats.peak_frontier = len(heap)
+
+    def heappop(self, heap):
+        item = heapq.heappop(heap)
+        self.stats.popped(_key(item))
+        return item
+
+    def __getattr__(self, name):
+        return getattr(heapq, name)  # heapify, nsmallest, ... unchanged
+
+
+def _counting_deque(stats):
+    class CountingDeque(collections.deque):
+        def __init__(self, iterable=()):
+            super().__init__()
+            for item in iterable:
+                self.append(item)
+
+        def append(self, item):
+            super().append(item)
+            stats.pushes += 1
+            if len(self) > stats.peak_frontier:
+                stats.peak_frontier = len(self)
+
+        def popleft(self):
+            item = super().popleft()
+            stats.popped(item)
+            return item
+
+    return CountingDeque
+
+
+class _CountingSet(set):
+    """visited set for dfs: a membership hit is a neighbor seen again."""
+
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+
+    def __contains__(self, item):
+        hit = super().__contains__(item)
+        if hit:
+            self.stats.revisits += 1
+        return hit
+
+
+# -------------------------------
+# Recorder
+# -------------------------------
+class Recorder:
+    """
+    Collects SearchStats, timing histograms and (optionally) a cProfile
+    profile of instrumented calls.
+
+        recorder = Recorder()
+        path = recorder.call(astar, maze, start, end, label="maze-1")
+        with recorder.enabled():          # module attributes swapped
+            Djstrika.dijkstra(graph, "A")
+    """
+
+    def __init__(self, profile=False):
+        self.calls = []
+        self.histograms = collections.defaultdict(collections.Counter)  # name -> {bucket_us: count}
+        self.profiler = cProfile.Profile() if profile else None
+        self._active = None  # SearchStats of the call in progress
+
+    def wrap(self, fn):
+        """Instrumented version of fn (one of astar, dijkstra, bfs, dfs)."""
+        recorder = self
+
+        def instrumented(*args, label=None, **kwargs):
+            return recorder.call(fn, *args, label=label, **kwargs)
+
+        instrumented.__name__ = fn.__name__
+        instrumented.__doc__ = fn.__doc__
+        instrumented.__wrapped__ = fn
+        return instrumented
+
+    def call(self, fn, *args, label=None, **kwargs):
+        """Run fn(*args, **kwargs) instrumented; return its result."""
+        fn = inspect.unwrap(fn)  # an enabled() wrapper (of any recorder) -> the search itself
+        if self._active is not None:
+            return self._recurse(fn, *args, **kwargs)
+
+        namespace = fn.__globals__
+        if namespace is globals() or namespace.get("__name__") != fn.__module__:
+            # Only ever patch the globals of the module defining the search
+            raise ValueError(f"cannot instrument {fn.__qualname__}: not a module-level search function")
+        stats = SearchStats(fn.__name__)
+        stats.label = label
+        swaps = {fn.__name__: functools.partial(self._recurse, fn)}
+        if "heapq" in namespace:
+            swaps["heapq"] = _CountingHeapq(stats)
+        if "deque" in namespace:
+            swaps["deque"] = _counting_deque(stats)
+        if fn.__name__ == "dfs" and len(args) < 3 and "visited" not in kwargs:
+            kwargs["visited"] = _CountingSet(stats)
+
+        saved = {name: namespace.get(name) for name in swaps}
+        namespace.update(swaps)
+        self._active = stats
+        self._depth = 0
+        try:
+            if self.profiler is not None:
+                self.profiler.enable()
+            start = time.perf_counter()
+            try:
+                result = self._recurse(fn, *args, **kwargs)
+            finally:
+                stats.seconds = time.perf_counter() - start
+                if self.profiler is not None:
+                    self.profiler.disable()
+        finally:
+            namespace.update(saved)
+            self._active = None
+
+        self.calls.append(stats)
+        micros = max(1, math.ceil(stats.seconds * 1e6))
+        self.histograms[stats.function][1 << (micros - 1).bit_length()] += 1
+        return result
+
+    def _recurse(self, fn, *args, **kwargs):
+        # Recursion depth is the frontier of a recursive search (dfs)
+        stats = self._active
+        self._depth += 1
+        if fn.__name__ == "dfs":
+            stats.expansions += 1
+            if self._depth > stats.peak_frontier:
+                stats.peak_frontier = self._depth
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._depth -= 1
+
+    @contextlib.contextmanager
+    def enabled(self, modules=(AStar, BFS, DFS, Djstrika)):
+        """Swap astar / bfs / dfs / dijkstra in their modules (and the package) for instrumented ones."""
+        names = {AStar: "astar", BFS: "bfs", DFS: "dfs", Djstrika: "dijkstra"}
+        package = _package()
+        originals = {}  # id(wrapper) -> original function
+        wrappers = []
+        for module in modules:
+            name = names[module]
+            original = getattr(module, name)
+            wrapped = self.wrap(original)
+            wrappers.append(wrapped)
+            originals[id(wrapped)] = original
+            setattr(module, name, wrapped)
+            if package is not None and name in vars(package):
+                setattr(package, name, wrapped)
+        try:
+            yield self
+        finally:
+            # Put the originals back wherever a wrapper got bound meanwhile:
+            # the modules, the package (its lazy __getattr__ caches what it
+            # finds) and any `from ... import dijkstra` done inside the block
+            for module in list(sys.modules.values()):
+                namespace = getattr(module, "__dict__", None)
+                if not isinstance(namespace, dict):
+                    continue
+                for name, value in list(namespace.items()):
+                    if id(value) in originals and value in wrappers:
+                        namespace[name] = originals[id(value)]
+
+    # ---------------------------
+    # Exporters
+    # ---------------------------
+    def as_dicts(self):
+        return [stats.as_dict() for stats in self.calls]
+
+    def to_jsonl(self, file):
+        """Write one JSON object per call to a path or an open text file."""
+        if isinstance(file, str):
+            with open(file, "w") as f:
+                return self.to_jsonl(f)
+        for record in self.as_dicts():
+            file.write(json.dumps(record) + "\n")
+
+    def histogram(self, function):
+        """Sorted list of (upper bound in microseconds, calls)."""
+        return sorted(self.histograms[function].items())
+
+    def percentile(self, function, q):
+        """Upper bound (microseconds) of the bucket holding the q-quantile."""
+        buckets = self.histogram(function)
+        total = sum(count for _, count in buckets)
+        seen = 0
+        for bound, count in buckets:
+            seen += count
+            if seen >= q * total:
+                return bound
+        return None
+
+    def pstats(self):
+        if self.profiler is None:
+            raise ValueError("create the Recorder with profile=True")
+        return pstats.Stats(self.profiler)
+
+    def dump_pstats(self, path):
+        """cProfile output file, e.g. for pstats.Stats(path) or snakeviz."""
+        self.pstats().dump_stats(path)
+
+
+def _package():
+    return sys.modules.get(__package__) if __package__ else None
+
+
+# ================== EXAMPLE ==================
+
+def grid_graph(side, seed=42):
+    """Weighted grid graph in dijkstra() format and the matching maze."""
+    rng = random.Random(seed)
+    maze = [[1 if rng.random() < 0.2 else 0 for _ in range(side)] for _ in range(side)]
+    maze[0][0] = maze[side - 1][side - 1] = 0
+    graph = {}
+    for r in range(side):
+        for c in range(side):
+            if maze[r][c]:
+                continue
+            graph[(r, c)] = [((r + dr, c + dc), rng.randint(1, 9))
+                             for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0))
+                             if 0 <= r + dr < side and 0 <= c + dc < side and not maze[r + dr][c + dc]]
+    return maze, graph
+
+
+def run_benchmark(side=60, calls=20):
+    maze, graph = grid_graph(side)
+    plain = {node: [n for n, _ in edges] for node, edges in graph.items()}
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        Djstrika.dijkstra(graph, (0, 0))
+    t_plain = (time.perf_counter() - start) / calls
+
+    recorder = Recorder()
+    with recorder.enabled():
+        start = time.perf_counter()
+        for _ in range(calls):
+            Djstrika.dijkstra(graph, (0, 0))
+        t_instr = (time.perf_counter() - start) / calls
+    print(f"\ndijkstra on a {side}x{side} grid: {t_plain * 1000:.2f} ms plain, "
+          f"{t_instr * 1000:.2f} ms instrumented (off = original code, no overhead)")
+    print(f"p50 <= {recorder.percentile('dijkstra', 0.5)} us, p99 <= {recorder.percentile('dijkstra', 0.99)} us")
+
+    profiled = Recorder(profile=True)
+    profiled.call(AStar.astar, maze, (0, 0), (side // 3, side // 3), label="astar third")
+    profiled.call(Djstrika.dijkstra, graph, (0, 0), label="dijkstra")
+    profiled.call(BFS.bfs, plain, (0, 0), label="bfs")
+    # dfs recurses once per node: keep it on a grid below the recursion limit
+    _, small = grid_graph(20)
+    profiled.call(DFS.dfs, {node: [n for n, _ in edges] for node, edges in small.items()}, (0, 0),
+                  label="dfs 20x20")
+    print(f"\n{'call':<14}{'ms':>9}" + "".join(f"{name:>15}" for name in SearchStats.FIELDS))
+    for record in profiled.as_dicts():
+        print(f"{record['label']:<14}{record['seconds'] * 1000:>9.2f}"
+              + "".join(f"{record[name]:>15}" for name in SearchStats.FIELDS))
+    print("\nTop functions by cumulative time:")
+    profiled.pstats().sort_stats("cumulative").print_stats(5)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+    recorder = Recorder()
+    print("dijkstra:", recorder.call(Djstrika.dijkstra, graph, 'A', label="example"))
+    print("stats:   ", recorder.as_dicts()[0])
+
+    run_benchmark()
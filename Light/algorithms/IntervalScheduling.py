@@ -0,0 +1,165 @@
+"""
+Interval Scheduling (Greedy)
+----------------------------
+
+Problems:
+1. Activity selection: pick the most intervals that do not overlap.
+2. Interval partitioning: fewest rooms so every interval gets one
+   (= the largest number of intervals open at the same moment).
+
+🔎 Greedy ideas:
+1. Sort by end time and take every interval that starts after the last
+   chosen one ends. Finishing early leaves the most room for the rest.
+2. Sort by start time; keep a min-heap of the end times of busy rooms.
+   Reuse the room that frees up first if it is free, else open a new one.
+
+⚡ At scale:
+- Intervals are half-open [start, end): one ending at 5 and one starting
+  at 5 do not overlap.
+- With NumPy the sort is argsort on an array of ends, and the room count
+  is a sweep: +1 at every start, -1 at every end, ends before starts at
+  the same time, maximum of the running sum.
+
+📊 Complexity:
+- Time: O(n log n) (sorting), Space: O(n)
+
+🎯 Use Cases:
+- Meeting rooms, CPU / machine scheduling, bandwidth reservations.
+"""
+
+import heapq
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # sorting falls back to sorted()
+    np = None
+
+
+# -------------------------------
+# Activity selection
+# -------------------------------
+def select_activities(intervals):
+    """
+    Largest set of non-overlapping intervals.
+
+    :param intervals: iterable of (start, end)
+    :return: chosen intervals, ordered by end time
+    """
+    chosen = []
+    last_end = float("-inf")
+    for start, end in sorted(intervals, key=lambda iv: iv[1]):
+        if start >= last_end:
+            chosen.append((start, end))
+            last_end = end
+    return chosen
+
+
+def select_activities_arrays(starts, ends):
+    """
+    select_activities() for NumPy arrays (millions of intervals).
+
+    :return: indices of the chosen intervals, ordered by end time
+    """
+    if np is None:
+        order = sorted(range(len(ends)), key=ends.__getitem__)
+        starts_sorted = [starts[i] for i in order]
+        ends_sorted = [ends[i] for i in order]
+    else:
+        order = np.argsort(ends, kind="stable")
+        starts_sorted = np.asarray(starts)[order].tolist()  # lists iterate faster
+        ends_sorted = np.asarray(ends)[order].tolist()
+        order = order.tolist()
+
+    chosen = []
+    last_end = float("-inf")
+    for i, start, end in zip(order, starts_sorted, ends_sorted):
+        if start >= last_end:
+            chosen.append(i)
+            last_end = end
+    return chosen
+
+
+# -------------------------------
+# Interval partitioning
+# -------------------------------
+def assign_rooms(intervals):
+    """
+    Give every interval a room, using as few rooms as possible.
+
+    :return: (number of rooms, list of room numbers in input order)
+    """
+    order = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+    busy = []  # heap of (end time, room)
+    rooms = [0] * len(intervals)
+    count = 0
+    for i in order:
+        start, end = intervals[i]
+        if busy and busy[0][0] <= start:
+            _, room = heapq.heapreplace(busy, (end, busy[0][1]))
+        else:
+            room = count
+            count += 1
+            heapq.heappush(busy, (end, room))
+        rooms[i] = room
+    return count, rooms
+
+
+def min_rooms(starts, ends):
+    """Number of rooms needed (peak overlap), without assigning them."""
+    if np is not None:
+        times = np.concatenate([np.asarray(ends), np.asarray(starts)])
+        # Ends (-1) sort before starts (+1) at equal times: half-open intervals
+        deltas = np.concatenate([np.full(len(ends), -1), np.ones(len(starts), dtype=np.int64)])
+        order = np.lexsort((deltas, times))
+        return int(np.cumsum(deltas[order]).max(initial=0))
+    events = sorted([(e, -1) for e in ends] + [(s, 1) for s in starts])
+    peak = open_now = 0
+    for _, delta in events:
+        open_now += delta
+        peak = max(peak, open_now)
+    return peak
+
+
+# ================== EXAMPLE ==================
+
+def random_intervals(n, horizon, seed=42):
+    rng = random.Random(seed)
+    starts = [rng.randrange(horizon) for _ in range(n)]
+    ends = [s + rng.randint(1, horizon // 1000 + 1) for s in starts]
+    return starts, ends
+
+
+def run_benchmark(n=1_000_000):
+    starts, ends = random_intervals(n, horizon=10 ** 8)
+    intervals = list(zip(starts, ends))
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<30}{n / elapsed:>14,.0f} intervals/s")
+        return result
+
+    print(f"\n{n} intervals")
+    chosen = timed("select_activities", lambda: select_activities(intervals))
+    if np is not None:
+        s, e = np.array(starts), np.array(ends)
+        picked = timed("select_activities_arrays", lambda: select_activities_arrays(s, e))
+        assert len(picked) == len(chosen)
+        peak = timed("min_rooms (NumPy sweep)", lambda: min_rooms(s, e))
+    else:
+        peak = timed("min_rooms", lambda: min_rooms(starts, ends))
+    count, _ = timed("assign_rooms (heap)", lambda: assign_rooms(intervals))
+    assert count == peak
+
+
+if __name__ == "__main__":
+    meetings = [(1, 4), (3, 5), (0, 6), (5, 7), (3, 9), (5, 9), (6, 10), (8, 11), (8, 12), (2, 14), (12, 16)]
+    print("Meetings:", meetings)
+    print("Most non-overlapping:", select_activities(meetings))
+    rooms, assignment = assign_rooms(meetings)
+    print(f"Rooms needed: {rooms}, assignment: {assignment}")
+
+    run_benchmark()
@@ -0,0 +1,213 @@
+"""
+0/1 Knapsack Engine
+-------------------
+
+Problem:
+- Given items with weights and values and a capacity W, pick a subset
+  of items with total weight <= W and the largest total value.
+
+🔎 From the textbook table to something that scales:
+- The classic DP (see DynamicProgramming.py) fills a (n+1) x (W+1) table.
+  With n = 10k items and W = 10^6 that is 10^10 cells: out of memory.
+- Row i only depends on row i-1, so one row of W+1 cells is enough.
+  Updating it from high capacities to low ones (or from a copy of the
+  old row) makes sure every item is used at most once.
+- With NumPy a whole row update is one vectorized operation:
+      row[w:] = max(row[w:], row[:-w] + value)
+- When value == weight (subset sum) the row is just "which sums are
+  reachable", which fits in the bits of one Python int:
+      reachable |= reachable << weight
+
+⚡ Which items? (Hirschberg-style divide and conquer)
+- A single row only gives the best value, not the items.
+- Split the items in two halves, compute the best-value row of each half,
+  and find the capacity split c that maximizes left[c] + right[W - c].
+  Then solve both halves recursively with capacities c and W - c.
+- Memory stays O(W) and the total time is still O(n * W).
+
+📊 Complexity:
+- knapsack(): O(n * W) time, O(W) space
+- subset_sum(): O(n * W / 64) word operations
+- knapsack_items(): O(n * W) time, O(W + n) space
+
+🎯 Use Cases:
+- Resource allocation, budget optimization, cargo loading.
+"""
+
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pure Python rows work everywhere
+    np = None
+
+
+# -------------------------------
+# One rolling row
+# -------------------------------
+def best_value_row(weights, values, capacity):
+    """
+    row[c] = best total value using the given items with weight <= c.
+
+    :return: list (or NumPy array) with capacity + 1 entries
+    """
+    values = list(values)
+    if np is not None:
+        # int64 for int values, float64 as soon as one value is a float,
+        # object (exact, slower) for ints that do not fit in 64 bits
+        row = np.zeros(capacity + 1, dtype=np.result_type(np.int64, np.asarray(values)))
+        for w, v in zip(weights, values):
+            if w > capacity or v <= 0:
+                continue
+            if w == 0:
+                row += v
+                continue
+            # The right-hand side is evaluated first, from the old row,
+            # exactly like a reverse-order in-place update.
+            np.maximum(row[w:], row[:-w] + v, out=row[w:])
+        return row
+
+    row = [0] * (capacity + 1)
+    for w, v in zip(weights, values):
+        if w > capacity or v <= 0:
+            continue
+        if w == 0:
+            row = [x + v for x in row]
+            continue
+        # Same update as one comprehension: max(old row[c], old row[c-w] + v)
+        row[w:] = [a if a > b + v else b + v
+                   for a, b in zip(row[w:], row[:capacity + 1 - w])]
+    return row
+
+
+def knapsack(weights, values, capacity):
+    """
+    Maximum value of a 0/1 knapsack.
+
+    :param weights: list of non-negative int weights
+    :param values: list of int or float values (same length as weights)
+    :param capacity: non-negative int capacity
+    :return: best achievable total value (int, or float for float values)
+    """
+    if capacity < 0:
+        raise ValueError("capacity must be non-negative")
+    if list(weights) == list(values):
+        return subset_sum(weights, capacity)
+    best = best_value_row(weights, values, capacity)[capacity]
+    return best.item() if hasattr(best, "item") else best  # NumPy scalar -> Python number
+
+
+# -------------------------------
+# Bitset subset sum (value == weight)
+# -------------------------------
+def subset_sum(weights, capacity):
+    """
+    Largest sum <= capacity reachable with a subset of weights.
+    Bit s of `reachable` is set when the sum s can be made.
+    """
+    mask = (1 << (capacity + 1)) - 1
+    reachable = 1  # the empty subset makes sum 0
+    for w in weights:
+        if w <= capacity:
+            reachable = (reachable | (reachable << w)) & mask
+    return reachable.bit_length() - 1
+
+
+# -------------------------------
+# Item reconstruction in O(W) memory
+# -------------------------------
+def knapsack_items(weights, values, capacity):
+    """
+    Best value and the indices of the items that achieve it.
+
+    :return: (best_value, sorted list of chosen item indices)
+    """
+    chosen = []
+    # Explicit stack of (first item, end item, capacity) subproblems
+    stack = [(0, len(weights), capacity)]
+    while stack:
+        lo, hi, cap = stack.pop()
+        if hi - lo == 1:
+            if weights[lo] <= cap and values[lo] > 0:
+                chosen.append(lo)
+            continue
+        if hi <= lo or cap < 0:
+            continue
+
+        mid = (lo + hi) // 2
+        left = best_value_row(weights[lo:mid], values[lo:mid], cap)
+        right = best_value_row(weights[mid:hi], values[mid:hi], cap)
+        # Best way to share the capacity between the two halves
+        if np is not None:
+            split = int(np.argmax(left + right[::-1]))
+        else:
+            split = max(range(cap + 1), key=lambda c: left[c] + right[cap - c])
+        del left, right
+        stack.append((lo, mid, split))
+        stack.append((mid, hi, cap - split))
+
+    chosen.sort()
+    return sum(values[i] for i in chosen), chosen
+
+
+# ================== EXAMPLE ==================
+
+def knapsack_2d(weights, values, capacity):
+    """The (n+1) x (W+1) textbook table, kept here as the benchmark baseline."""
+    n = len(values)
+    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+    for i in range(1, n + 1):
+        for w in range(1, capacity + 1):
+            if weights[i - 1] <= w:
+                dp[i][w] = max(values[i - 1] + dp[i - 1][w - weights[i - 1]], dp[i - 1][w])
+            else:
+                dp[i][w] = dp[i - 1][w]
+    return dp[n][capacity]
+
+
+def run_benchmark(seed=42):
+    rng = random.Random(seed)
+    print("\nBenchmark (seconds)")
+    print(f"{'items':>7}{'capacity':>10}{'2d table':>10}{'row':>10}{'items()':>10}{'subset':>10}")
+    for n, capacity in ((100, 1_000), (200, 10_000), (500, 50_000)):
+        weights = [rng.randrange(1, capacity // 10) for _ in range(n)]
+        values = [rng.randrange(1, 1000) for _ in range(n)]
+
+        row = f"{n:>7}{capacity:>10}"
+        if n * capacity <= 2_000_000:
+            start = time.perf_counter()
+            expected = knapsack_2d(weights, values, capacity)
+            row += f"{time.perf_counter() - start:>10.3f}"
+        else:
+            expected = None
+            row += f"{'skipped':>10}"
+
+        start = time.perf_counter()
+        best = knapsack(weights, values, capacity)
+        row += f"{time.perf_counter() - start:>10.3f}"
+
+        start = time.perf_counter()
+        best_items, chosen = knapsack_items(weights, values, capacity)
+        row += f"{time.perf_counter() - start:>10.3f}"
+
+        start = time.perf_counter()
+        subset_sum(weights, capacity)
+        row += f"{time.perf_counter() - start:>10.3f}"
+        print(row)
+
+        assert expected in (None, best) and best == best_items
+        assert sum(weights[i] for i in chosen) <= capacity
+
+
+if __name__ == "__main__":
+    values = [60, 100, 120]
+    weights = [10, 20, 30]
+    capacity = 50
+
+    print(f"Maximum value for capacity {capacity} = {knapsack(weights, values, capacity)}")
+    best, items = knapsack_items(weights, values, capacity)
+    print(f"Chosen items: {items} (value {best})")
+    print(f"Subset sum of [3, 34, 4, 12, 5, 2] closest to 9: {subset_sum([3, 34, 4, 12, 5, 2], 9)}")
+
+    run_benchmark()
@@ -0,0 +1,228 @@
+"""
+Minimum Spanning Tree (Greedy)
+------------------------------
+
+Problem:
+- Connect every node of a weighted undirected graph with the cheapest
+  set of edges (a tree: no cycles). If the graph is not connected the
+  result is a minimum spanning *forest*, one tree per component.
+
+🔎 Two greedy algorithms:
+1. Kruskal: take edges from cheapest to most expensive and keep every
+   edge that joins two different components. Components are tracked by
+   a union-find (disjoint set) structure:
+   - path compression: find() points every visited node at the root,
+   - union by rank: the shorter tree goes under the taller one,
+   so each operation costs O(alpha(n)), practically constant.
+2. Prim (lazy heap): grow one tree from a start node; a min-heap holds
+   every edge leaving the tree. Pop the cheapest; if its far end is
+   already in the tree the entry is stale and skipped (no decrease-key).
+
+⚡ At scale:
+- kruskal_arrays() takes edges as NumPy arrays: one argsort instead of
+  sorting tuples, and the loop stops after n - 1 accepted edges.
+
+📊 Complexity:
+- Kruskal: O(E log E), Prim (lazy heap): O(E log E)
+
+🎯 Use Cases:
+- Network / cable layout, clustering (cut the k - 1 longest tree edges),
+  approximations for the travelling salesman problem.
+
+Graph format: the same undirected adjacency dict dijkstra() takes, every
+edge listed at both ends,
+    {node: [(neighbor, weight), ...], ...}
+"""
+
+import heapq
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # kruskal_arrays sorts with sorted()
+    np = None
+
+
+# -------------------------------
+# Union-find
+# -------------------------------
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path compression and union by rank."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.components = n
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        """Merge the sets of a and b; False if they were already one set."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        self.components -= 1
+        return True
+
+
+# -------------------------------
+# Kruskal
+# -------------------------------
+def _nodes(graph):
+    nodes = list(graph)
+    seen = set(nodes)
+    for edges in graph.values():
+        for neighbor, _ in edges:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                nodes.append(neighbor)
+    return nodes
+
+
+def kruskal(graph):
+    """
+    Minimum spanning forest with Kruskal's algorithm.
+
+    :param graph: dict node -> list of (neighbor, weight)
+    :return: (total weight, list of (u, v, weight))
+    """
+    nodes = _nodes(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = [(weight, index[u], index[v]) for u, adjacent in graph.items() for v, weight in adjacent]
+    edges.sort()
+
+    uf = UnionFind(len(nodes))
+    tree, total = [], 0
+    for weight, a, b in edges:
+        if uf.union(a, b):
+            tree.append((nodes[a], nodes[b], weight))
+            total += weight
+            if uf.components == 1:
+                break
+    return total, tree
+
+
+def kruskal_arrays(n, u, v, w):
+    """
+    Kruskal for edge arrays over nodes 0..n-1.
+
+    :param u: edge sources, v: edge targets, w: edge weights (equal length)
+    :return: (total weight, indices of the chosen edges)
+    """
+    if np is not None:
+        order = np.argsort(w, kind="stable").tolist()
+        u, v, w = np.asarray(u).tolist(), np.asarray(v).tolist(), np.asarray(w).tolist()
+    else:
+        order = sorted(range(len(w)), key=w.__getitem__)
+
+    uf = UnionFind(n)
+    union = uf.union
+    chosen, total = [], 0
+    for i in order:
+        if union(u[i], v[i]):
+            chosen.append(i)
+            total += w[i]
+            if len(chosen) == n - 1:
+                break
+    return total, chosen
+
+
+# -------------------------------
+# Prim (lazy heap)
+# -------------------------------
+def prim(graph, start=None):
+    """
+    Minimum spanning forest with Prim's algorithm and a lazy min-heap.
+
+    :param start: node to grow the first tree from (default: first node)
+    :return: (total weight, list of (u, v, weight)) in the order edges were added
+    """
+    nodes = _nodes(graph)
+    if start is not None:
+        nodes.insert(0, start)
+    visited = set()
+    tree, total = [], 0
+    for root in nodes:  # one tree per connected component
+        if root in visited:
+            continue
+        visited.add(root)
+        queue = [(weight, root, v) for v, weight in graph.get(root, ())]
+        heapq.heapify(queue)
+        while queue:
+            weight, u, v = heapq.heappop(queue)
+            if v in visited:
+                continue  # stale entry: v joined the tree through a cheaper edge
+            visited.add(v)
+            tree.append((u, v, weight))
+            total += weight
+            for neighbor, w in graph.get(v, ()):
+                if neighbor not in visited:
+                    heapq.heappush(queue, (w, v, neighbor))
+    return total, tree
+
+
+# ================== EXAMPLE ==================
+
+def random_graph(n, edges, seed=42):
+    """Connected undirected graph: a random path through all nodes plus random edges."""
+    rng = random.Random(seed)
+    graph = {u: [] for u in range(n)}
+    order = list(range(n))
+    rng.shuffle(order)
+    pairs = list(zip(order, order[1:]))
+    pairs += [(rng.randrange(n), rng.randrange(n)) for _ in range(edges - len(pairs))]
+    for a, b in pairs:
+        weight = rng.randint(1, 10 ** 6)
+        graph[a].append((b, weight))
+        graph[b].append((a, weight))
+    return graph
+
+
+def run_benchmark(n=100_000, edges=500_000):
+    graph = random_graph(n, edges)
+    entries = 2 * edges
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22}{entries / elapsed:>14,.0f} edges/s")
+        return result
+
+    print(f"\n{n} nodes, {edges} undirected edges")
+    total_k, _ = timed("kruskal", lambda: kruskal(graph))
+    total_p, _ = timed("prim (lazy heap)", lambda: prim(graph))
+    assert total_k == total_p
+    if np is not None:
+        u = np.array([a for a, adjacent in graph.items() for _ in adjacent])
+        v = np.array([b for adjacent in graph.values() for b, _ in adjacent])
+        w = np.array([c for adjacent in graph.values() for _, c in adjacent])
+        total_a, _ = timed("kruskal_arrays", lambda: kruskal_arrays(n, u, v, w))
+        assert total_a == total_k
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+    print("Kruskal:", kruskal(graph))
+    print("Prim:   ", prim(graph, 'A'))
+
+    run_benchmark()
@@ -0,0 +1,228 @@
+"""
+Memoization Framework for Dynamic Programming
+---------------------------------------------
+
+🔎 What is it?
+- Top-down DP caches the answer of every subproblem (memoization).
+- A mutable default argument (def f(n, memo={})) works, but the cache
+  lives forever, grows forever and is shared by every caller and thread.
+
+⚡ What @memoize adds:
+1. Bounded size: least recently used entries are evicted (LRU).
+2. Thread safety: the cache is guarded by a lock.
+3. Optional disk store: expensive results survive restarts (DiskStore).
+4. Recursion-free mode: write the function as a generator that *yields*
+   its subproblems; an explicit stack runs it, so deep DPs never hit
+   Python's recursion limit.
+5. Statistics: hits, misses, evictions (cache_info()).
+
+Example (recursion-free):
+
+    @memoize(maxsize=1024)
+    def fib(n):
+        if n <= 1:
+            return n
+        a = yield n - 1        # "call" fib(n - 1)
+        b = yield n - 2        # "call" fib(n - 2)
+        return a + b
+
+A yielded tuple is the argument list of the subproblem; any other
+value is its single argument.
+
+📊 Complexity:
+- Lookup/insert/evict: O(1) (OrderedDict).
+- Memory: O(maxsize) in memory, unbounded on disk.
+"""
+
+import inspect
+import shelve
+import threading
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions disk_hits currsize maxsize")
+
+_MISSING = object()
+
+
+class _KwargsMark:
+    """Separates args from kwargs in cache keys; stable repr for DiskStore."""
+
+    def __repr__(self):
+        return "<kwargs>"
+
+
+_KWARGS = _KwargsMark()
+
+
+# -------------------------------
+# Disk-backed second level store
+# -------------------------------
+class DiskStore:
+    """Persistent key-value store (shelve) for expensive subproblems."""
+
+    def __init__(self, path):
+        self.path = path
+        self._shelf = shelve.open(path)
+
+    def get(self, key, default=None):
+        return self._shelf.get(repr(key), default)
+
+    def put(self, key, value):
+        self._shelf[repr(key)] = value
+
+    def clear(self):
+        self._shelf.clear()
+
+    def close(self):
+        self._shelf.close()
+
+
+# -------------------------------
+# Bounded, thread-safe LRU cache
+# -------------------------------
+class LRUCache:
+    def __init__(self, maxsize=128, store=None):
+        self.maxsize = maxsize  # None means unbounded
+        self.store = store
+        self.data = OrderedDict()
+        self.lock = threading.RLock()
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def get(self, key):
+        """Return the cached value or _MISSING."""
+        with self.lock:
+            value = self.data.get(key, _MISSING)
+            if value is not _MISSING:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return value
+            if self.store is not None:
+                value = self.store.get(key, _MISSING)
+                if value is not _MISSING:
+                    self.disk_hits += 1
+                    self._insert(key, value)
+                    return value
+            self.misses += 1
+            return _MISSING
+
+    def put(self, key, value):
+        with self.lock:
+            self._insert(key, value)
+            if self.store is not None:
+                self.store.put(key, value)
+
+    def _insert(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)  # least recently used
+            self.evictions += 1
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.disk_hits, len(self.data), self.maxsize)
+
+    def clear(self):
+        """Forget every entry, in memory and in the attached store."""
+        with self.lock:
+            self.data.clear()
+            if self.store is not None:
+                self.store.clear()
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+
+def _make_key(args, kwargs):
+    if kwargs:
+        return args + (_KWARGS,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+# -------------------------------
+# The decorator
+# -------------------------------
+def memoize(maxsize=128, store=None):
+    """
+    Cache a function's results per argument list.
+
+    :param maxsize: max entries kept in memory (None = unbounded)
+    :param store: optional DiskStore used as a persistent second level
+    :return: decorator; the wrapped function gains cache_info() and cache_clear()
+             (cache_clear() empties the store too)
+    """
+    def decorator(fn):
+        cache = LRUCache(maxsize, store)
+
+        if inspect.isgeneratorfunction(fn):
+            @wraps(fn)
+            def wrapper(*args):
+                return _run_iterative(fn, cache, args)
+        else:
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                value = cache.get(key)
+                if value is _MISSING:
+                    value = fn(*args, **kwargs)
+                    cache.put(key, value)
+                return value
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def _run_iterative(fn, cache, args):
+    """Evaluate a generator-style DP with an explicit stack (no recursion)."""
+    value = cache.get(args)
+    if value is not _MISSING:
+        return value
+
+    stack = [(args, fn(*args))]
+    sent = None
+    while stack:
+        key, gen = stack[-1]
+        try:
+            sub = gen.send(sent)
+        except StopIteration as done:
+            stack.pop()
+            sent = done.value
+            cache.put(key, sent)
+            continue
+
+        sub = sub if isinstance(sub, tuple) else (sub,)
+        sent = cache.get(sub)
+        if sent is _MISSING:
+            # Subproblem not solved yet: suspend the caller and solve it first
+            stack.append((sub, fn(*sub)))
+            sent = None
+    return sent
+
+
+# -------------------------------
+# Example usage
+# -------------------------------
+if __name__ == "__main__":
+    @memoize(maxsize=1024)
+    def fib(n):
+        if n <= 1:
+            return n
+        a = yield n - 1
+        b = yield n - 2
+        return a + b
+
+    @memoize(maxsize=None)
+    def grid_paths(rows, cols):
+        """Number of right/down paths in a rows x cols grid (plain recursion)."""
+        if rows == 1 or cols == 1:
+            return 1
+        return grid_paths(rows - 1, cols) + grid_paths(rows, cols - 1)
+
+    print("fib(100):", fib(100))
+    print("fib(20000) has", fib(20000).bit_length(), "bits (no RecursionError)")
+    print("fib cache:", fib.cache_info())
+    print("grid_paths(10, 10):", grid_paths(10, 10))
+    print("grid_paths cache:", grid_paths.cache_info())
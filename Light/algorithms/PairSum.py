@@ -0,0 +1,273 @@
+# --------------------------------------
+# Pair Sum and k-Sum on Unsorted Data
+# --------------------------------------
+# two_pointers_sum() in TwoPointer.py needs a sorted list. After a match it
+# moves both pointers, so runs of equal values are reported by position:
+# [1, 1, 1, 9, 9] with target 10 gives (1, 9) twice and the other 4 index
+# pairs are never seen.
+#
+# This module answers the same question for unsorted event data:
+#   1. Hash (single pass): for every x, look up target - x among the values
+#      seen so far. O(n), no sorting needed.
+#   2. Duplicates handled explicitly: unique value pairs (x + x needs two
+#      copies of x), or every index pair, or just the count.
+#   3. k-sum (3-sum, 4-sum): sort once, fix the smallest values one by one
+#      and finish with two pointers. Duplicate values are skipped, and a
+#      branch stops early when even its smallest or largest possible sum
+#      cannot reach the target.
+#   4. Many targets at once (NumPy): complements of all unique values for a
+#      block of targets, looked up with one searchsorted call.
+#   5. Streaming: pairs are reported as soon as their second element arrives.
+#
+# Complexity:
+#   - pairs: O(n) time and space
+#   - k-sum: O(n^(k-1)) time after an O(n log n) sort
+#   - many targets: O(T * u log u) for T targets and u unique values
+# --------------------------------------
+
+import random
+import time
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # pairs_for_targets falls back to one hash pass per target
+    np = None
+
+try:
+    from .TwoPointer import two_pointers_sum
+except ImportError:  # run as a script
+    from TwoPointer import two_pointers_sum
+
+
+# --------------------------------------
+# Hash-based pairs (unsorted input)
+# --------------------------------------
+def pair_sum(values, target):
+    """
+    Unique value pairs (a, b), a <= b, with a + b == target.
+
+    :param values: any iterable of numbers, unsorted, duplicates allowed
+    :return: list of pairs sorted by a
+    """
+    seen = set()
+    found = set()
+    for x in values:
+        y = target - x
+        if y in seen:  # x == y only matches if an earlier copy of x exists
+            found.add((y, x) if y <= x else (x, y))
+        seen.add(x)
+    return sorted(found)
+
+
+def pair_indices(values, target):
+    """
+    Every index pair (i, j), i < j, with values[i] + values[j] == target.
+    The output can hold up to n^2 / 4 pairs when values repeat.
+    """
+    positions = defaultdict(list)
+    result = []
+    for j, x in enumerate(values):
+        for i in positions.get(target - x, ()):
+            result.append((i, j))
+        positions[x].append(j)
+    return result
+
+
+def count_pairs(values, target):
+    """Number of index pairs i < j with values[i] + values[j] == target, O(n)."""
+    seen = Counter()
+    total = 0
+    for x in values:
+        total += seen[target - x]
+        seen[x] += 1
+    return total
+
+
+def two_sum_sorted(arr, target):
+    """
+    two_pointers_sum() that skips whole runs of equal values after a match,
+    so each value pair is reported exactly once.
+    """
+    left, right = 0, len(arr) - 1
+    pairs = []
+    while left < right:
+        current_sum = arr[left] + arr[right]
+        if current_sum == target:
+            pairs.append((arr[left], arr[right]))
+            a, b = arr[left], arr[right]
+            while left < right and arr[left] == a:
+                left += 1
+            while left < right and arr[right] == b:
+                right -= 1
+        elif current_sum < target:
+            left += 1
+        else:
+            right -= 1
+    return pairs
+
+
+# --------------------------------------
+# k-sum with pruning
+# --------------------------------------
+def k_sum(values, target, k):
+    """
+    Unique value k-tuples (sorted ascending) that add up to target.
+
+    :param values: unsorted numbers, duplicates allowed
+    :param k: tuple size, k >= 2
+    :return: list of tuples in lexicographic order
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    arr = sorted(values)
+    result = []
+    # Explicit stack of (start, k left, target left, prefix)
+    stack = [(0, k, target, ())]
+    while stack:
+        start, k_left, rest, prefix = stack.pop()
+        n = len(arr)
+        if n - start < k_left:
+            continue
+        # Prune: the k_left smallest / largest remaining values bound the sum
+        if sum(arr[start:start + k_left]) > rest or sum(arr[n - k_left:]) < rest:
+            continue
+        if k_left == 2:
+            result.extend(prefix + pair for pair in two_sum_sorted(arr[start:], rest))
+            continue
+        branches = []
+        for i in range(start, n - k_left + 1):
+            if i > start and arr[i] == arr[i - 1]:
+                continue  # same first value -> same tuples
+            x = arr[i]
+            if x * k_left > rest and x >= 0:
+                break  # every later branch only gets larger
+            branches.append((i + 1, k_left - 1, rest - x, prefix + (x,)))
+        stack.extend(reversed(branches))  # pop in ascending order
+    return result
+
+
+def three_sum(values, target=0):
+    return k_sum(values, target, 3)
+
+
+def four_sum(values, target=0):
+    return k_sum(values, target, 4)
+
+
+# --------------------------------------
+# Many targets (NumPy)
+# --------------------------------------
+def pairs_for_targets(values, targets, block=256):
+    """
+    pair_sum() for every target, answered together.
+
+    :param values: numbers (unsorted, duplicates allowed)
+    :param targets: iterable of targets
+    :param block: targets handled per vectorized step (bounds memory to
+                  block * unique values)
+    :return: dict target -> list of (a, b) pairs, a <= b
+    """
+    targets = list(targets)
+    if np is None:
+        values = list(values)
+        return {t: pair_sum(values, t) for t in targets}
+
+    unique, counts = np.unique(np.asarray(values), return_counts=True)
+    result = {}
+    if len(unique) == 0:
+        return {t: [] for t in targets}
+    twice = counts >= 2
+    for lo in range(0, len(targets), block):
+        chunk = np.asarray(targets[lo:lo + block])
+        complement = chunk[:, None] - unique[None, :]
+        pos = np.minimum(np.searchsorted(unique, complement), len(unique) - 1)
+        # a <= b, and a == b only if the value occurs at least twice
+        hit = (unique[pos] == complement) & (
+            (unique[None, :] < complement) | ((unique[None, :] == complement) & twice[None, :]))
+        for row, t in enumerate(targets[lo:lo + block]):
+            cols = np.flatnonzero(hit[row])
+            result[t] = list(zip(unique[cols].tolist(), complement[row, cols].tolist()))
+    return result
+
+
+# --------------------------------------
+# Streaming
+# --------------------------------------
+class PairStream:
+    """Reports each new value pair as soon as its second element arrives."""
+
+    def __init__(self, targets):
+        self.targets = tuple(targets)
+        self.seen = set()
+        self.reported = set()
+
+    def push(self, x):
+        """
+        :return: list of (target, a, b) pairs completed by x
+        """
+        new = []
+        for t in self.targets:
+            y = t - x
+            if y in self.seen:
+                key = (t, y, x) if y <= x else (t, x, y)
+                if key not in self.reported:
+                    self.reported.add(key)
+                    new.append(key)
+        self.seen.add(x)
+        return new
+
+    def feed(self, stream):
+        """Generator over push() for a whole stream."""
+        for x in stream:
+            yield from self.push(x)
+
+
+# --------------------------------------
+# Example usage
+# --------------------------------------
+def run_benchmark(n=200_000, targets=1000, seed=42):
+    rng = random.Random(seed)
+    values = [rng.randrange(n) for _ in range(n)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<40}{time.perf_counter() - start:>8.3f} s")
+        return result
+
+    print(f"\n{n} unsorted values")
+    timed("sorted() + two_pointers_sum", lambda: two_pointers_sum(sorted(values), n))
+    expected = timed("pair_sum (hash, one pass)", lambda: pair_sum(values, n))
+    timed("count_pairs", lambda: count_pairs(values, n))
+    assert two_sum_sorted(sorted(values), n) == expected
+
+    small = values[:2000]
+    timed("three_sum, 2000 values", lambda: three_sum(small, n))
+    timed("four_sum, 300 values", lambda: four_sum(small[:300], n))
+
+    goals = [rng.randrange(2 * n) for _ in range(targets)]
+    subset = values[:20_000]
+    loop = timed(f"pair_sum x {targets} targets, 20000 values", lambda: {t: pair_sum(subset, t) for t in goals})
+    batch = timed(f"pairs_for_targets, {targets} targets", lambda: pairs_for_targets(subset, goals))
+    assert batch == loop
+
+    stream = PairStream([n])
+    timed("PairStream, one target", lambda: sum(1 for _ in stream.feed(values)))
+
+
+if __name__ == "__main__":
+    events = [4, 1, 9, 1, 6, 5, 5, 3, 7, 9, 1]
+    print("Values:", events)
+    print("pair_sum(10):", pair_sum(events, 10))
+    print("count_pairs(10):", count_pairs(events, 10))
+    print("three_sum(15):", three_sum(events, 15))
+    print("four_sum(20):", four_sum(events, 20))
+    print("pairs_for_targets([6, 10]):", pairs_for_targets(events, [6, 10]))
+
+    stream = PairStream([10])
+    for x in events:
+        for hit in stream.push(x):
+            print(f"  arrived {x}: pair {hit[1:]} sums to {hit[0]}")
+
+    run_benchmark()
@@ -0,0 +1,252 @@
+"""
+Parallel MergeSort with Shared Memory
+-------------------------------------
+
+Problem: sort tens of millions of numeric keys using every CPU core.
+
+🔎 Idea:
+- mergesort() runs on one core and works on a list of Python objects.
+- Here the keys live in a flat numeric buffer (array.array or NumPy array)
+  placed in multiprocessing.shared_memory, so workers read and write
+  it directly. Only buffer names and index ranges go through the pool,
+  the elements are never pickled.
+
+⚡ Two phases:
+1. Chunk sort: the buffer is cut into one chunk per worker and every
+   worker sorts its chunk in place.
+2. Merge tree: neighbouring runs are merged level by level, ping-ponging
+   between two shared buffers. Each merge is cut into equal-sized pieces
+   with merge-path partitioning (a binary search on the output diagonal),
+   so all workers stay busy even when only one pair of runs is left.
+
+📊 Complexity:
+- Work: O(n log n), span: O((n / p) log n + log p * n / p) for p workers.
+- Memory: 2 shared buffers of n items.
+
+🎯 Use Cases:
+- Large numeric sorts (IDs, timestamps, measurements) on multi-core machines.
+"""
+
+import array
+import heapq
+import os
+import random
+import time
+from multiprocessing import Pool, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # pure Python fallback uses array.array
+    np = None
+
+
+# -------------------------
+# Shared buffers
+# -------------------------
+_attached = {}  # name -> SharedMemory, per process (kept open between tasks)
+
+
+def _view(name, typecode, n):
+    """Typed view of a shared buffer (NumPy array if available, else memoryview)."""
+    shm = _attached.get(name)
+    if shm is None:
+        shm = _attached[name] = shared_memory.SharedMemory(name=name)
+    if np is not None:
+        return np.ndarray((n,), dtype=typecode, buffer=shm.buf)
+    return shm.buf.cast("B").cast(typecode)[:n]
+
+
+def _detach_all():
+    for shm in _attached.values():
+        shm.close()
+    _attached.clear()
+
+
+# -------------------------
+# Worker tasks
+# -------------------------
+def _sort_chunk(task):
+    name, typecode, n, lo, hi = task
+    data = _view(name, typecode, n)
+    if np is not None:
+        data[lo:hi].sort()
+    else:
+        data[lo:hi] = array.array(typecode, sorted(data[lo:hi]))
+        data.release()
+
+
+def _merge_piece(task):
+    """Merge src[a_lo:a_hi] and src[b_lo:b_hi] into dst starting at out_lo."""
+    src_name, dst_name, typecode, n, a_lo, a_hi, b_lo, b_hi, out_lo = task
+    src = _view(src_name, typecode, n)
+    dst = _view(dst_name, typecode, n)
+    out_hi = out_lo + (a_hi - a_lo) + (b_hi - b_lo)
+
+    if np is not None:
+        a, b = src[a_lo:a_hi], src[b_lo:b_hi]
+        # Final position of every item; ties keep a before b (stable)
+        out = dst[out_lo:out_hi]
+        out[np.arange(len(a)) + np.searchsorted(b, a, "left")] = a
+        out[np.arange(len(b)) + np.searchsorted(a, b, "right")] = b
+    else:
+        dst[out_lo:out_hi] = array.array(
+            typecode, heapq.merge(src[a_lo:a_hi], src[b_lo:b_hi]))
+        src.release()
+        dst.release()
+
+
+def merge_path_split(data, a_lo, a_hi, b_lo, b_hi, diagonal):
+    """
+    How many items of run A are among the first `diagonal` outputs
+    of the stable merge of A = data[a_lo:a_hi] and B = data[b_lo:b_hi].
+    """
+    m, n = a_hi - a_lo, b_hi - b_lo
+    lo, hi = max(0, diagonal - n), min(diagonal, m)
+    while lo < hi:
+        i = (lo + hi) // 2
+        # A[i] <= B[diagonal - i - 1] means A[i] is output first: take more of A
+        if data[a_lo + i] <= data[b_lo + diagonal - i - 1]:
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+
+# -------------------------
+# Parallel sort
+# -------------------------
+def _same_kind(result, typecode):
+    """Back to array.array(typecode) if the input was one (bytes are unchanged)."""
+    if typecode is None or isinstance(result, array.array):
+        return result
+    return array.array(typecode, result.tobytes())
+
+
+def parallel_sort(data, workers=None):
+    """
+    Sort a flat numeric buffer using a pool of processes.
+
+    :param data: array.array, or 1-D NumPy array when NumPy is installed
+    :param workers: number of processes (default: os.cpu_count())
+    :return: new sorted array of the same kind
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(data)
+    # array.array in, array.array out (NumPy is only used as the working view)
+    kind = data.typecode if isinstance(data, array.array) else None
+    if np is not None:
+        data = np.ascontiguousarray(data)
+        typecode = data.dtype.char
+    else:
+        typecode = data.typecode
+    itemsize = data.itemsize
+    if n < 2:
+        return _same_kind(data.copy() if np is not None else array.array(typecode, data), kind)
+
+    bufs = [shared_memory.SharedMemory(create=True, size=n * itemsize)
+            for _ in range(2)]
+    pool = Pool(workers) if workers > 1 else None
+    run_tasks = pool.map if pool is not None else lambda fn, tasks: list(map(fn, tasks))
+    try:
+        src_name, dst_name = bufs[0].name, bufs[1].name
+        bufs[0].buf[:n * itemsize] = memoryview(data).cast("B")
+
+        # Phase 1: one sorted chunk per worker
+        bounds = [n * i // workers for i in range(workers + 1)]
+        bounds = sorted(set(bounds))
+        run_tasks(_sort_chunk, [(src_name, typecode, n, lo, hi)
+                                for lo, hi in zip(bounds, bounds[1:])])
+
+        # Phase 2: merge tree, every level split into ~workers pieces
+        src = _view(src_name, typecode, n)
+        while len(bounds) > 2:
+            tasks = []
+            merged = [0]
+            pairs = (len(bounds) - 1) // 2
+            pieces = max(1, workers // pairs)
+            for j in range(0, len(bounds) - 2, 2):
+                a_lo, b_lo, b_hi = bounds[j], bounds[j + 1], bounds[j + 2]
+                tasks.extend(_split_merge(src, src_name, dst_name, typecode, n,
+                                          a_lo, b_lo, b_lo, b_hi, pieces))
+                merged.append(b_hi)
+            if len(bounds) % 2 == 0:
+                # Odd run out: "merge" it with an empty run (a plain copy)
+                lo, hi = bounds[-2], bounds[-1]
+                tasks.append((src_name, dst_name, typecode, n, lo, hi, hi, hi, lo))
+                merged.append(hi)
+            run_tasks(_merge_piece, tasks)
+
+            del src
+            src_name, dst_name = dst_name, src_name
+            src = _view(src_name, typecode, n)
+            bounds = merged
+
+        if np is not None:
+            result = src.copy()
+        else:
+            result = array.array(typecode, src)
+            src.release()
+        del src
+        return _same_kind(result, kind)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        _detach_all()
+        for shm in bufs:
+            shm.close()
+            shm.unlink()
+
+
+def _split_merge(src, src_name, dst_name, typecode, n, a_lo, a_hi, b_lo, b_hi, pieces):
+    """Cut the merge of two runs into `pieces` tasks of equal output size."""
+    total = (a_hi - a_lo) + (b_hi - b_lo)
+    tasks = []
+    prev_i, prev_d = 0, 0
+    for p in range(1, pieces + 1):
+        d = total * p // pieces
+        i = merge_path_split(src, a_lo, a_hi, b_lo, b_hi, d)
+        if d > prev_d:
+            tasks.append((src_name, dst_name, typecode, n,
+                          a_lo + prev_i, a_lo + i,
+                          b_lo + prev_d - prev_i, b_lo + d - i,
+                          a_lo + prev_d))
+        prev_i, prev_d = i, d
+    return tasks
+
+
+# ================== EXAMPLE ==================
+
+def make_keys(n, seed=42):
+    rng = random.Random(seed)
+    keys = array.array("q", (rng.randrange(-2 ** 62, 2 ** 62) for _ in range(n)))
+    return np.frombuffer(keys, dtype=np.int64).copy() if np is not None else keys
+
+
+def run_benchmark(n=1_000_000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    data = make_keys(n)
+    expected = sorted(data)
+
+    start = time.perf_counter()
+    sorted(data)
+    baseline = time.perf_counter() - start
+    print(f"\nBenchmark, n = {n}, sorted() on one core: {baseline:.2f} s")
+
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    single = None
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = parallel_sort(data, workers)
+        elapsed = time.perf_counter() - start
+        assert list(result) == expected
+        single = single or elapsed
+        print(f"{workers:>8}{elapsed:>10.2f}{single / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    arr = array.array("d", [3.5, -1.0, 8.25, 0.0, 2.0, 7.5, -4.0])
+    print("Original:", list(arr))
+    print("Parallel sorted (2 workers):", list(parallel_sort(arr, workers=2)))
+
+    run_benchmark()
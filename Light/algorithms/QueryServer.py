@@ -0,0 +1,415 @@
+"""
+Async Query Server (micro-batching + process pool)
+--------------------------------------------------
+
+Problem:
+- astar(), dijkstra() and binary_search() are CPU-bound. Called from an
+  asyncio handler they block the event loop, and every other request
+  waits behind them.
+
+🔎 Idea:
+- Handlers `await server.astar(...)`; the query only goes into a bounded
+  asyncio.Queue together with a Future.
+- One batcher task takes the first waiting query, keeps collecting for
+  `window` seconds (or until `max_batch` queries) and ships the whole batch
+  to a ProcessPoolExecutor in a single round trip.
+- Graphs, mazes and sorted arrays are loaded once per worker by the pool
+  initializer: a query only carries a dataset name and its arguments.
+- Inside a batch, identical queries run once, and dijkstra() results are
+  shared by every query with the same source (each caller still gets its
+  own copy of the result).
+
+⚡ Backpressure, cancellation, deadlines:
+- At most `max_pending` queries wait in the queue: `await query()` then
+  waits for room, `query_nowait()` raises asyncio.QueueFull.
+- At most `max_inflight` batches are in the pool; the batcher stops
+  pulling from the queue until one comes back.
+- A query with a `timeout` raises TimeoutError when its deadline passes.
+  Cancelled and expired queries still in the queue are dropped before
+  dispatch, so they cost no worker time.
+
+📊 Cost per batch: one pickle round trip instead of one per query.
+
+🎯 Use Cases:
+- Serving pathfinding / lookup endpoints from an async web framework.
+"""
+
+import asyncio
+import copy
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .AStar import astar
+    from .BIG_O import binary_search
+    from .Djstrika import dijkstra
+except ImportError:  # run as a script
+    from AStar import astar
+    from BIG_O import binary_search
+    from Djstrika import dijkstra
+
+
+# -------------------------------
+# Worker side (runs in the pool)
+# -------------------------------
+_datasets = {}  # name -> graph / maze / sorted list, per worker process
+
+
+def _init_worker(datasets):
+    _datasets.clear()
+    _datasets.update(datasets)
+
+
+def _run_query(op, data, args, shortest):
+    if op == "astar":
+        return astar(data, *args)
+    if op == "binary_search":
+        return binary_search(data, *args)
+    if op == "dijkstra":
+        source = args[0]
+        if source not in shortest:
+            shortest[source] = dijkstra(data, source)
+        distances = shortest[source]
+        return distances if len(args) == 1 else distances[args[1]]
+    raise ValueError(f"unknown operation {op!r}")
+
+
+def _run_batch(batch):
+    """
+    :param batch: list of (op, dataset name, args)
+    :return: list of (True, result) or (False, exception), in order
+    """
+    results = []
+    done = {}
+    shortest = {}  # (dataset) -> {source: distances} for this batch
+    for op, name, args in batch:
+        key = (op, name, args)
+        try:
+            outcome = done.get(key)
+        except TypeError:  # unhashable arguments: run it, without dedup
+            key = outcome = None
+        if outcome is None:
+            try:
+                outcome = (True, _run_query(op, _datasets[name], args, shortest.setdefault(name, {})))
+            except Exception as error:  # reported to the caller, the batch goes on
+                outcome = (False, error)
+            if key is not None:
+                done[key] = outcome
+        results.append(outcome)
+    return results
+
+
+# -------------------------------
+# Event-loop side
+# -------------------------------
+class QueryServer:
+    """
+    async with QueryServer({"city": graph, "level1": maze}) as server:
+        path = await server.astar("level1", (0, 0), (9, 9), timeout=0.5)
+        dist = await server.dijkstra("city", "A", "D")
+    """
+
+    def __init__(self, datasets, workers=None, window=0.002, max_batch=64,
+                 max_pending=1024, max_inflight=None):
+        """
+        :param datasets: dict name -> graph (dijkstra), maze (astar) or sorted list (binary_search)
+        :param window: seconds the batcher waits for more queries after the first
+        :param max_batch: queries per batch
+        :param max_pending: bound of the query queue
+        :param max_inflight: batches in the pool at once (default 2 per worker)
+        """
+        self.datasets = datasets
+        self.workers = workers or os.cpu_count() or 1
+        self.window = window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_inflight = max_inflight or 2 * self.workers
+        self.batches = 0
+        self.dropped = 0  # cancelled or expired before dispatch
+        self._pool = None
+        self._queue = None
+        self._batcher = None
+
+    async def start(self):
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                         initargs=(self.datasets,))
+        self._queue = asyncio.Queue(self.max_pending)
+        self._slots = asyncio.Semaphore(self.max_inflight)
+        self._tasks = set()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        return self
+
+    async def close(self):
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, *self._tasks, return_exceptions=True)
+            self._batcher = None
+        while self._queue is not None and not self._queue.empty():
+            future = self._queue.get_nowait()[3]
+            if not future.done():
+                future.cancel()
+        self._queue = None  # later queries raise instead of waiting forever
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ---------------------------
+    # Submitting queries
+    # ---------------------------
+    def _item(self, op, dataset, args, timeout):
+        if self._queue is None:
+            raise RuntimeError("server closed")
+        if dataset not in self.datasets:
+            raise KeyError(dataset)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        return (op, dataset, args, loop.create_future(), deadline)
+
+    async def query(self, op, dataset, *args, timeout=None):
+        """Queue one query (waiting while the queue is full) and await its result."""
+        item = self._item(op, dataset, args, timeout)
+        return await self._await(item, self._queue.put(item))
+
+    async def query_nowait(self, op, dataset, *args, timeout=None):
+        """Like query(), but raises asyncio.QueueFull instead of waiting for room."""
+        item = self._item(op, dataset, args, timeout)
+        self._queue.put_nowait(item)
+        return await self._await(item)
+
+    async def _await(self, item, put=None):
+        future, deadline = item[3], item[4]
+        remaining = None if deadline is None else deadline - asyncio.get_running_loop().time()
+        try:
+            async with asyncio.timeout(remaining):
+                if put is not None:
+                    await put
+                    if self._queue is None:  # closed while waiting for room
+                        raise RuntimeError("server closed")
+                return await asyncio.shield(future)
+        finally:
+            future.cancel()  # no-op when done; otherwise the batcher skips it
+
+    def astar(self, maze, start, end, timeout=None):
+        return self.query("astar", maze, start, end, timeout=timeout)
+
+    def dijkstra(self, graph, source, target=None, timeout=None):
+        args = (source,) if target is None else (source, target)
+        return self.query("dijkstra", graph, *args, timeout=timeout)
+
+    def binary_search(self, arr, target, timeout=None):
+        return self.query("binary_search", arr, target, timeout=timeout)
+
+    # ---------------------------
+    # Batching
+    # ---------------------------
+    def _live(self, item, now):
+        future, deadline = item[3], item[4]
+        if future.done():
+            self.dropped += 1
+            return False
+        if deadline is not None and now >= deadline:
+            future.set_exception(TimeoutError())
+            self.dropped += 1
+            return False
+        return True
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                await self._slots.acquire()  # backpressure: stop pulling while the pool is busy
+                batch = [await self._queue.get()]
+                close_at = loop.time() + self.window
+                while len(batch) < self.max_batch:
+                    if self._queue.empty():
+                        remaining = close_at - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            async with asyncio.timeout(remaining):
+                                batch.append(await self._queue.get())
+                        except TimeoutError:
+                            break
+                    else:
+                        batch.append(self._queue.get_nowait())
+                now = loop.time()
+                batch = [item for item in batch if self._live(item, now)]
+                if batch:
+                    task = asyncio.create_task(self._dispatch(batch))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                else:
+                    self._slots.release()
+                batch = []
+        except asyncio.CancelledError:
+            # close() while a batch was collecting: it never reaches the pool
+            for item in batch:
+                if not item[3].done():
+                    item[3].cancel()
+            raise
+
+    async def _dispatch(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            payload = [(op, dataset, args) for op, dataset, args, _, _ in batch]
+            try:
+                results = await loop.run_in_executor(self._pool, _run_batch, payload)
+            except Exception as error:  # broken pool, unpicklable arguments, ...
+                results = [(False, error)] * len(batch)
+            self.batches += 1
+            handed_out = set()
+            for (_, _, _, future, _), (ok, value) in zip(batch, results):
+                if future.done():
+                    continue  # cancelled or timed out while running
+                if ok:
+                    # Shared results (same query, same dijkstra source) come
+                    # back as one object: every caller gets its own copy
+                    if isinstance(value, (dict, list)):
+                        if id(value) in handed_out:
+                            value = copy.copy(value)
+                        else:
+                            handed_out.add(id(value))
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+        finally:
+            self._slots.release()
+
+
+# ================== EXAMPLE ==================
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def load_test(server, make_query, clients=64, duration=2.0):
+    """
+    Closed-loop load generator: `clients` coroutines each send a query,
+    await it, and send the next one until `duration` seconds are over.
+
+    :param make_query: function(rng, server) -> awaitable query
+    :return: dict with throughput (queries/s), p50/p99 latency (ms), errors
+    """
+    latencies = []
+    errors = 0
+    loop = asyncio.get_running_loop()
+    stop = loop.time() + duration
+
+    async def client(seed):
+        nonlocal errors
+        rng = random.Random(seed)
+        while loop.time() < stop:
+            start = time.perf_counter()
+            try:
+                await make_query(rng, server)
+            except (TimeoutError, asyncio.QueueFull):
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "errors": errors,
+    }
+
+
+def example_datasets(side=16, nodes=300, seed=42):
+    # Open maze: astar() keeps equal-cost duplicates on its open list, which
+    # gets expensive on cluttered mazes; here the heuristic is exact
+    rng = random.Random(seed)
+    maze = [[0] * side for _ in range(side)]
+    graph = {i: [] for i in range(nodes)}
+    for i in range(nodes):
+        for j in rng.sample(range(nodes), 4):
+            if j != i:
+                w = rng.randint(1, 20)
+                graph[i].append((j, w))
+                graph[j].append((i, w))
+    return {"maze": maze, "graph": graph, "ids": sorted(rng.sample(range(10 * nodes), 5 * nodes))}
+
+
+def mixed_query(rng, server):
+    side = len(server.datasets["maze"])
+    kind = rng.random()
+    if kind < 0.2:
+        return server.astar("maze", (0, 0), (rng.randrange(side), rng.randrange(side)))
+    if kind < 0.6:
+        nodes = len(server.datasets["graph"])
+        return server.dijkstra("graph", rng.randrange(8), rng.randrange(nodes))
+    return server.binary_search("ids", rng.randrange(len(server.datasets["ids"]) * 2))
+
+
+async def run_benchmark(duration=2.0, clients=64):
+    datasets = example_datasets()
+    print(f"\n{clients} clients, {duration:.0f} s each, {os.cpu_count()} CPU(s)")
+    print(f"{'setup':<28}{'queries/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for label, window, max_batch in (("one query per round trip", 0.0, 1),
+                                     ("micro-batch 2 ms / 64", 0.002, 64)):
+        async with QueryServer(datasets, window=window, max_batch=max_batch) as server:
+            await server.binary_search("ids", 0)  # start the workers
+            stats = await load_test(server, mixed_query, clients, duration)
+        print(f"{label:<28}{stats['throughput']:>12.0f}{stats['p50_ms']:>10.2f}"
+              f"{stats['p99_ms']:>10.2f}{stats['errors']:>8}")
+
+    # The event loop stays responsive: a timer keeps ticking during the load
+    async with QueryServer(datasets) as server:
+        ticks = []
+
+        async def ticker():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                ticks.append(time.perf_counter() - start - 0.01)
+
+        timer = asyncio.create_task(ticker())
+        await load_test(server, mixed_query, clients, duration / 2)
+        timer.cancel()
+        print(f"event-loop lag under load: max {max(ticks) * 1000:.1f} ms")
+
+
+async def main():
+    graph = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('C', 2), ('D', 5)],
+        'C': [('A', 4), ('B', 2), ('D', 1)],
+        'D': [('B', 5), ('C', 1)]
+    }
+    maze = [
+        [0, 1, 0, 0, 0],
+        [0, 1, 0, 1, 0],
+        [0, 0, 0, 1, 0],
+        [0, 1, 0, 0, 0],
+        [0, 0, 0, 1, 0]
+    ]
+    datasets = {"graph": graph, "maze": maze, "ids": [2, 3, 5, 7, 11, 13]}
+    async with QueryServer(datasets, workers=2) as server:
+        results = await asyncio.gather(
+            server.dijkstra("graph", "A"),
+            server.dijkstra("graph", "A", "D"),
+            server.astar("maze", (0, 0), (4, 4)),
+            server.binary_search("ids", 7),
+        )
+        for result in results:
+            print(result)
+        print("batches used:", server.batches)
+
+    await run_benchmark()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,268 @@
+"""
+Radix and Counting Sort
+-----------------------
+
+Problem: sort integer keys (IDs, timestamps) or byte strings
+without comparing elements to each other.
+
+🔎 Idea:
+- Comparison sorts (quicksort, mergesort) need O(n log n) comparisons.
+- Radix sort looks at the keys digit by digit instead:
+  * LSD (least significant digit first): one stable bucket pass per digit,
+    from the lowest digit to the highest. Good for integers.
+  * MSD (most significant digit first): bucket by the first byte, then
+    sort each bucket by the next byte. Good for strings.
+- Counting sort is a single pass when the range of values is small.
+
+⚡ Integers:
+- Negative numbers: keys are shifted by the minimum (lists) or have their
+  sign bit flipped (NumPy), so every key becomes a non-negative number.
+- Passes stop at the highest bit where min and max differ: every value in
+  [min, max] shares the bits above it.
+
+📊 Complexity:
+- Counting sort: O(n + k), k = max - min + 1
+- LSD radix: O(d * (n + 2^bits)), d = number of digits
+- MSD radix: O(total bytes examined)
+
+⚠️ In pure Python the bucket loops run in the interpreter, while sorted()
+runs in C, so radix sort only pays off with NumPy (or counting sort on a
+small range). sort() below picks the engine accordingly.
+
+🎯 Use Cases:
+- Sorting IDs, timestamps, IP addresses, fixed-width codes.
+- Suffix array construction, database key sorting.
+"""
+
+import random
+import time
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # every engine has a pure Python fallback
+    np = None
+
+RADIX_MIN_N = 4096         # below this, sorted() wins anyway
+COUNTING_MAX_RANGE = 0.25  # counting sort if (max - min) <= n * this
+MSD_CUTOFF = 32            # MSD buckets smaller than this use sorted()
+
+
+# -------------------------
+# Counting sort
+# -------------------------
+def counting_sort(arr):
+    """
+    Sort integers with a count per value.
+
+    :param arr: list of ints with a small range (max - min)
+    :return: new sorted list
+    """
+    if not arr:
+        return []
+    lo = min(arr)
+    counts = [0] * (max(arr) - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+
+    result = []
+    for value, count in enumerate(counts):
+        if count:
+            result.extend([value + lo] * count)
+    return result
+
+
+# -------------------------
+# LSD radix sort (integers)
+# -------------------------
+def lsd_radix_sort(arr, bits=8):
+    """
+    Sort integers (negative and arbitrarily large ones included).
+
+    :param arr: list of ints, or a NumPy integer array
+    :param bits: digit size of the pure Python version (256 buckets for 8)
+    :return: new sorted list (or NumPy array)
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        return _np_lsd_radix_sort(arr)
+
+    result = list(arr)
+    if len(result) < 2:
+        return result
+    lo = min(result)
+    span = max(result) - lo
+    mask = (1 << bits) - 1
+
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(1 << bits)]
+        appends = [bucket.append for bucket in buckets]
+        for x in result:
+            appends[((x - lo) >> shift) & mask](x)
+        result = list(chain.from_iterable(buckets))
+        shift += bits
+    return result
+
+
+def _np_lsd_radix_sort(arr):
+    """Vectorized LSD radix sort with 16-bit digits for integer arrays."""
+    if arr.dtype.kind not in "iu":
+        raise TypeError(f"expected an integer array, got {arr.dtype}")
+    if len(arr) < 2:
+        return arr.copy()
+
+    if arr.dtype.kind == "i":
+        # Flipping the sign bit maps int64 order onto uint64 order
+        sign = np.uint64(1 << 63)
+        keys = arr.astype(np.int64).view(np.uint64) ^ sign
+    else:
+        keys = arr.astype(np.uint64)
+
+    # Bits above the highest differing bit of min and max are all equal
+    top = (int(keys.min()) ^ int(keys.max())).bit_length()
+    for shift in range(0, top, 16):
+        digit = ((keys >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        # NumPy's stable sort on 16-bit keys is itself a counting/radix pass
+        keys = keys[np.argsort(digit, kind="stable")]
+
+    if arr.dtype.kind == "i":
+        keys = (keys ^ sign).view(np.int64)
+    return keys.astype(arr.dtype)
+
+
+# -------------------------
+# Radix sort for byte strings
+# -------------------------
+def msd_radix_sort(strings):
+    """
+    Sort byte strings by bucketing on one byte position at a time.
+
+    :param strings: list of bytes
+    :return: new sorted list
+    """
+    result = []
+    # Explicit stack instead of recursion: long common prefixes would
+    # otherwise need one Python frame per byte.
+    stack = [(list(strings), 0)]
+    while stack:
+        group, depth = stack.pop()
+        if len(group) < MSD_CUTOFF:
+            result.extend(sorted(group))
+            continue
+
+        finished = []  # strings that end at this depth sort first
+        buckets = [[] for _ in range(256)]
+        for s in group:
+            if len(s) == depth:
+                finished.append(s)
+            else:
+                buckets[s[depth]].append(s)
+        result.extend(finished)
+
+        # Push in reverse so the smallest byte is processed next
+        for bucket in reversed(buckets):
+            if bucket:
+                stack.append((bucket, depth + 1))
+    return result
+
+
+def fixed_width_radix_sort(arr):
+    """
+    LSD radix sort of a NumPy fixed-width bytes array (dtype 'S<w>').
+    One stable pass per byte column, from the last column to the first.
+    """
+    width = arr.dtype.itemsize
+    if len(arr) < 2 or width == 0:
+        return arr.copy()
+    columns = np.ascontiguousarray(arr).view(np.uint8).reshape(len(arr), width)
+    order = np.arange(len(arr))
+    for col in range(width - 1, -1, -1):
+        order = order[np.argsort(columns[order, col], kind="stable")]
+    return arr[order]
+
+
+# -------------------------
+# Dispatcher
+# -------------------------
+def sort(data):
+    """
+    Sort with the engine that suits the data type and size.
+
+    - NumPy integer arrays -> vectorized LSD radix sort
+    - NumPy 'S' (fixed-width bytes) arrays -> byte-column LSD radix sort
+    - lists of ints with a small range -> counting sort
+    - lists of ints with NumPy installed -> NumPy LSD radix sort
+    - anything else -> sorted() (a comparison sort)
+
+    :return: sorted list, or sorted NumPy array for NumPy input
+    """
+    if np is not None and isinstance(data, np.ndarray):
+        if len(data) >= RADIX_MIN_N:
+            if data.dtype.kind in "iu":
+                return _np_lsd_radix_sort(data)
+            if data.dtype.kind == "S":
+                return fixed_width_radix_sort(data)
+        return np.sort(data, kind="stable")
+
+    data = list(data)
+    n = len(data)
+    if n < RADIX_MIN_N or not all(type(x) is int for x in data):
+        return sorted(data)
+
+    lo, hi = min(data), max(data)
+    if hi - lo <= n * COUNTING_MAX_RANGE:
+        return counting_sort(data)
+    if np is not None and -2 ** 63 <= lo and hi < 2 ** 63:
+        return _np_lsd_radix_sort(np.array(data, dtype=np.int64)).tolist()
+    return sorted(data)
+
+
+# ================== EXAMPLE ==================
+
+def bench(fn, data, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(n=200_000, seed=42):
+    rng = random.Random(seed)
+    cases = {
+        "ids (0..n/8)": [rng.randrange(n // 8) for _ in range(n)],
+        "timestamps": [1_700_000_000_000 + rng.randrange(10 ** 9) for _ in range(n)],
+        "int64 +/-": [rng.randrange(-2 ** 63, 2 ** 63) for _ in range(n)],
+    }
+    print(f"\nBenchmark, n = {n} (best of 3, milliseconds)")
+    print(f"{'input':<16}{'sorted()':>10}{'counting':>10}{'lsd':>10}{'numpy':>10}{'sort()':>10}")
+    for name, data in cases.items():
+        expected = sorted(data)
+        assert sort(data) == expected and lsd_radix_sort(data) == expected
+        row = f"{name:<16}{bench(sorted, data) * 1000:>10.1f}"
+        small = max(data) - min(data) <= n
+        row += f"{bench(counting_sort, data) * 1000:>10.1f}" if small else f"{'-':>10}"
+        row += f"{bench(lsd_radix_sort, data) * 1000:>10.1f}"
+        if np is not None:
+            array = np.array(data, dtype=np.int64)
+            row += f"{bench(_np_lsd_radix_sort, array) * 1000:>10.1f}"
+        else:
+            row += f"{'n/a':>10}"
+        row += f"{bench(sort, data) * 1000:>10.1f}"
+        print(row)
+
+    words = [bytes(rng.choice(b"abcdefgh") for _ in range(rng.randrange(4, 16)))
+             for _ in range(n // 4)]
+    assert msd_radix_sort(words) == sorted(words)
+    print(f"\n{len(words)} byte strings: sorted() {bench(sorted, words) * 1000:.1f} ms, "
+          f"msd_radix_sort() {bench(msd_radix_sort, words) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    numbers = [170, -45, 75, -90, 802, 24, 2, 66]
+    print("LSD radix sort:", lsd_radix_sort(numbers))
+    print("Counting sort:", counting_sort([3, 1, 2, 3, 0, 1]))
+    print("MSD radix sort:", msd_radix_sort([b"banana", b"apple", b"app", b"cherry"]))
+
+    run_benchmark()
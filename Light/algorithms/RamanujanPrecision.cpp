@@ -20,9 +20,6 @@ n!=Γ(n+1). After summing the desired number of terms, the result is multiplied
 
 Because of its very fast convergence, this algorithm is much more efficient than classical series for π and historically influenced modern high-precision π algorithms such as the Chudnovsky method.
 */
-	​
-
-	​
 
 #include <iostream>
 #include <cmath>
@@ -30,25 +27,25 @@ Because of its very fast convergence, this algorithm is much more efficient than
 long double cal_pi_ramanujan(int terms) {
     long double sum = 0.0L;
 
-    for (int k = 0; k < teros; k++) {
+    for (int k = 0; k < terms; k++) {
         long double numerador =
             tgammal(4 * k + 1) * (26390.0L * k + 1103.0L);
 
         long double denominador =
             powl(tgammal(k + 1), 4) * powl(396.0L, 4 * k);
 
-        som += numerador / denominador;
+        sum += numerador / denominador;
     }
 
     long double fator = (2.0L * sqrtl(2.0L)) / (99.0L * 99.0L);
-    long double inv_pi = fator * som;
+    long double inv_pi = fator * sum;
 
     return 1.0L / inv_pi;
 }
 
 int main() {
     int terms = 5; // 5 já é bastante!
-    long double pi = calcular_pi_ramanujan(terms);
+    long double pi = cal_pi_ramanujan(terms);
 
     std::cout.precision(20);
     std::cout << "Pi ≈ " << pi << std::endl;
@@ -0,0 +1,305 @@
+"""
+Per-Client Rate Limiters (Sliding Window at Scale)
+--------------------------------------------------
+
+Problem:
+- max_requests_in_window() (SlidingWindow.py) finds the busiest window of
+  one offline list. A real DDoS guard must decide *online*, for every
+  request of millions of clients, "is this client over its limit?".
+
+🔎 Three classic limiters, all keyed by client:
+1. Sliding window log: keep the timestamps of the last `limit` accepted
+   requests. Exact, but memory grows with the limit.
+2. Sliding window counter: keep only the count of the current and of the
+   previous fixed window, and weight the previous one by how much of it
+   still overlaps the sliding window. Approximate, O(1) memory per client.
+3. Token bucket: tokens refill at `rate` per second up to `burst`;
+   each request takes one. Allows short bursts, O(1) memory per client.
+
+⚡ Keeping millions of keys cheap:
+- Numeric state lives in typed arrays (array('d')), one slot per client;
+  a dict maps the client key to its slot. No per-client Python object.
+- Idle clients expire lazily: keys are kept in least-recently-seen order,
+  and whenever a new client arrives the oldest idle ones are recycled.
+  Each limiter expires a key only when its state is back to "fresh",
+  so expiry never changes a decision.
+- allow_many(events) checks a batch of (key, timestamp) events. TokenBucket
+  hoists the loop-invariant lookups out of its loop; the window limiters
+  simply call allow() per event.
+
+📊 Complexity:
+- allow(): amortized O(1) (log: amortized O(1), O(limit) memory per key)
+
+🎯 Use Cases:
+- API gateways, login throttling, abuse / DDoS detection.
+"""
+
+import math
+import random
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+
+
+# -------------------------------
+# Keyed slots with lazy expiry
+# -------------------------------
+class _SlotTable:
+    """Maps keys to slots in typed columns; recycles slots of idle keys."""
+
+    def __init__(self, columns, idle_ttl):
+        self.idle_ttl = idle_ttl
+        self.slots = OrderedDict()  # key -> slot, least recently seen first
+        self.columns = [array("d") for _ in range(columns)]
+        self.last_seen = array("d")
+        self.free = []
+
+    def lookup(self, key, now):
+        """Return (slot, is_new) for key and mark it as seen at `now`."""
+        slots = self.slots
+        slot = slots.get(key)
+        if slot is not None:
+            slots.move_to_end(key)
+            self.last_seen[slot] = now
+            return slot, False
+
+        self.expire(now)
+        if self.free:
+            slot = self.free.pop()
+            self.last_seen[slot] = now
+        else:
+            slot = len(self.last_seen)
+            self.last_seen.append(now)
+            for column in self.columns:
+                column.append(0.0)
+        slots[key] = slot
+        return slot, True
+
+    def expire(self, now):
+        """Recycle every key idle for longer than idle_ttl."""
+        slots, last_seen, limit = self.slots, self.last_seen, now - self.idle_ttl
+        while slots:
+            key, slot = next(iter(slots.items()))
+            if last_seen[slot] > limit:
+                break
+            del slots[key]
+            self.free.append(slot)
+
+    def __len__(self):
+        return len(self.slots)
+
+
+# -------------------------------
+# Base class
+# -------------------------------
+class RateLimiter(ABC):
+    @abstractmethod
+    def allow(self, key, now=None):
+        """Decide one request of `key` at time `now` (default: time.monotonic())."""
+
+    def allow_many(self, events):
+        """
+        Decide a batch of requests.
+
+        :param events: iterable of (key, timestamp), timestamps non-decreasing
+        :return: list of booleans, True = allowed
+        """
+        allow = self.allow
+        return [allow(key, now) for key, now in events]
+
+
+# -------------------------------
+# 1. Sliding window log (exact)
+# -------------------------------
+class SlidingWindowLog(RateLimiter):
+    """At most `limit` requests in any `window` seconds, exactly."""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.logs = OrderedDict()  # key -> deque of accepted timestamps
+
+    def allow(self, key, now=None):
+        if now is None:
+            now = time.monotonic()
+        logs = self.logs
+        log = logs.get(key)
+        if log is None:
+            self.expire(now)
+            log = logs[key] = deque()
+        else:
+            logs.move_to_end(key)
+
+        start = now - self.window
+        while log and log[0] <= start:
+            log.popleft()
+        if len(log) < self.limit:
+            log.append(now)
+            return True
+        return False
+
+    def expire(self, now):
+        """Drop keys whose newest accepted request left the window."""
+        logs, start = self.logs, now - self.window
+        while logs:
+            key, log = next(iter(logs.items()))
+            if log and log[-1] > start:
+                break
+            del logs[key]
+
+    def __len__(self):
+        return len(self.logs)
+
+
+# -------------------------------
+# 2. Sliding window counter (approximate)
+# -------------------------------
+class SlidingWindowCounter(RateLimiter):
+    """
+    About `limit` requests per `window` seconds, using two counters.
+    estimate = previous * (overlap of previous window) + current
+    """
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        # columns: current window id, previous count, current count
+        self.table = _SlotTable(3, idle_ttl=2 * window)
+
+    def allow(self, key, now=None):
+        if now is None:
+            now = time.monotonic()
+        window = self.window
+        slot, new = self.table.lookup(key, now)
+        ids, prev, curr = self.table.columns
+
+        wid = math.floor(now / window)
+        if new or wid > ids[slot] + 1:
+            ids[slot], prev[slot], curr[slot] = wid, 0.0, 0.0
+        elif wid == ids[slot] + 1:
+            ids[slot], prev[slot], curr[slot] = wid, curr[slot], 0.0
+
+        overlap = 1.0 - (now - wid * window) / window
+        if prev[slot] * overlap + curr[slot] < self.limit:
+            curr[slot] += 1
+            return True
+        return False
+
+    def __len__(self):
+        return len(self.table)
+
+
+# -------------------------------
+# 3. Token bucket
+# -------------------------------
+class TokenBucket(RateLimiter):
+    """`rate` requests per second on average, bursts of up to `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        # A bucket idle for burst / rate seconds is full again, like a new one
+        self.table = _SlotTable(2, idle_ttl=burst / rate)
+
+    def allow(self, key, now=None, cost=1):
+        if now is None:
+            now = time.monotonic()
+        slot, new = self.table.lookup(key, now)
+        tokens, last = self.table.columns
+
+        if new:
+            level = self.burst
+        else:
+            level = min(self.burst, tokens[slot] + (now - last[slot]) * self.rate)
+        last[slot] = now
+        if level >= cost:
+            tokens[slot] = level - cost
+            return True
+        tokens[slot] = level
+        return False
+
+    def allow_many(self, events):
+        """
+        :param events: iterable of (key, timestamp) or (key, timestamp, cost);
+                       cost defaults to 1
+        :return: list of booleans, True = allowed
+        """
+        # Same logic as allow(), with attribute lookups hoisted out of the loop
+        lookup = self.table.lookup
+        tokens, last = self.table.columns
+        rate, burst = self.rate, self.burst
+        decisions = []
+        append = decisions.append
+        for event in events:
+            key, now = event[0], event[1]
+            cost = event[2] if len(event) > 2 else 1
+            slot, new = lookup(key, now)
+            level = burst if new else min(burst, tokens[slot] + (now - last[slot]) * rate)
+            last[slot] = now
+            if level >= cost:
+                tokens[slot] = level - cost
+                append(True)
+            else:
+                tokens[slot] = level
+                append(False)
+        return decisions
+
+    def __len__(self):
+        return len(self.table)
+
+
+# ================== EXAMPLE ==================
+
+def make_events(n, clients, seconds, seed=42):
+    """n requests over `seconds`, a few heavy hitters among many clients."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        now = i * seconds / n
+        if rng.random() < 0.2:
+            key = f"bot-{rng.randrange(10)}"
+        else:
+            key = f"client-{rng.randrange(clients)}"
+        events.append((key, now))
+    return events
+
+
+def bytes_per_key(make_limiter, keys=50_000):
+    tracemalloc.start()
+    limiter = make_limiter()
+    before = tracemalloc.get_traced_memory()[0]
+    limiter.allow_many((f"client-{i}", i * 1e-6) for i in range(keys))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / keys  # includes the key strings themselves
+
+
+def run_benchmark(n=500_000, clients=100_000):
+    events = make_events(n, clients, seconds=60)
+    limiters = {
+        "window log": lambda: SlidingWindowLog(limit=100, window=10),
+        "window counter": lambda: SlidingWindowCounter(limit=100, window=10),
+        "token bucket": lambda: TokenBucket(rate=10, burst=100),
+    }
+    print(f"\n{n} requests, ~{clients} clients")
+    print(f"{'limiter':<16}{'decisions/s':>14}{'denied':>10}{'bytes/key':>12}")
+    for name, make in limiters.items():
+        limiter = make()
+        start = time.perf_counter()
+        decisions = limiter.allow_many(events)
+        elapsed = time.perf_counter() - start
+        denied = decisions.count(False)
+        print(f"{name:<16}{n / elapsed:>14,.0f}{denied:>10}{bytes_per_key(make):>12.0f}")
+
+
+if __name__ == "__main__":
+    bucket = TokenBucket(rate=1, burst=3)
+    requests = [("alice", t) for t in (0, 0.1, 0.2, 0.3, 0.4, 1.5, 1.6)]
+    print("Token bucket (1/s, burst 3):", bucket.allow_many(requests))
+
+    log = SlidingWindowLog(limit=3, window=1)
+    print("Window log (3 per second):  ", log.allow_many(requests))
+
+    run_benchmark()
@@ -0,0 +1,311 @@
+"""
+Sequence Alignment: LCS and Edit Distance
+-----------------------------------------
+
+Problems:
+- Longest Common Subsequence (LCS): longest sequence of items that
+  appears in both inputs in the same order (not necessarily contiguous).
+- Levenshtein (edit) distance: fewest insertions, deletions and
+  substitutions that turn one string into the other.
+
+🔎 Classic DP:
+- dp[i][j] = answer for a[:i] and b[:j], O(n * m) time and memory.
+- Only the previous row is needed for the *value*: O(m) memory.
+
+⚡ Faster and leaner variants:
+1. Hirschberg (linear space alignment): the middle row of the table is
+   found with one forward pass over the top half and one backward pass
+   over the bottom half. Split there and solve both halves, so the full
+   alignment needs only O(m) memory.
+   LCS is the alignment where a substitution costs 2 (as much as a delete
+   plus an insert), so the matched items are a longest common subsequence.
+2. Bit-parallel (Myers 1999 / Hyyro 2003): a whole DP column is stored
+   as bit vectors of +1/-1 deltas and updated with a few integer
+   operations per character of b. Python ints grow as needed, so strings
+   longer than a machine word work as multiword vectors automatically.
+3. Banded with early exit: if we only care whether distance <= k,
+   cells with |i - j| > k can be skipped and we stop as soon as a whole
+   row exceeds k.
+
+📊 Complexity (n = len(a), m = len(b), w = word size):
+- DP value: O(n * m) time, O(m) space
+- Hirschberg alignment: O(n * m) time, O(n + m) space
+- Bit-parallel: O(m * ceil(n / w)) time
+- Banded: O(k * min(n, m)) time
+
+🎯 Use Cases:
+- Diff tools, record linkage / deduplication, spell checking, DNA.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+SMALL_TABLE = 1024  # Hirschberg solves pieces this small with a full table
+
+
+# -------------------------------
+# Plain DP (value only, one row)
+# -------------------------------
+def levenshtein_dp(a, b):
+    """Edit distance with a single rolling row (reference implementation)."""
+    prev = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + (x != y), prev[j] + 1, cur[j - 1] + 1))
+        prev = cur
+    return prev[-1]
+
+
+# -------------------------------
+# Bit-parallel (Myers / Hyyro)
+# -------------------------------
+def _match_masks(a):
+    """peq[c] has bit i set where a[i] == c."""
+    peq = {}
+    for i, c in enumerate(a):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def levenshtein(a, b, max_distance=None):
+    """
+    Edit distance between two sequences.
+
+    :param a: str / bytes / list
+    :param b: str / bytes / list
+    :param max_distance: optional threshold; use the banded DP and
+                         return None as soon as the distance exceeds it
+    :return: int distance (or None when above max_distance)
+    """
+    if max_distance is not None:
+        return levenshtein_banded(a, b, max_distance)
+    if len(a) > len(b):
+        a, b = b, a  # shorter string in the bit vector
+    m = len(a)
+    if m == 0:
+        return len(b)
+
+    peq = _match_masks(a)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv = mask, 0  # vertical +1 / -1 deltas of the current column
+    score = m
+    for c in b:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def lcs_length(a, b):
+    """Length of the LCS, bit-parallel (Allison-Dix / Hyyro)."""
+    if len(a) > len(b):
+        a, b = b, a
+    m = len(a)
+    if m == 0:
+        return 0
+    peq = _match_masks(a)
+    mask = (1 << m) - 1
+    v = mask
+    for c in b:
+        u = v & peq.get(c, 0)
+        v = ((v + u) | (v - u)) & mask
+    return m - bin(v).count("1")  # every zero bit is one matched item
+
+
+# -------------------------------
+# Banded DP with early exit
+# -------------------------------
+def levenshtein_banded(a, b, max_distance):
+    """
+    Edit distance if it is <= max_distance, else None.
+    Only cells within max_distance of the diagonal are computed.
+    """
+    n, m, k = len(a), len(b), max_distance
+    if abs(n - m) > k:
+        return None
+    inf = k + 1
+    prev = [j if j <= k else inf for j in range(m + 1)]
+    cur = [inf] * (m + 1)
+    for i in range(1, n + 1):
+        lo, hi = max(1, i - k), min(m, i + k)
+        # Cells just outside the band must read as "too expensive"
+        cur[lo - 1] = i if lo == 1 else inf
+        if hi < m:
+            cur[hi + 1] = inf
+        x = a[i - 1]
+        best = cur[lo - 1]
+        for j in range(lo, hi + 1):
+            d = min(prev[j - 1] + (x != b[j - 1]), prev[j] + 1, cur[j - 1] + 1)
+            cur[j] = d
+            if d < best:
+                best = d
+        if best > k:
+            return None  # every path already costs more than k
+        prev, cur = cur, prev
+    return prev[m] if prev[m] <= k else None
+
+
+# -------------------------------
+# Hirschberg linear-space alignment
+# -------------------------------
+def _last_row(a, b, sub_cost):
+    """Cost of aligning all of a with every prefix of b."""
+    prev = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + (0 if x == y else sub_cost),
+                           prev[j] + 1, cur[j - 1] + 1))
+        prev = cur
+    return prev
+
+
+def _align_small(a, b, sub_cost):
+    """Full-table alignment with traceback, used for small pieces."""
+    n, m = len(a), len(b)
+    dp = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        dp[i][0] = i
+    for j in range(m + 1):
+        dp[0][j] = j
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            dp[i][j] = min(dp[i - 1][j - 1] + (0 if a[i - 1] == b[j - 1] else sub_cost),
+                           dp[i - 1][j] + 1, dp[i][j - 1] + 1)
+
+    ops = []
+    i, j = n, m
+    while i or j:
+        if i and j and dp[i][j] == dp[i - 1][j - 1] + (0 if a[i - 1] == b[j - 1] else sub_cost):
+            ops.append(("match" if a[i - 1] == b[j - 1] else "sub", a[i - 1], b[j - 1]))
+            i, j = i - 1, j - 1
+        elif i and dp[i][j] == dp[i - 1][j] + 1:
+            ops.append(("del", a[i - 1], None))
+            i -= 1
+        else:
+            ops.append(("ins", None, b[j - 1]))
+            j -= 1
+    ops.reverse()
+    return ops
+
+
+def align(a, b, sub_cost=1):
+    """
+    Optimal alignment in linear space (Hirschberg).
+
+    :param sub_cost: cost of a substitution (insert/delete cost 1)
+    :return: list of (op, item_a, item_b), op in "match", "sub", "del", "ins"
+    """
+    ops = []
+    # Explicit stack, right half pushed first so pieces come out in order
+    stack = [(a, b)]
+    while stack:
+        x, y = stack.pop()
+        if len(x) * len(y) <= SMALL_TABLE or len(x) < 2:
+            ops.extend(_align_small(x, y, sub_cost))
+            continue
+        mid = len(x) // 2
+        top = _last_row(x[:mid], y, sub_cost)
+        bottom = _last_row(x[mid:][::-1], y[::-1], sub_cost)
+        m = len(y)
+        split = min(range(m + 1), key=lambda j: top[j] + bottom[m - j])
+        stack.append((x[mid:], y[split:]))
+        stack.append((x[:mid], y[:split]))
+    return ops
+
+
+def lcs(a, b):
+    """
+    One longest common subsequence, in O(len(a) + len(b)) memory.
+
+    :return: list of the common items
+    """
+    return [x for op, x, _ in align(a, b, sub_cost=2) if op == "match"]
+
+
+# -------------------------------
+# Batch API
+# -------------------------------
+def _distance_chunk(pairs, max_distance):
+    return [levenshtein(a, b, max_distance) for a, b in pairs]
+
+
+def levenshtein_many(pairs, max_distance=None, workers=None, chunk_size=2048):
+    """
+    Edit distance of many (a, b) pairs spread over a process pool.
+
+    :param pairs: iterable of (a, b)
+    :param max_distance: optional threshold, see levenshtein()
+    :param workers: processes to use (1 = run in this process)
+    :param chunk_size: pairs sent to a worker per task
+    :return: list of distances in input order
+    """
+    pairs = list(pairs)
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    job = partial(_distance_chunk, max_distance=max_distance)
+    if workers == 1 or len(chunks) <= 1:
+        results = map(job, chunks)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(job, chunks))
+    return [d for chunk in results for d in chunk]
+
+
+# ================== EXAMPLE ==================
+
+def random_pair(rng, length, edits):
+    a = "".join(rng.choice("ACGT") for _ in range(length))
+    b = list(a)
+    for _ in range(edits):
+        b[rng.randrange(len(b))] = rng.choice("ACGT")
+    return a, "".join(b)
+
+
+def run_benchmark(seed=42):
+    rng = random.Random(seed)
+    print("\nOne pair, milliseconds")
+    print(f"{'length':>8}{'dp':>10}{'bit-par':>10}{'banded':>10}{'lcs-bit':>10}{'align':>10}")
+    for length in (64, 256, 1024):
+        a, b = random_pair(rng, length, length // 20)
+        row = f"{length:>8}"
+        for fn in (levenshtein_dp, levenshtein,
+                   lambda x, y: levenshtein(x, y, max_distance=length // 10),
+                   lcs_length, align):
+            start = time.perf_counter()
+            fn(a, b)
+            row += f"{(time.perf_counter() - start) * 1000:>10.2f}"
+        print(row)
+
+    pairs = [random_pair(rng, 32, 3) for _ in range(20_000)]
+    for workers in (1, None):
+        start = time.perf_counter()
+        levenshtein_many(pairs, workers=workers)
+        elapsed = time.perf_counter() - start
+        label = "1 process" if workers == 1 else "process pool"
+        print(f"{len(pairs)} pairs, {label}: {len(pairs) / elapsed:,.0f} pairs/s")
+
+
+if __name__ == "__main__":
+    a, b = "kitten", "sitting"
+    print(f"levenshtein({a!r}, {b!r}) =", levenshtein(a, b))
+    print("within 2 edits?", levenshtein(a, b, max_distance=2))
+    print("alignment:", align(a, b))
+
+    x, y = "ABCBDAB", "BDCABA"
+    print(f"LCS of {x!r} and {y!r}:", "".join(lcs(x, y)), f"(length {lcs_length(x, y)})")
+
+    run_benchmark()
@@ -15,8 +15,22 @@ Sliding Window approach:
 Complexity:
 - Time: O(n)
 - Space: O(1)
+
+Streaming windows (end of this file):
+- The functions above need the whole list (len(arr), arr[:k]).
+- The rolling_* generators take any iterable, even an endless one,
+  keep only the last k values (O(k) memory) and yield one result per step.
+- RollingWindow is the push version for live services: call push(x)
+  for every new value and read sum / mean / max / min / percentile.
+- Max and min use a monotonic deque: values that can never be the
+  maximum again are dropped, so each value is pushed and popped once
+  (amortized O(1) per step).
 """
 
+import bisect
+from collections import deque
+from itertools import islice
+
 def max_sum_subarray(arr, k):
     n = len(arr)
     if n < k:
@@ -34,14 +48,6 @@ def max_sum_subarray(arr, k):
     return max_sum
 
 
-# ================== EXAMPLE ==================
-
-arr = [2, 1, 5, 1, 3, 2]
-k = 3
-
-print(f"Maximum sum of a subarray of size {k}:", max_sum_subarray(arr, k))
-
-
 def longest_unique_substring(s):
     """
     Sliding window for longest substring without repeating characters.
@@ -59,9 +65,116 @@ def longest_unique_substring(s):
     return max_len
 
 
-# Example
-s = "abcabcbb"
-print("Longest substring without repeating characters:", longest_unique_substring(s))
+# ================== BYTES / STREAMING VERSION ==================
+# For raw payloads (bytes, bytearray, memoryview) the `seen` dict becomes a
+# fixed 256-entry list indexed by the byte value. Positions are stored as
+# absolute offsets, so the same table can be reused across strings and
+# chunks without clearing it: old offsets are simply < left.
+# A window of unique bytes is at most 256 long, so a streaming scan only
+# needs to remember the last 256 bytes to return the substring itself.
+
+def _scan_unique(data, last, left, offset, best_start, best_len):
+    """Core loop shared by every bytes variant; positions are offset-based."""
+    for i, b in enumerate(data, offset):
+        seen_at = last[b]
+        if seen_at >= left:
+            left = seen_at + 1
+        last[b] = i
+        if i - left + 1 > best_len:
+            best_start, best_len = left, i - left + 1
+    return left, best_start, best_len
+
+
+def longest_unique_bytes(data):
+    """
+    Longest run of non-repeating bytes.
+
+    :param data: bytes, bytearray or memoryview
+    :return: (start, length); the run is data[start:start + length]
+    """
+    _, start, length = _scan_unique(memoryview(data).cast("B"), [-1] * 256, 0, 0, 0, 0)
+    return start, length
+
+
+def longest_unique_span(s):
+    """Like longest_unique_substring(s), but returns (start, length)."""
+    if isinstance(s, (bytes, bytearray, memoryview)):
+        return longest_unique_bytes(s)
+    seen = {}
+    left = best_start = best_len = 0
+    for right, char in enumerate(s):
+        if seen.get(char, -1) >= left:
+            left = seen[char] + 1
+        seen[char] = right
+        if right - left + 1 > best_len:
+            best_start, best_len = left, right - left + 1
+    return best_start, best_len
+
+
+def longest_unique_many(items):
+    """
+    (start, length) for many byte strings, sharing one 256-entry table.
+
+    :param items: iterable of bytes-like objects
+    :return: list of (start, length)
+    """
+    last = [-1] * 256
+    base = 0
+    results = []
+    for data in items:
+        view = memoryview(data).cast("B")
+        # Offsets continue from the previous item, so no table reset is needed
+        _, start, length = _scan_unique(view, last, base, base, base, 0)
+        results.append((start - base, length))
+        base += len(view)
+    return results
+
+
+class UniqueByteStream:
+    """
+    Chunked longest_unique_bytes: feed() chunks from a file or socket.
+    State carried between chunks: the 256-entry table, the window start
+    and the last 256 bytes (enough to rebuild any unique run).
+    """
+
+    def __init__(self):
+        self.last = [-1] * 256
+        self.left = 0
+        self.offset = 0  # bytes consumed so far
+        self.start = 0
+        self.length = 0
+        self.substring = b""
+        self._tail = b""
+
+    def feed(self, chunk):
+        chunk = bytes(chunk)
+        previous = self.length
+        self.left, self.start, self.length = _scan_unique(
+            chunk, self.last, self.left, self.offset, self.start, self.length)
+
+        window = self._tail + chunk
+        window_offset = self.offset - len(self._tail)
+        if self.length > previous:
+            begin = self.start - window_offset
+            self.substring = window[begin:begin + self.length]
+        self.offset += len(chunk)
+        self._tail = window[-256:]
+        return self
+
+    @property
+    def result(self):
+        """(start, length, substring) over everything fed so far."""
+        return self.start, self.length, self.substring
+
+
+def longest_unique_in_file(path, chunk_size=1 << 20):
+    """Stream a file through UniqueByteStream: (start, length, substring)."""
+    stream = UniqueByteStream()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            stream.feed(chunk)
+    return stream.result
+
 
 """
 Real-World Sliding Window Example
@@ -92,12 +205,240 @@ def max_requests_in_window(requests, window_size):
     return max_sum
 
 
+
+# ================== STREAMING WINDOWS ==================
+
+def _check_window(k):
+    if k < 1:
+        raise ValueError("window size k must be at least 1")
+
+
+def rolling_sum(iterable, k):
+    """Yield the sum of every full window of k consecutive values."""
+    _check_window(k)
+    window = deque()
+    total = 0
+    for i, x in enumerate(iterable, 1):
+        window.append(x)
+        total += x
+        if len(window) > k:
+            total -= window.popleft()
+        if len(window) == k:
+            if i % k == 0:
+                total = sum(window)  # resync now and then: no float drift
+            yield total
+
+
+def rolling_mean(iterable, k):
+    """Yield the mean of every full window of k values."""
+    for total in rolling_sum(iterable, k):
+        yield total / k
+
+
+def _rolling_extreme(iterable, k, better):
+    _check_window(k)
+    # Deque of (index, value); values are kept in "better" order, front first
+    candidates = deque()
+    for i, x in enumerate(iterable):
+        while candidates and not better(candidates[-1][1], x):
+            candidates.pop()  # x outlives and beats these values
+        candidates.append((i, x))
+        if candidates[0][0] <= i - k:
+            candidates.popleft()  # slid out of the window
+        if i >= k - 1:
+            yield candidates[0][1]
+
+
+def rolling_max(iterable, k):
+    """Yield the maximum of every full window of k values."""
+    return _rolling_extreme(iterable, k, lambda kept, new: kept > new)
+
+
+def rolling_min(iterable, k):
+    """Yield the minimum of every full window of k values."""
+    return _rolling_extreme(iterable, k, lambda kept, new: kept < new)
+
+
+def rolling_count(iterable, k, predicate):
+    """Yield how many of the last k values satisfy predicate (e.g. errors)."""
+    return rolling_sum((1 if predicate(x) else 0 for x in iterable), k)
+
+
+def rolling_percentile(iterable, k, q):
+    """
+    Yield the q-th percentile (0..100, nearest rank) of every full window.
+    The window is kept sorted: O(log k) search plus one C-level memmove.
+    """
+    _check_window(k)
+    window = deque()
+    ordered = []
+    rank = min(k - 1, max(0, int(round(q / 100 * (k - 1)))))
+    for x in iterable:
+        window.append(x)
+        bisect.insort(ordered, x)
+        if len(window) > k:
+            del ordered[bisect.bisect_left(ordered, window.popleft())]
+        if len(window) == k:
+            yield ordered[rank]
+
+
+def rolling_percentile_approx(iterable, k, q, lo, hi, bins=100):
+    """
+    Approximate percentile with a fixed histogram over [lo, hi).
+    O(1) update and O(bins) query, error is at most one bin width.
+    """
+    _check_window(k)
+    width = (hi - lo) / bins
+    counts = [0] * bins
+    window = deque()
+    rank = min(k - 1, max(0, int(round(q / 100 * (k - 1)))))  # same rank as above
+
+    def bucket(x):
+        return min(bins - 1, max(0, int((x - lo) / width)))
+
+    for x in iterable:
+        window.append(x)
+        counts[bucket(x)] += 1
+        if len(window) > k:
+            counts[bucket(window.popleft())] -= 1
+        if len(window) == k:
+            seen = 0
+            for b, c in enumerate(counts):
+                seen += c
+                if seen > rank:
+                    yield lo + (b + 0.5) * width  # bin center
+                    break
+
+
+class RollingWindow:
+    """
+    Push API: feed values one at a time and read the window statistics.
+
+    All reads are O(1) except percentile() (O(1) lookup in a sorted list
+    maintained with O(k) memmoves, only if percentiles=True).
+    """
+
+    def __init__(self, k, percentiles=False):
+        _check_window(k)
+        self.k = k
+        self.values = deque()
+        self.total = 0
+        self._max = deque()  # (index, value), decreasing values
+        self._min = deque()  # (index, value), increasing values
+        self._sorted = [] if percentiles else None
+        self._index = 0
+        self.seen = 0  # values pushed so far (including expired ones)
+
+    def push(self, x):
+        """Add one value; return the value that left the window (or None)."""
+        i = self._index
+        self._index += 1
+        self.seen += 1
+        self.values.append(x)
+        self.total += x
+
+        while self._max and self._max[-1][1] <= x:
+            self._max.pop()
+        self._max.append((i, x))
+        while self._min and self._min[-1][1] >= x:
+            self._min.pop()
+        self._min.append((i, x))
+        if self._sorted is not None:
+            bisect.insort(self._sorted, x)
+
+        expired = None
+        if len(self.values) > self.k:
+            expired = self.values.popleft()
+            self.total -= expired
+            if self._index % self.k == 0:
+                self.total = sum(self.values)  # resync like rolling_sum: no float drift
+            if self._max[0][0] <= i - self.k:
+                self._max.popleft()
+            if self._min[0][0] <= i - self.k:
+                self._min.popleft()
+            if self._sorted is not None:
+                del self._sorted[bisect.bisect_left(self._sorted, expired)]
+        return expired
+
+    @property
+    def full(self):
+        return len(self.values) == self.k
+
+    @property
+    def count(self):
+        return len(self.values)
+
+    @property
+    def sum(self):
+        return self.total
+
+    @property
+    def mean(self):
+        return self.total / len(self.values) if self.values else None
+
+    @property
+    def max(self):
+        return self._max[0][1] if self._max else None
+
+    @property
+    def min(self):
+        return self._min[0][1] if self._min else None
+
+    def percentile(self, q):
+        """Nearest-rank q-th percentile of the current window (0..100)."""
+        if self._sorted is None:
+            raise ValueError("create the window with percentiles=True")
+        if not self._sorted:
+            return None
+        rank = int(round(q / 100 * (len(self._sorted) - 1)))
+        return self._sorted[rank]
+
+
 # ================== EXAMPLE ==================
 
-# Requests per second for 20 seconds
-requests = [5, 2, 7, 3, 9, 4, 1, 6, 3, 8, 2, 4, 9, 5, 7, 3, 2, 8, 6, 4]
+if __name__ == "__main__":
+    import random
+    from itertools import count
+
+    arr = [2, 1, 5, 1, 3, 2]
+    k = 3
+    print(f"Maximum sum of a subarray of size {k}:", max_sum_subarray(arr, k))
+
+    s = "abcabcbb"
+    print("Longest substring without repeating characters:", longest_unique_substring(s))
+    print("Its (start, length):", longest_unique_span(s))
+
+    rng = random.Random(3)
+    payload = bytes(rng.randrange(256) for _ in range(1 << 20))
+    stream = UniqueByteStream()
+    for i in range(0, len(payload), 4096):
+        stream.feed(payload[i:i + 4096])
+    start, length, run = stream.result
+    assert (start, length) == longest_unique_bytes(payload)
+    print(f"1 MB payload: unique run of {length} bytes at offset {start}")
+
+    # Requests per second for 20 seconds
+    requests = [5, 2, 7, 3, 9, 4, 1, 6, 3, 8, 2, 4, 9, 5, 7, 3, 2, 8, 6, 4]
+    window_size = 10
+    result = max_requests_in_window(requests, window_size)
+    print(f"Maximum number of requests in any {window_size}-second window:", result)
+
+    # An endless stream of requests per second
+    rng.seed(7)
+    stream = (rng.randint(0, 20) for _ in count())
+
+    first_20 = list(islice(stream, 20))
+    print("Stream sample:", first_20)
+    print("Rolling sum (k=5):", list(rolling_sum(first_20, 5)))
+    print("Rolling max (k=5):", list(rolling_max(first_20, 5)))
+    print("Rolling p90 (k=5):", list(rolling_percentile(first_20, 5, 90)))
 
-window_size = 10
-result = max_requests_in_window(requests, window_size)
+    # Only 10 values are ever kept, no matter how long the stream runs
+    peak = max(islice(rolling_sum(stream, 10), 1_000_000))
+    print("Peak 10-second traffic over 1M seconds:", peak)
 
-print(f"Maximum number of requests in any {window_size}-second window:", result)
\ No newline at end of file
+    live = RollingWindow(10, percentiles=True)
+    for x in first_20:
+        live.push(x)
+    print(f"Live window: sum={live.sum} mean={live.mean:.1f} "
+          f"max={live.max} min={live.min} p50={live.percentile(50)}")
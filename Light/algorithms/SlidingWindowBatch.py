@@ -0,0 +1,181 @@
+"""
+Batch Sliding Window Kernels (NumPy)
+------------------------------------
+
+Problem:
+- max_requests_in_window() answers one list at a time with a Python loop.
+- We have a 2D array: one row per series (endpoint), one column per
+  second, and want the window statistics of every row at once.
+
+🔎 Ideas:
+1. Rolling sum with prefix sums:
+       c = cumsum(x)            window(i) = c[i + k - 1] - c[i - 1]
+   one subtraction of two shifted arrays gives every window of every row.
+2. Rolling max/min with van Herk / Gil-Werman:
+   cut each row into blocks of k, take a running max from the left
+   (prefix) and from the right (suffix) inside every block. A window
+   starting at i covers the end of one block and the start of the next:
+       max(window at i) = max(suffix[i], prefix[i + k - 1])
+   3 comparisons per element, whatever the window size.
+3. Chunked mode: an np.memmap of series x time can be larger than RAM.
+   Windows run along time, so rows are independent: read a band of rows,
+   reduce it, and move on. Memory = one band.
+
+📊 Complexity (S series, T time steps, window k):
+- rolling sums: O(S * T), rolling max/min: O(S * T) (independent of k)
+- chunked: same time, O(rows_per_chunk * T) memory
+
+🎯 Use Cases:
+- Per-endpoint traffic peaks, per-sensor extremes, multi-series analytics.
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+try:
+    from .SlidingWindow import max_requests_in_window
+except ImportError:  # run as a script
+    from SlidingWindow import max_requests_in_window
+
+
+# -------------------------------
+# Rolling sums (prefix sums)
+# -------------------------------
+def rolling_sum_2d(x, k):
+    """
+    Sum of every window of k columns, for every row.
+
+    :param x: 2D array (series x time)
+    :param k: window size (1 <= k <= x.shape[1])
+    :return: array of shape (series, time - k + 1)
+    """
+    x = np.asarray(x)
+    if not 1 <= k <= x.shape[1]:
+        raise ValueError("window size must be between 1 and the series length")
+    # Integers accumulate in int64, floats in float64 (no overflow on int32 input)
+    dtype = np.int64 if x.dtype.kind in "biu" else np.float64
+    c = np.cumsum(x, axis=1, dtype=dtype)
+    out = c[:, k - 1:].copy()
+    out[:, 1:] -= c[:, :-k]
+    return out
+
+
+# -------------------------------
+# Rolling max / min (van Herk / Gil-Werman)
+# -------------------------------
+def _rolling_extreme_2d(x, k, ufunc, fill):
+    x = np.asarray(x)
+    rows, n = x.shape
+    if not 1 <= k <= n:
+        raise ValueError("window size must be between 1 and the series length")
+    blocks = -(-n // k)
+    padded = np.full((rows, blocks * k), fill, dtype=x.dtype)
+    padded[:, :n] = x
+    cells = padded.reshape(rows, blocks, k)
+
+    prefix = ufunc.accumulate(cells, axis=2).reshape(rows, -1)
+    suffix = ufunc.accumulate(cells[:, :, ::-1], axis=2)[:, :, ::-1].reshape(rows, -1)
+    count = n - k + 1
+    return ufunc(suffix[:, :count], prefix[:, k - 1:k - 1 + count])
+
+
+def rolling_max_2d(x, k):
+    """Maximum of every window of k columns, for every row."""
+    x = np.asarray(x)
+    fill = np.iinfo(x.dtype).min if x.dtype.kind in "iu" else -np.inf
+    return _rolling_extreme_2d(x, k, np.maximum, fill)
+
+
+def rolling_min_2d(x, k):
+    """Minimum of every window of k columns, for every row."""
+    x = np.asarray(x)
+    fill = np.iinfo(x.dtype).max if x.dtype.kind in "iu" else np.inf
+    return _rolling_extreme_2d(x, k, np.minimum, fill)
+
+
+# -------------------------------
+# Per-series answers in one call
+# -------------------------------
+def max_requests_per_series(x, k):
+    """
+    Vectorized max_requests_in_window() for every row.
+
+    :return: (peak window sums, start index of the first peak window), one per row
+    """
+    sums = rolling_sum_2d(x, k)
+    return sums.max(axis=1), sums.argmax(axis=1)
+
+
+def max_requests_chunked(x, k, rows_per_chunk=None, memory_budget=256 * 2 ** 20):
+    """
+    Same as max_requests_per_series(), reading x one band of rows at a time.
+    Works with np.memmap arrays larger than memory.
+
+    :param rows_per_chunk: rows per band (default: fit memory_budget)
+    :param memory_budget: approximate bytes of working memory per band
+    """
+    rows, n = x.shape
+    if rows_per_chunk is None:
+        # cumsum (8 bytes) + window sums (8 bytes) + the band itself
+        per_row = n * (16 + x.dtype.itemsize)
+        rows_per_chunk = max(1, memory_budget // per_row)
+
+    peaks = np.empty(rows, dtype=np.int64 if x.dtype.kind in "biu" else np.float64)
+    starts = np.empty(rows, dtype=np.int64)
+    for lo in range(0, rows, rows_per_chunk):
+        hi = min(rows, lo + rows_per_chunk)
+        band = np.asarray(x[lo:hi])  # the only part read from disk
+        peaks[lo:hi], starts[lo:hi] = max_requests_per_series(band, k)
+    return peaks, starts
+
+
+# ================== EXAMPLE ==================
+
+def run_benchmark(series=500, seconds=86_400, k=10):
+    rng = np.random.default_rng(42)
+    x = rng.poisson(5, size=(series, seconds)).astype(np.int32)
+
+    start = time.perf_counter()
+    loop = [max_requests_in_window(row.tolist(), k) for row in x[:20]]
+    t_loop = (time.perf_counter() - start) / 20 * series
+
+    start = time.perf_counter()
+    peaks, _ = max_requests_per_series(x, k)
+    t_vec = time.perf_counter() - start
+    assert peaks[:20].tolist() == loop
+
+    start = time.perf_counter()
+    rolling_max_2d(x, 60)
+    t_max = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "traffic.dat")
+        disk = np.memmap(path, dtype=np.int32, mode="w+", shape=x.shape)
+        disk[:] = x
+        disk.flush()
+        start = time.perf_counter()
+        chunked, _ = max_requests_chunked(disk, k, memory_budget=16 * 2 ** 20)
+        t_chunk = time.perf_counter() - start
+        assert (chunked == peaks).all()
+        del disk
+
+    print(f"\n{series} series x {seconds} seconds, window {k}")
+    print(f"Python loop per series (extrapolated): {t_loop:.2f} s")
+    print(f"Vectorized rolling sums + max:         {t_vec:.2f} s")
+    print(f"Rolling max, window 60 (van Herk):     {t_max:.2f} s")
+    print(f"Chunked from np.memmap (16 MB bands):  {t_chunk:.2f} s")
+
+
+if __name__ == "__main__":
+    requests = np.array([
+        [5, 2, 7, 3, 9, 4, 1, 6, 3, 8, 2, 4, 9, 5, 7, 3, 2, 8, 6, 4],
+        [1, 1, 1, 1, 1, 9, 9, 9, 9, 9, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    ])
+    peaks, starts = max_requests_per_series(requests, 10)
+    print("Peak 10-second sums per series:", peaks.tolist(), "starting at", starts.tolist())
+    print("Rolling max (k=3):\n", rolling_max_2d(requests, 3))
+
+    run_benchmark()
@@ -0,0 +1,229 @@
+# --------------------------------------
+# Sorted Index: fast lookups in a fixed sorted table
+# --------------------------------------
+# binary_search() in BIG_O.py answers one exact-match query per call.
+# A lookup-heavy service wants more from the same O(log n) idea:
+#
+#   - lower_bound(x): first position with key >= x
+#   - upper_bound(x): first position with key >  x
+#   - range queries:  all keys in [lo, hi)
+#   - batches:        millions of targets per call (NumPy searchsorted)
+#
+# Layouts compared below:
+#   1. Sorted array + bisect (C implementation of binary search).
+#   2. Eytzinger (BFS) layout: the implicit binary search tree is stored
+#      level by level, like a heap (children of k are 2k and 2k+1).
+#      The first levels, visited by every query, sit together in memory,
+#      and the search loop is branch-free:  k = 2k + (e[k] < x).
+#      With NumPy a whole batch walks the tree at once, one level per step.
+#   3. Interpolation search: for uniformly distributed keys, guess the
+#      position from the value (like opening a dictionary near "M"),
+#      O(log log n) expected probes. Falls back to bisect on skewed data.
+#
+# Complexity:
+#   - build: O(n log n), lookups: O(log n), batch of m: O(m log n)
+#   - interpolation: O(log log n) expected on uniform keys
+# --------------------------------------
+
+import bisect
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # batch queries fall back to bisect loops
+    np = None
+
+try:
+    from .BIG_O import binary_search
+except ImportError:  # run as a script
+    from BIG_O import binary_search
+
+INTERPOLATION_PROBES = 4  # probes before interpolation search switches to bisect
+
+
+def eytzinger_layout(keys):
+    """
+    Reorder sorted keys into BFS order (1-based; slot 0 is unused).
+
+    :return: (layout, rank) where rank[k] is the sorted position of layout[k]
+    """
+    n = len(keys)
+    layout = [None] * (n + 1)
+    rank = [n] * (n + 2)  # rank of the "past the end" slot 0 is n
+    # In-order traversal of the implicit tree visits the sorted keys in order
+    i = 0
+    stack, k = [], 1
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k = 2 * k
+        k = stack.pop()
+        layout[k] = keys[i]
+        rank[k] = i
+        i += 1
+        k = 2 * k + 1
+    return layout, rank
+
+
+class SortedIndex:
+    """Build once, query many times."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.layout, self.rank = eytzinger_layout(self.keys)
+        if np is not None:
+            self.array = np.asarray(self.keys)
+            self.layout_array = np.asarray(self.layout[1:] or [0], dtype=self.array.dtype)
+            self.rank_array = np.asarray(self.rank)
+
+    def __len__(self):
+        return len(self.keys)
+
+    # ----------------------------------
+    # Single queries (sorted layout)
+    # ----------------------------------
+    def lower_bound(self, x):
+        """First position whose key is >= x (len(self) if none)."""
+        return bisect.bisect_left(self.keys, x)
+
+    def upper_bound(self, x):
+        """First position whose key is > x (len(self) if none)."""
+        return bisect.bisect_right(self.keys, x)
+
+    def search(self, x):
+        """Position of x, or -1 (same contract as binary_search)."""
+        i = bisect.bisect_left(self.keys, x)
+        return i if i < len(self.keys) and self.keys[i] == x else -1
+
+    def __contains__(self, x):
+        return self.search(x) != -1
+
+    def range(self, lo, hi):
+        """Keys k with lo <= k < hi."""
+        return self.keys[bisect.bisect_left(self.keys, lo):bisect.bisect_left(self.keys, hi)]
+
+    def count_range(self, lo, hi):
+        return max(0, bisect.bisect_left(self.keys, hi) - bisect.bisect_left(self.keys, lo))
+
+    # ----------------------------------
+    # Eytzinger layout
+    # ----------------------------------
+    def eytzinger_lower_bound(self, x):
+        layout, n = self.layout, len(self.keys)
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < x)
+        # Undo the final run of "right" turns plus one "left" turn
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self.rank[k]
+
+    # ----------------------------------
+    # Interpolation search (uniform keys)
+    # ----------------------------------
+    def interpolation_lower_bound(self, x):
+        keys = self.keys
+        lo, hi = 0, len(keys) - 1
+        if hi < 0 or x <= keys[0]:
+            return 0
+        if x > keys[hi]:
+            return hi + 1
+        # Invariant: keys[lo] < x <= keys[hi]
+        for _ in range(INTERPOLATION_PROBES):
+            if hi - lo <= 1:
+                return hi
+            span = keys[hi] - keys[lo]
+            guess = lo + int((x - keys[lo]) * (hi - lo) / span)
+            guess = min(hi - 1, max(lo + 1, guess))
+            if keys[guess] < x:
+                lo = guess
+            else:
+                hi = guess
+        return bisect.bisect_left(keys, x, lo + 1, hi)
+
+    # ----------------------------------
+    # Batches
+    # ----------------------------------
+    def search_many(self, targets, side="left"):
+        """lower_bound (side='left') or upper_bound (side='right') per target."""
+        if np is not None:
+            return np.searchsorted(self.array, targets, side=side)
+        find = bisect.bisect_left if side == "left" else bisect.bisect_right
+        keys = self.keys
+        return [find(keys, x) for x in targets]
+
+    def contains_many(self, targets):
+        """Boolean per target: is it a key of the index?"""
+        if np is not None:
+            targets = np.asarray(targets)
+            pos = np.searchsorted(self.array, targets)
+            found = pos < len(self.array)
+            found[found] = self.array[pos[found]] == targets[found]
+            return found
+        keys, n = self.keys, len(self.keys)
+        result = []
+        for x in targets:
+            i = bisect.bisect_left(keys, x)
+            result.append(i < n and keys[i] == x)
+        return result
+
+    def eytzinger_many(self, targets):
+        """Batch lower_bound walking the Eytzinger tree one level per step (NumPy)."""
+        if np is None:
+            return [self.eytzinger_lower_bound(x) for x in targets]
+        n = len(self.keys)
+        layout = self.layout_array
+        targets = np.asarray(targets)
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            # layout_array is 0-based: node k lives at k - 1
+            probe = layout[np.minimum(k, n) - 1]
+            k = np.where(active, 2 * k + (probe < targets), k)
+        k >>= _trailing_ones_plus_one(k)
+        return self.rank_array[k]
+
+
+def _trailing_ones_plus_one(k):
+    """Vectorized ((~k) & (k + 1)).bit_length() for int64 arrays."""
+    lowest_zero = (~k) & (k + 1)  # a power of two
+    return np.log2(lowest_zero).astype(np.int64) + 1
+
+
+# --------------------------------------
+# Example usage
+# --------------------------------------
+def run_benchmark(n=1_000_000, queries=100_000, seed=42):
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)  # uniform, unique
+    index = SortedIndex(keys)
+    targets = [rng.randrange(n * 10) for _ in range(queries)]
+    expected = [bisect.bisect_left(index.keys, x) for x in targets]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<34}{queries / elapsed:>14,.0f} lookups/s")
+        return result
+
+    print(f"\n{queries} lookups in {n} sorted keys")
+    timed("BIG_O.binary_search (exact match)", lambda: [binary_search(index.keys, x) for x in targets])
+    assert timed("bisect lower_bound", lambda: [index.lower_bound(x) for x in targets]) == expected
+    assert timed("eytzinger (Python loop)", lambda: [index.eytzinger_lower_bound(x) for x in targets]) == expected
+    assert timed("interpolation search", lambda: [index.interpolation_lower_bound(x) for x in targets]) == expected
+    assert list(timed("search_many (batch)", lambda: index.search_many(targets))) == expected
+    if np is not None:
+        array = np.asarray(targets)
+        assert list(timed("eytzinger_many (NumPy batch)", lambda: index.eytzinger_many(array))) == expected
+
+
+if __name__ == "__main__":
+    index = SortedIndex([19, 3, 7, 1, 15, 9, 13, 5, 17, 11])
+    print("Keys:", index.keys)
+    print("lower_bound(8):", index.lower_bound(8), " upper_bound(9):", index.upper_bound(9))
+    print("Keys in [5, 12):", index.range(5, 12))
+    print("search_many([1, 8, 19, 20]):", list(index.search_many([1, 8, 19, 20])))
+    print("contains_many([1, 8, 19, 20]):", list(index.contains_many([1, 8, 19, 20])))
+
+    run_benchmark()
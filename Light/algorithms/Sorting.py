@@ -0,0 +1,388 @@
+"""
+Sorting Algorithms in Python
+----------------------------
+
+Includes:
+1. QuickSort
+2. MergeSort
+3. IntroSort (in-place)
+4. Natural MergeSort (bottom-up, stable)
+
+Complexities:
+- QuickSort: Avg O(n log n), Worst O(n^2)
+- MergeSort: O(n log n), guaranteed
+- IntroSort: O(n log n), guaranteed, O(log n) extra space
+- Natural MergeSort: O(n log r) for r existing runs, O(n) on sorted input
+
+IntroSort is the in-place alternative to quicksort():
+- Pivot is the median of three (or Tukey's ninther on large slices).
+- Three-way partitioning keeps all-equal / few-unique inputs linear.
+- Small slices are finished with insertion sort.
+- If recursion gets deeper than 2*log2(n), the slice falls back to heapsort,
+  so adversarial inputs can never reach O(n^2).
+
+Natural MergeSort is the iterative alternative to mergesort():
+- Scans the input once for ascending / strictly descending runs
+  (descending ones are reversed in place), short runs are padded
+  to MIN_RUN with binary insertion sort.
+- Merges neighbouring runs bottom-up, ping-ponging between the work list
+  and one auxiliary buffer instead of slicing at every level.
+- key= is evaluated once per element (decorate-sort-undecorate).
+"""
+
+import bisect
+import random
+import time
+
+try:
+    from .RadixSort import lsd_radix_sort
+except ImportError:  # run as a script
+    from RadixSort import lsd_radix_sort
+
+# -------------------------
+# QuickSort Implementation
+# -------------------------
+def quicksort(arr):
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr) // 2]  # choose middle element as pivot
+    left = [x for x in arr if x < pivot]
+    middle = [x for x in arr if x == pivot]
+    right = [x for x in arr if x > pivot]
+    return quicksort(left) + middle + quicksort(right)
+
+
+# -------------------------
+# MergeSort Implementation
+# -------------------------
+def mergesort(arr):
+    if len(arr) <= 1:
+        return arr
+    
+    mid = len(arr) // 2
+    left = mergesort(arr[:mid])
+    right = mergesort(arr[mid:])
+    
+    return merge(left, right)
+
+
+def merge(left, right):
+    result = []
+    i = j = 0
+    
+    # Merge two sorted lists
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+    
+    # Append remaining elements
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+# -------------------------
+# IntroSort Implementation (in-place)
+# -------------------------
+INSERTION_SORT_THRESHOLD = 16  # slices this small are finished by insertion sort
+NINTHER_THRESHOLD = 128        # slices this big use Tukey's ninther as pivot
+
+
+def introsort(arr):
+    """
+    Sort a mutable sequence in place and return it.
+
+    :param arr: list (or any mutable sequence) of comparable items
+    :return: the same object, sorted
+    """
+    n = len(arr)
+    if n > 1:
+        _introsort(arr, 0, n, 2 * n.bit_length())
+    return arr
+
+
+def _introsort(arr, lo, hi, depth):
+    # Loop on the larger side and recurse on the smaller one,
+    # so the call stack never grows beyond O(log n).
+    while hi - lo > INSERTION_SORT_THRESHOLD:
+        if depth == 0:
+            _heapsort(arr, lo, hi)
+            return
+        depth -= 1
+
+        pivot = _choose_pivot(arr, lo, hi)
+        lt, gt = _partition3(arr, lo, hi, pivot)
+
+        if lt - lo < hi - gt:
+            _introsort(arr, lo, lt, depth)
+            lo = gt
+        else:
+            _introsort(arr, gt, hi, depth)
+            hi = lt
+
+    _insertion_sort(arr, lo, hi)
+
+
+def _median3(a, b, c):
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _choose_pivot(arr, lo, hi):
+    n = hi - lo
+    mid = lo + n // 2
+    last = hi - 1
+    if n < NINTHER_THRESHOLD:
+        return _median3(arr[lo], arr[mid], arr[last])
+
+    # Tukey's ninther: median of three medians of three
+    step = n // 8
+    return _median3(
+        _median3(arr[lo], arr[lo + step], arr[lo + 2 * step]),
+        _median3(arr[mid - step], arr[mid], arr[mid + step]),
+        _median3(arr[last - 2 * step], arr[last - step], arr[last]),
+    )
+
+
+def _partition3(arr, lo, hi, pivot):
+    """
+    Dutch national flag partition of arr[lo:hi] around pivot.
+    Afterwards: arr[lo:lt] < pivot, arr[lt:gt] == pivot, arr[gt:hi] > pivot.
+    """
+    lt = i = lo
+    gt = hi
+    while i < gt:
+        x = arr[i]
+        if x < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            arr[i] = arr[gt]
+            arr[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+
+def _insertion_sort(arr, lo, hi):
+    for i in range(lo + 1, hi):
+        x = arr[i]
+        j = i - 1
+        while j >= lo and x < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = x
+
+
+def _heapsort(arr, lo, hi):
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _sift_down(arr, lo, root, size):
+    x = arr[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not x < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = x
+
+
+# -------------------------
+# Natural MergeSort Implementation (bottom-up)
+# -------------------------
+MIN_RUN = 32  # shorter runs are extended with binary insertion sort
+
+
+def natural_mergesort(arr, key=None):
+    """
+    Stable bottom-up merge sort that reuses existing runs.
+
+    :param arr: iterable of items
+    :param key: optional function computed once per item, like sorted(key=)
+    :return: new sorted list
+    """
+    if key is None:
+        work = list(arr)
+    else:
+        # The index breaks ties, so items themselves are never compared
+        # and equal keys keep their original order.
+        items = list(arr)
+        work = [(key(x), i) for i, x in enumerate(items)]
+
+    n = len(work)
+    if n > 1:
+        work = _merge_runs(work, _find_runs(work))
+
+    if key is None:
+        return work
+    return [items[i] for _, i in work]
+
+
+def _find_runs(a):
+    """Split a into sorted runs of at least MIN_RUN items; return boundaries."""
+    n = len(a)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            if a[hi] < a[lo]:
+                # Strictly descending (strict so reversing keeps stability)
+                while hi + 1 < n and a[hi + 1] < a[hi]:
+                    hi += 1
+                hi += 1
+                a[lo:hi] = a[lo:hi][::-1]
+            else:
+                while hi + 1 < n and not a[hi + 1] < a[hi]:
+                    hi += 1
+                hi += 1
+
+        if hi - lo < MIN_RUN and hi < n:
+            end = min(n, lo + MIN_RUN)
+            _binary_insertion_sort(a, lo, hi, end)
+            hi = end
+
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+
+def _binary_insertion_sort(a, lo, start, hi):
+    """a[lo:start] is already sorted; insert a[start:hi] into it."""
+    for i in range(start, hi):
+        x = a[i]
+        pos = bisect.bisect_right(a, x, lo, i)
+        a[pos + 1:i + 1] = a[pos:i]
+        a[pos] = x
+
+
+def _merge_runs(src, bounds):
+    dst = [None] * len(src)  # the single auxiliary buffer
+    while len(bounds) > 2:
+        merged = [0]
+        for j in range(0, len(bounds) - 2, 2):
+            lo, mid, hi = bounds[j], bounds[j + 1], bounds[j + 2]
+            _merge_into(src, dst, lo, mid, hi)
+            merged.append(hi)
+        if len(bounds) % 2 == 0:
+            # Odd run out: copy it across unchanged
+            lo = bounds[-2]
+            dst[lo:] = src[lo:]
+            merged.append(bounds[-1])
+        src, dst = dst, src
+        bounds = merged
+    return src
+
+
+def _merge_into(src, dst, lo, mid, hi):
+    """Stable merge of src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    if not src[mid] < src[mid - 1]:
+        dst[lo:hi] = src[lo:hi]  # already in order
+        return
+
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        # Take from the right only when strictly smaller (stability)
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+# ================== BENCHMARK ==================
+
+def make_inputs(n, seed=42):
+    """Input shapes that usually break naive quicksorts."""
+    rng = random.Random(seed)
+    half = n // 2
+    partial = list(range(n))
+    for _ in range(n // 100):  # 1% of positions swapped
+        i, j = rng.randrange(n), rng.randrange(n)
+        partial[i], partial[j] = partial[j], partial[i]
+    return {
+        "random": [rng.randrange(n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "few-unique": [rng.randrange(4) for _ in range(n)],
+        "organ-pipe": list(range(half)) + list(range(n - half, 0, -1)),
+        "partial": partial,
+    }
+
+
+def bench(fn, data, repeat=3):
+    """Best-of-repeat wall time for fn on a fresh copy of data."""
+    best = float("inf")
+    for _ in range(repeat):
+        copy = list(data)
+        start = time.perf_counter()
+        fn(copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(n=20000):
+    sorts = {
+        "quicksort": quicksort,
+        "mergesort": mergesort,
+        "introsort": introsort,
+        "natural": natural_mergesort,
+        "radix": lsd_radix_sort,  # integer keys only, see RadixSort.py
+    }
+    print(f"\nBenchmark, n = {n} (best of 3, milliseconds)")
+    print(f"{'input':<12}" + "".join(f"{name:>12}" for name in sorts))
+    for shape, data in make_inputs(n).items():
+        expected = sorted(data)
+        row = f"{shape:<12}"
+        for name, fn in sorts.items():
+            try:
+                assert fn(list(data)) == expected, name
+                row += f"{bench(fn, data) * 1000:>12.2f}"
+            except RecursionError:
+                row += f"{'recursion':>12}"  # quicksort() on organ-pipe input
+        print(row)
+
+
+# ================== EXAMPLE ==================
+
+if __name__ == "__main__":
+    arr = [38, 27, 43, 3, 9, 82, 10]
+
+    print("Original array:", arr)
+    print("Sorted with QuickSort:", quicksort(arr))
+    print("Sorted with MergeSort:", mergesort(arr))
+    print("Sorted with IntroSort:", introsort(list(arr)))
+    print("Sorted with Natural MergeSort:", natural_mergesort(arr))
+
+    people = [("ana", 31), ("bob", 25), ("carl", 31), ("dora", 25)]
+    print("Stable sort by age:", natural_mergesort(people, key=lambda p: p[1]))
+
+    run_benchmark()
@@ -0,0 +1,85 @@
+"""
+Algorithms Package
+------------------
+
+Every module can still be run as a script to see its examples:
+    python BFS.py
+
+and the directory is also an importable package with no side effects:
+    from algorithms import dijkstra, astar
+    from algorithms.Sorting import introsort
+
+⚡ Lazy loading (PEP 562):
+- `import algorithms` only reads this file. A submodule (and NumPy, for
+  the modules that use it) is imported the first time one of its names
+  is looked up, so short-lived workers pay only for what they use.
+- `python -m algorithms` checks the import-time budget of every module.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "linear_search": "BIG_O", "binary_search": "BIG_O",
+    "quicksort": "Sorting", "mergesort": "Sorting", "introsort": "Sorting",
+    "natural_mergesort": "Sorting",
+    "counting_sort": "RadixSort", "lsd_radix_sort": "RadixSort", "msd_radix_sort": "RadixSort",
+    "external_sort": "ExternalSort", "sort_file": "ExternalSort",
+    "parallel_sort": "ParallelSort",
+    "SortedIndex": "SortedIndex",
+    "bfs": "BFS", "dfs": "DFS", "dijkstra": "Djstrika", "astar": "AStar",
+    "floyd_warshall": "FloydWarshall",
+    "kruskal": "MST", "prim": "MST", "UnionFind": "MST",
+    "nqueens": "BackTracking",
+    "fib_memo": "DynamicProgramming", "fib_tab": "DynamicProgramming",
+    "fib_optimized": "DynamicProgramming", "fib_fast": "DynamicProgramming",
+    "fib_mod": "DynamicProgramming", "fib_many": "DynamicProgramming",
+    "memoize": "Memoize",
+    "knapsack": "Knapsack", "knapsack_items": "Knapsack", "subset_sum": "Knapsack",
+    "levenshtein": "SequenceAlignment", "lcs": "SequenceAlignment",
+    "lcs_length": "SequenceAlignment", "align": "SequenceAlignment",
+    "max_sum_subarray": "SlidingWindow", "longest_unique_substring": "SlidingWindow",
+    "max_requests_in_window": "SlidingWindow", "RollingWindow": "SlidingWindow",
+    "max_requests_per_series": "SlidingWindowBatch",
+    "SlidingWindowLog": "RateLimiter", "SlidingWindowCounter": "RateLimiter",
+    "TokenBucket": "RateLimiter",
+    "HashMap": "HashMap",
+    "two_pointers_sum": "TwoPointer",
+    "pair_sum": "PairSum", "k_sum": "PairSum", "three_sum": "PairSum",
+    "four_sum": "PairSum", "PairStream": "PairSum",
+    "greedy_coin_change": "greediness", "CoinSystem": "greediness",
+    "select_activities": "IntervalScheduling", "assign_rooms": "IntervalScheduling",
+    "compress": "Huffman", "decompress": "Huffman",
+    "Triangle": "FuzzyInference", "Trapezoid": "FuzzyInference", "Gaussian": "FuzzyInference",
+    "FuzzyVariable": "FuzzyInference", "Mamdani": "FuzzyInference", "Sugeno": "FuzzyInference",
+    "Controller": "FuzzyController",
+    "Recorder": "Instrumentation", "SearchStats": "Instrumentation",
+    "QueryServer": "QueryServer",
+    "pi_digits": "PiEngine", "pi_scaled": "PiEngine",
+}
+
+_SUBMODULES = (
+    "AStar", "BFS", "BIG_O", "BackTracking", "BigOBenchmark", "DFS", "Djstrika",
+    "DynamicProgramming", "ExternalSort", "FloydWarshall", "Fuzzy", "FuzzyController",
+    "FuzzyInference", "HashMap", "Huffman", "Instrumentation", "IntervalScheduling",
+    "Knapsack", "MST", "Memoize", "PairSum", "ParallelSort", "PiEngine", "QueryServer",
+    "RadixSort", "RateLimiter", "SequenceAlignment", "SlidingWindow",
+    "SlidingWindowBatch", "SortedIndex", "Sorting", "TwoPointer", "greediness",
+)
+
+__all__ = sorted(set(_EXPORTS) | set(_SUBMODULES))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return __all__
@@ -0,0 +1,130 @@
+"""
+Import-Time Budget Check
+------------------------
+
+    python -m algorithms            (from the directory holding the package)
+
+Each check runs in a fresh interpreter with `python -X importtime`:
+1. `import algorithms` alone must load no submodule and stay within
+   PACKAGE_BUDGET_MS.
+2. Every submodule must import without printing anything, and the time
+   spent in the package's own modules (third-party imports such as NumPy
+   excluded) must stay within MODULE_BUDGET_MS. A submodule is skipped
+   only when a third-party dependency is missing; any other import error
+   is a failure.
+Exit status 1 if any check fails.
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+try:
+    from . import _SUBMODULES
+except ImportError:  # run as a script
+    from __init__ import _SUBMODULES
+
+PACKAGE_BUDGET_MS = 5.0
+MODULE_BUDGET_MS = 50.0
+RUNS = 3  # best of, to smooth out a cold disk cache
+
+
+def _package_root(package):
+    """Directory that has to be on sys.path to import `package`."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    for _ in package.split("."):
+        path = os.path.dirname(path)
+    return path
+
+
+def measure(package, statement):
+    """
+    Run `statement` in a fresh interpreter with -X importtime.
+
+    :return: (stdout, own milliseconds, cumulative milliseconds of the
+              first module named in the statement)
+    """
+    target = statement.split()[1].rstrip(",")
+    root = _package_root(package)
+    env = dict(os.environ, PYTHONPATH=root)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          capture_output=True, text=True, env=env, cwd=root)
+    if proc.returncode:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr}")
+    own = cumulative = 0.0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, total_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # header line
+        name = fields[2].strip()
+        if name == package or name.startswith(package + "."):
+            own += self_us / 1000
+        if name == target:
+            cumulative = total_us / 1000
+    return proc.stdout, own, cumulative
+
+
+def _missing_dependency(reason):
+    """Module named by a "ModuleNotFoundError: No module named 'x'" line, else None."""
+    match = re.match(r"ModuleNotFoundError: No module named '([^']+)'", reason)
+    return match.group(1) if match else None
+
+
+def check(package):
+    failures = []
+
+    loaded = None
+    best = float("inf")
+    for _ in range(RUNS):
+        stdout, _, total = measure(
+            package, f"import {package}, sys; "
+                     f"print(sorted(m for m in sys.modules if m.startswith('{package}.')))")
+        best = min(best, total)
+        loaded = stdout.strip()
+    print(f"{package:<34}{best:>9.2f} ms   submodules loaded: {loaded}")
+    if loaded != "[]":
+        failures.append(f"import {package} loaded submodules eagerly: {loaded}")
+    if best > PACKAGE_BUDGET_MS:
+        failures.append(f"import {package}: {best:.2f} ms > {PACKAGE_BUDGET_MS} ms")
+
+    for name in _SUBMODULES:
+        module = f"{package}.{name}"
+        try:
+            runs = [measure(package, f"import {module}") for _ in range(RUNS)]
+        except RuntimeError as error:
+            reason = str(error).strip().splitlines()[-1]
+            missing = _missing_dependency(reason)
+            if missing is None or missing.split(".")[0] in (package,) + _SUBMODULES:
+                print(f"{module:<34}{'FAIL':>9}      ({reason})")
+                failures.append(f"import {module} failed: {reason}")
+            else:  # an optional third-party dependency that is not installed
+                print(f"{module:<34}{'skipped':>9}      ({reason})")
+            continue
+        stdout = runs[0][0]
+        own = min(r[1] for r in runs)
+        status = "ok" if own <= MODULE_BUDGET_MS and not stdout else "FAIL"
+        print(f"{module:<34}{own:>9.2f} ms   {status}")
+        if stdout:
+            failures.append(f"import {module} printed {stdout[:60]!r}")
+        if own > MODULE_BUDGET_MS:
+            failures.append(f"import {module}: {own:.2f} ms > {MODULE_BUDGET_MS} ms")
+    return failures
+
+
+def main():
+    package = __package__ or os.path.basename(os.path.dirname(os.path.abspath(__file__)))
+    failures = check(package)
+    for message in failures:
+        print("FAIL", message)
+    print("import budget:", "exceeded" if failures else "ok")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,33 +18,219 @@ Problem: Coin Change (minimum coins)
 - Space: O(1), only storing result.
 
 🎯 Use Cases of Greedy Algorithms:
-- Activity selection (interval scheduling).
-- Huffman coding (compression).
-- Minimum spanning tree (Prim's, Kruskal’s algorithms).
+- Activity selection (interval scheduling) -> IntervalScheduling.py
+- Huffman coding (compression) -> Huffman.py
+- Minimum spanning tree (Prim's, Kruskal’s algorithms) -> MST.py
 - Coin change (with canonical coin systems).
+
+⚠️ When greedy is wrong:
+- Coins [4, 3, 1], amount 6: greedy gives 4 + 1 + 1 (3 coins),
+  the optimum is 3 + 3 (2 coins). Systems where greedy is always
+  optimal are called *canonical* (US and euro coins are).
+- Pearson's test (1994) decides canonicity in O(n^3): if greedy ever
+  fails, the smallest failing amount is built from the greedy
+  representation of (c[i-1] - 1) for some i, cut after some coin j and
+  bumped by one c[j]. (Kozen and Zaks: it is also below c[0] + c[1].)
+- CoinSystem runs the test once and then uses the O(n) divmod greedy
+  for canonical systems, or a dynamic programming table (one array row,
+  O(n * amount)) for the others. The table is shared by every query.
 """
 
+import random
+import time
+from array import array
+
+UNREACHABLE = 1 << 62  # table entry for amounts no combination can make
+
+
 def greedy_coin_change(coins, amount):
     """
     Greedy coin change algorithm.
-    
+
     :param coins: list of available denominations (must be sorted descending)
     :param amount: total amount to change
-    :return: list of chosen coins
+    :return: list of chosen coins (empty for amount <= 0)
     """
     result = []
+    if amount <= 0:
+        return result
     for coin in coins:
-        while amount >= coin:
-            amount -= coin
-            result.append(coin)
+        # How many of this coin fit, in one step instead of one coin at a time
+        count, amount = divmod(amount, coin)
+        result.extend([coin] * count)
     return result
 
 
+def greedy_counts(coins, amount):
+    """
+    Greedy change as (coin, count) pairs, O(n) whatever the amount.
+
+    :param coins: denominations sorted descending
+    :return: (pairs, remainder); remainder > 0 if the coins cannot finish
+    """
+    _check_amount(amount)
+    pairs = []
+    for coin in coins:
+        count, amount = divmod(amount, coin)
+        if count:
+            pairs.append((coin, count))
+    return pairs, amount
+
+
+# -------------------------------
+# Canonical coin systems (Pearson)
+# -------------------------------
+def _check_amount(amount):
+    # divmod floors: a negative amount would "use" -1 of the largest coin
+    if amount < 0:
+        raise ValueError("amount must be non-negative")
+
+
+def _greedy_vector(coins, amount):
+    vector = []
+    for coin in coins:
+        count, amount = divmod(amount, coin)
+        vector.append(count)
+    return vector
+
+
+def smallest_counterexample(coins):
+    """
+    Smallest amount where greedy uses more coins than necessary.
+
+    :param coins: denominations sorted descending, ending with 1
+    :return: the amount, or None if the system is canonical
+    """
+    n = len(coins)
+    best = None
+    for i in range(1, n):
+        g = _greedy_vector(coins, coins[i - 1] - 1)
+        for j in range(i, n):
+            # Keep g up to coin j, add one more coin j, drop the rest
+            r = g[:j] + [g[j] + 1] + [0] * (n - j - 1)
+            w = sum(c * k for c, k in zip(coins, r))
+            if sum(_greedy_vector(coins, w)) > sum(r) and (best is None or w < best):
+                best = w
+    return best
+
+
+def is_canonical(coins):
+    """True if greedy change is optimal for every amount."""
+    coins = sorted(set(coins), reverse=True)
+    if not coins or coins[-1] != 1:
+        return False  # some amounts cannot be made greedily at all
+    return smallest_counterexample(coins) is None
+
+
+# -------------------------------
+# Coin system with automatic method choice
+# -------------------------------
+class CoinSystem:
+    """
+    Minimum-coin change for one coin system, many amounts.
+
+    >>> CoinSystem([4, 3, 1]).make_change(6)
+    [(3, 2)]
+    """
+
+    def __init__(self, coins):
+        self.coins = sorted(set(coins), reverse=True)
+        if not self.coins or self.coins[-1] <= 0:
+            raise ValueError("coins must be positive")
+        self.canonical = is_canonical(self.coins)
+        # DP row: best[a] = fewest coins for amount a, last[a] = a coin used
+        self.best = array("q", [0])
+        self.last = array("q", [0])
+
+    def _grow(self, limit):
+        """Extend the DP table up to `limit`, reusing what is already there."""
+        best, last, coins = self.best, self.last, self.coins
+        for a in range(len(best), limit + 1):
+            value, used = UNREACHABLE, 0
+            for coin in coins:
+                if coin <= a and best[a - coin] + 1 < value:
+                    value, used = best[a - coin] + 1, coin
+            best.append(value)
+            last.append(used)
+
+    def min_coins(self, amount):
+        """Fewest coins for amount, or None if it cannot be made."""
+        _check_amount(amount)
+        if self.canonical:
+            total = 0
+            for coin in self.coins:
+                count, amount = divmod(amount, coin)
+                total += count
+            return total
+        self._grow(amount)
+        value = self.best[amount]
+        return None if value == UNREACHABLE else value
+
+    def make_change(self, amount):
+        """
+        :return: list of (coin, count), largest coin first, or None
+        """
+        _check_amount(amount)
+        if self.canonical:
+            return greedy_counts(self.coins, amount)[0]
+        self._grow(amount)
+        if self.best[amount] == UNREACHABLE:
+            return None
+        counts = {}
+        while amount:
+            coin = self.last[amount]
+            counts[coin] = counts.get(coin, 0) + 1
+            amount -= coin
+        return sorted(counts.items(), reverse=True)
+
+    def min_coins_many(self, amounts):
+        """min_coins() for a batch; the table is built once, up to the largest amount."""
+        amounts = list(amounts)
+        if not self.canonical and amounts and min(amounts) >= 0:
+            self._grow(max(amounts))
+        return [self.min_coins(a) for a in amounts]
+
+    def make_change_many(self, amounts):
+        amounts = list(amounts)
+        if not self.canonical and amounts and min(amounts) >= 0:
+            self._grow(max(amounts))
+        return [self.make_change(a) for a in amounts]
+
+
 # ================== EXAMPLE ==================
 
-coins = [25, 10, 5, 1]   # US coin system
-amount = 63
+def run_benchmark(queries=100_000, seed=42):
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    greedy_coin_change([25, 10, 5, 1], 10 ** 7)
+    print(f"\ngreedy_coin_change, amount 10^7: {time.perf_counter() - start:.3f} s")
+
+    for coins in ([25, 10, 5, 1], [25, 10, 1], [9, 6, 1]):
+        system = CoinSystem(coins)
+        amounts = [rng.randrange(1, 10_000) for _ in range(queries)]
+        start = time.perf_counter()
+        system.min_coins_many(amounts)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        system.min_coins_many(amounts)  # table already built
+        again = time.perf_counter() - start
+        method = "greedy" if system.canonical else "DP table"
+        print(f"{str(coins):<16}{method:<10}{queries} amounts: {first:.3f} s, reusing table: {again:.3f} s")
+
+
+if __name__ == "__main__":
+    coins = [25, 10, 5, 1]   # US coin system
+    amount = 63
+
+    result = greedy_coin_change(coins, amount)
+    print(f"Coins used to make {amount}: {result}")
+    print(f"Total coins = {len(result)}")
+
+    for coins in ([25, 10, 5, 1], [4, 3, 1], [25, 10, 1]):
+        system = CoinSystem(coins)
+        print(f"{coins}: canonical={system.canonical}, "
+              f"smallest counterexample={smallest_counterexample(system.coins)}")
+    print("Change for 6 with [4, 3, 1]:", CoinSystem([4, 3, 1]).make_change(6))
 
-result = greedy_coin_change(coins, amount)
-print(f"Coins used to make {amount}: {result}")
-print(f"Total coins = {len(result)}")
+    run_benchmark()
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.DynamicProgramming import fib_fast, fib_many, fib_mod, fib_tab  # noqa: E402
+
+
+def test_fast_doubling_matches_table():
+    assert [fib_fast(n) for n in range(30)] == [fib_tab(n) for n in range(30)]
+    assert fib_mod(10 ** 18, 1_000_000_007) == fib_many([10 ** 18], 1_000_000_007)[0]
+
+
+@pytest.mark.parametrize("fn", [fib_fast, lambda n: fib_mod(n, 97), lambda n: fib_many([5, n])])
+def test_negative_index_raises(fn):
+    with pytest.raises(ValueError):
+        fn(-3)
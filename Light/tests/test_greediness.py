@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.greediness import CoinSystem, greedy_coin_change, greedy_counts  # noqa: E402
+
+
+def test_greedy_coin_change_negative_amount_is_empty():
+    assert greedy_coin_change([25, 10, 5, 1], -5) == []
+    assert greedy_coin_change([25, 10, 5, 1], 0) == []
+    assert greedy_coin_change([25, 10, 5, 1], 41) == [25, 10, 5, 1]
+
+
+@pytest.mark.parametrize("coins", [[25, 10, 5, 1], [4, 3, 1]])
+def test_negative_amounts_rejected(coins):
+    system = CoinSystem(coins)
+    with pytest.raises(ValueError):
+        system.min_coins(-5)
+    with pytest.raises(ValueError):
+        system.make_change(-5)
+    with pytest.raises(ValueError):
+        system.min_coins_many([3, -1])
+    with pytest.raises(ValueError):
+        greedy_counts(coins, -5)
@@ -0,0 +1,33 @@
+import os
+import shutil
+import sys
+
+LIGHT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LIGHT)
+
+from algorithms.__main__ import check, measure  # noqa: E402
+
+
+def test_import_loads_no_submodules():
+    stdout, _, _ = measure("algorithms", "import algorithms, sys; "
+                                         "print(sorted(m for m in sys.modules if m.startswith('algorithms.')))")
+    assert stdout.strip() == "[]"
+
+
+def test_import_budget():
+    assert check("algorithms") == []
+
+
+def test_broken_submodule_fails(tmp_path, monkeypatch):
+    copy = tmp_path / "algorithms"
+    shutil.copytree(os.path.join(LIGHT, "algorithms"), copy,
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    with open(copy / "BFS.py", "a") as f:
+        f.write("\nraise ImportError('boom')\n")
+
+    import algorithms.__main__ as runner
+    monkeypatch.setattr(runner, "_package_root", lambda package: str(tmp_path))
+    failures = check("algorithms")
+    assert any("algorithms.BFS" in f and "boom" in f for f in failures)
+    # modules importing BFS fail too instead of being skipped
+    assert any("algorithms.Instrumentation" in f for f in failures)
@@ -0,0 +1,97 @@
+import heapq
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import algorithms  # noqa: E402
+from algorithms import AStar, BFS, DFS, Djstrika  # noqa: E402
+from algorithms.Instrumentation import Recorder  # noqa: E402
+
+GRAPH = {
+    'A': [('B', 1), ('C', 4)],
+    'B': [('A', 1), ('C', 2), ('D', 5)],
+    'C': [('A', 4), ('B', 2), ('D', 1)],
+    'D': [('B', 5), ('C', 1)]
+}
+PLAIN = {node: [n for n, _ in edges] for node, edges in GRAPH.items()}
+MAZE = [
+    [0, 1, 0, 0, 0],
+    [0, 1, 0, 1, 0],
+    [0, 0, 0, 1, 0],
+    [0, 1, 0, 0, 0],
+    [0, 0, 0, 1, 0]
+]
+ORIGINALS = {
+    (Djstrika, "dijkstra"): Djstrika.dijkstra, (AStar, "astar"): AStar.astar,
+    (BFS, "bfs"): BFS.bfs, (DFS, "dfs"): DFS.dfs,
+}
+
+
+def counters(recorder):
+    return [{k: v for k, v in d.items() if k not in ("seconds", "label")} for d in recorder.as_dicts()]
+
+
+def assert_restored():
+    for (module, name), original in ORIGINALS.items():
+        assert getattr(module, name) is original
+    assert Djstrika.heapq is heapq and AStar.heapq is heapq
+    assert BFS.deque.__module__ == "collections"
+    assert algorithms.dijkstra is Djstrika.dijkstra
+
+
+def test_exact_counters():
+    recorder = Recorder()
+    assert recorder.call(Djstrika.dijkstra, GRAPH, 'A') == {'A': 0, 'B': 1, 'C': 3, 'D': 4}
+    assert recorder.call(BFS.bfs, PLAIN, 'A') == ['A', 'B', 'C', 'D']
+    assert recorder.call(DFS.dfs, PLAIN, 'A') == ['A', 'B', 'C', 'D']
+    assert recorder.call(AStar.astar, MAZE, (0, 0), (4, 4))[-1] == (4, 4)
+    assert counters(recorder) == [
+        {"function": "dijkstra", "expansions": 4, "pushes": 5, "pops": 6, "peak_frontier": 3, "revisits": 2},
+        {"function": "bfs", "expansions": 4, "pushes": 6, "pops": 6, "peak_frontier": 3, "revisits": 2},
+        {"function": "dfs", "expansions": 4, "pushes": 0, "pops": 0, "peak_frontier": 4, "revisits": 7},
+        {"function": "astar", "expansions": 13, "pushes": 16, "pops": 14, "peak_frontier": 4, "revisits": 1},
+    ]
+    assert_restored()
+
+
+def test_enabled_restores_originals():
+    recorder = Recorder()
+    with recorder.enabled():
+        assert algorithms.dijkstra(GRAPH, 'A')['D'] == 4  # first lookup inside the block
+        Djstrika.dijkstra(GRAPH, 'A')
+    assert len(recorder.calls) == 2
+    assert_restored()
+    algorithms.dijkstra(GRAPH, 'A')
+    assert len(recorder.calls) == 2
+
+
+def test_enabled_restores_after_error():
+    recorder = Recorder()
+    with pytest.raises(KeyError):
+        with recorder.enabled():
+            Djstrika.dijkstra(GRAPH, 'Z')  # unknown start node
+    assert_restored()
+    with pytest.raises(KeyError):
+        recorder.call(Djstrika.dijkstra, GRAPH, 'Z')
+    assert_restored()
+
+
+def test_call_inside_enabled():
+    recorder = Recorder()
+    with recorder.enabled():
+        assert recorder.call(Djstrika.dijkstra, GRAPH, 'A')['D'] == 4
+    assert counters(recorder)[0]["expansions"] == 4
+    assert_restored()
+
+
+def test_nested_recorders():
+    outer, inner = Recorder(), Recorder()
+    with outer.enabled():
+        assert inner.call(Djstrika.dijkstra, GRAPH, 'A')['D'] == 4
+        Djstrika.dijkstra(GRAPH, 'A')
+    assert counters(inner)[0]["pops"] == 6
+    assert len(outer.calls) == 1 and outer.calls[0].pops == 6
+    assert_restored()
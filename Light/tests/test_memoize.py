@@ -0,0 +1,24 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.Memoize import DiskStore, memoize  # noqa: E402
+
+
+def test_cache_clear_empties_disk_store(tmp_path):
+    store = DiskStore(str(tmp_path / "cache"))
+    calls = []
+
+    @memoize(maxsize=4, store=store)
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    assert square(3) == 9 and square(3) == 9
+    assert calls == [3]
+    square.cache_clear()
+    assert store.get((3,)) is None
+    assert square(3) == 9
+    assert calls == [3, 3]  # recomputed, not read back from disk
+    store.close()
@@ -0,0 +1,35 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.QueryServer import QueryServer  # noqa: E402
+
+DATASETS = {"sorted": [1, 3, 5, 7, 9]}
+
+
+def test_query_result():
+    async def scenario():
+        async with QueryServer(DATASETS, workers=1) as server:
+            return await server.binary_search("sorted", 7, timeout=30)
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_close_while_batch_is_collecting():
+    async def scenario():
+        server = await QueryServer(DATASETS, workers=1, window=1.0).start()
+        pending = asyncio.create_task(server.binary_search("sorted", 7))
+        await asyncio.sleep(0.05)  # the batcher holds the query, waiting for more
+        await server.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, 0.5)
+        with pytest.raises(RuntimeError, match="server closed"):
+            await server.binary_search("sorted", 7)
+        with pytest.raises(RuntimeError, match="server closed"):
+            await server.query_nowait("binary_search", "sorted", 7)
+
+    asyncio.run(scenario())